@@ -1,4 +1,4 @@
-# Copyright 2023-2025 The MathWorks, Inc.
+# Copyright 2023-2026 The MathWorks, Inc.
 
 """
 This module serves as the base class for various MATLAB Kernels.
@@ -8,6 +8,8 @@ backend MATLAB proxy servers.
 2. MATLAB Kernels that uses proxy manager to start backend matlab proxy servers
 """
 
+import asyncio
+import functools
 import os
 import sys
 import time
@@ -21,18 +23,49 @@ import psutil
 from matlab_proxy import settings as mwi_settings
 from matlab_proxy import util as mwi_util
 
+from jupyter_matlab_kernel import kernel_settings, mwi_logger
 from jupyter_matlab_kernel.magic_execution_engine import (
     MagicExecutionEngine,
     get_completion_result_for_magics,
 )
+from jupyter_matlab_kernel.matlab_parser import MATLABBlockParser
 from jupyter_matlab_kernel.mwi_comm_helpers import MWICommHelper
 from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
+from jupyter_matlab_kernel.mwi_logger import Truncated
 
 from jupyter_matlab_kernel.comms import LabExtensionCommunication
 
 
 _MATLAB_STARTUP_TIMEOUT = mwi_settings.get_process_startup_timeout()
 
+# Bounds (in seconds) for the interval between two status requests to matlab-proxy
+# while waiting for MATLAB to start.
+_STARTUP_POLL_MIN_INTERVAL = 0.1
+_STARTUP_POLL_MAX_INTERVAL = 1.0
+
+
+def _get_startup_poll_interval(attempt, elapsed_time, expected_startup_time=None):
+    """
+    Computes the time to wait before the next status request to matlab-proxy while
+    waiting for MATLAB to start.
+
+    The interval starts small so that an already starting MATLAB is detected quickly,
+    and backs off exponentially. When the startup time is known from an earlier start
+    of MATLAB, polling becomes faster again as the expected ready time approaches.
+
+    Args:
+        attempt (int): Number of status requests sent so far.
+        elapsed_time (float): Seconds spent waiting for MATLAB so far.
+        expected_startup_time (float, optional): Seconds MATLAB took to start previously.
+
+    Returns:
+        float: Seconds to wait before the next status request.
+    """
+    interval = _STARTUP_POLL_MIN_INTERVAL * (1.5**attempt)
+    if expected_startup_time is not None:
+        interval = min(interval, abs(expected_startup_time - elapsed_time) / 4)
+    return min(max(interval, _STARTUP_POLL_MIN_INTERVAL), _STARTUP_POLL_MAX_INTERVAL)
+
 
 def _fetch_jupyter_base_url(parent_pid: str, logger: Logger) -> str:
     """
@@ -159,6 +192,30 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
         # Keeps track of the MATLAB licensing mode information for the MATLAB assigned to this Kernel
         self.licensing_mode = None
 
+        # Time in seconds taken by the MATLAB assigned to this Kernel to start, measured
+        # from the moment licensing information was available. None if MATLAB was
+        # already running when the Kernel connected to it.
+        self.matlab_startup_time = None
+
+        # Incremented after every execution. Completion results cached in an earlier
+        # generation are stale, as the execution may have changed the workspace.
+        self.workspace_generation = 0
+
+        # Format, resolution and maximum size of figures, set by the figure magic
+        self.figure_settings = {}
+
+        # Code and cursor position of the last completion request whose results
+        # were capped. Repeating the request returns all the results.
+        self._capped_completion_request = None
+
+        # Updates of the function index and of the help cache, once the MATLAB
+        # assigned to this Kernel is known.
+        self._function_index_update = None
+        self._help_cache_warm_up = None
+
+        # Parser of the block structure of the code of cells, reused across requests
+        self.block_parser = MATLABBlockParser()
+
         self.labext_comm = LabExtensionCommunication(self)
 
         # Custom handling of comm messages for jupyterlab extension communication.
@@ -171,6 +228,57 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
         self.shell_handlers["comm_msg"] = self.labext_comm.comm_msg
         self.shell_handlers["comm_close"] = self.labext_comm.comm_close
 
+    # The state used for completions and outputs is created on first use, so that
+    # the modules which implement it are not imported before the kernel replies to
+    # kernel_info requests.
+
+    @functools.cached_property
+    def completion_cache(self):
+        """Completion results received from MATLAB, reused while the user keeps typing"""
+        from jupyter_matlab_kernel.completions import CompletionCache
+
+        return CompletionCache()
+
+    @functools.cached_property
+    def workspace_index(self):
+        """Variables in the MATLAB workspace, reported by MATLAB after each execution"""
+        from jupyter_matlab_kernel.completions import WorkspaceIndex
+
+        return WorkspaceIndex()
+
+    @functools.cached_property
+    def recent_names(self):
+        """Names used in executed code, used to rank completion results"""
+        from jupyter_matlab_kernel.completions import RecentNames
+
+        return RecentNames()
+
+    @functools.cached_property
+    def function_index(self):
+        """
+        Names of the functions of the MATLAB installation, persisted across sessions.
+        The most recent index is used until the MATLAB of this Kernel is known.
+        """
+        from jupyter_matlab_kernel.completions import FunctionIndex
+
+        return FunctionIndex(kernel_settings.get_cache_directory(), self.log)
+
+    @functools.cached_property
+    def help_cache(self):
+        """Help text of the functions of the MATLAB installation, shown on Shift+Tab"""
+        from jupyter_matlab_kernel.completions import HelpCache
+
+        return HelpCache(
+            kernel_settings.get_cache_directory() / "help", logger=self.log
+        )
+
+    @functools.cached_property
+    def image_optimizer(self):
+        """Optimizes the images of figures in worker processes"""
+        from jupyter_matlab_kernel.outputs import ImageOptimizer
+
+        return ImageOptimizer(logger=self.log)
+
     # ipykernel Interface API
     # https://ipython.readthedocs.io/en/stable/development/wrapperkernels.html
 
@@ -215,7 +323,9 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
         Used by ipykernel infrastructure for execution. For more info, look at
         https://jupyter-client.readthedocs.io/en/stable/messaging.html#execute
         """
-        self.log.debug(f"Received execution request from Jupyter with code:\n{code}")
+        self.log.debug(
+            "Received execution request from Jupyter with code:\n%s", Truncated(code)
+        )
 
         try:
             performed_startup_checks = False
@@ -254,29 +364,49 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
                     for output in accumulated_magic_outputs:
                         self.display_output(output)
 
-                # Perform execution and categorization of outputs in MATLAB. Blocks
-                # until execution results are received from MATLAB.
-                outputs = await self.mwi_comm_helper.send_execution_request_to_matlab(
-                    code
-                )
-
-                if performed_startup_checks and not accumulated_magic_outputs:
-                    self.display_output(
-                        {"type": "clear_output", "content": {"wait": False}}
+                output_budget = self._create_output_budget()
+                # Sizes of the figures of the cell before and after optimization
+                figure_sizes = []
+                if kernel_settings.is_output_streaming_enabled():
+                    # Perform execution of the code section by section and display
+                    # the outputs of each section as soon as they are received.
+                    section_outputs = (
+                        self.mwi_comm_helper.stream_execution_request_to_matlab(
+                            code, self._get_execution_options()
+                        )
                     )
+                    async for outputs in section_outputs:
+                        if performed_startup_checks and not accumulated_magic_outputs:
+                            self.display_output(
+                                {"type": "clear_output", "content": {"wait": False}}
+                            )
+                            # The lingering "Executing ..." message is cleared only once
+                            # so that outputs of previous sections are retained.
+                            performed_startup_checks = False
+                        figure_sizes.append(await self._optimize_figures(outputs))
+                        self._display_execution_outputs(outputs, output_budget)
+                else:
+                    # Perform execution and categorization of outputs in MATLAB. Blocks
+                    # until execution results are received from MATLAB.
+                    outputs = await self._send_execution_request(code)
+                    figure_sizes.append(await self._optimize_figures(outputs))
+
+                    if performed_startup_checks and not accumulated_magic_outputs:
+                        self.display_output(
+                            {"type": "clear_output", "content": {"wait": False}}
+                        )
 
-                self.log.debug(
-                    "Received outputs after execution in MATLAB. Clearing output area"
-                )
+                    self.log.debug(
+                        "Received outputs after execution in MATLAB. Clearing output area"
+                    )
+                    self._display_execution_outputs(outputs, output_budget)
 
-                # Display all the outputs produced during the execution of code.
-                for idx, data in enumerate(outputs):
-                    self.log.debug(f"Displaying output {idx + 1}:\n{data}")
+                self._log_figure_optimization(figure_sizes)
 
-                    # Ignore empty values returned from MATLAB.
-                    if not data:
-                        continue
-                    self.display_output(data)
+                # Tell the user where the outputs which were not displayed are.
+                notice = output_budget.get_notice() if output_budget else None
+                if notice:
+                    self.display_output(notice)
 
             # Execute post execution of MAGICs
             for output in self.magic_engine.process_after_cell_execution():
@@ -299,6 +429,11 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
                 # checks for subsequent execution requests
                 self.startup_checks_completed = False
 
+                # MATLAB may be restarted before the next request, which would
+                # remove the kernel's MATLAB code from its path.
+                if self.mwi_comm_helper:
+                    self.mwi_comm_helper.reset_kernel_path_registration()
+
             # Clearing lingering message "Executing..." before displaying the error message
             if performed_startup_checks and not accumulated_magic_outputs:
                 self.display_output(
@@ -314,6 +449,9 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
                     },
                 }
             )
+
+        self.workspace_generation += 1
+        self.recent_names.add(code)
         return {
             "status": "ok",
             "execution_count": self.execution_count,
@@ -330,8 +468,11 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
               user. For example, if matlab-proxy is not licensed, we cannot show
               the licensing window.
         """
-        self.log.debug(
-            f"Received completion request from Jupyter with cursor position {cursor_pos} and code:\n{code}"
+        mwi_logger.debug_sampled(
+            self.log,
+            "Received completion request from Jupyter with cursor position %s and code:\n%s",
+            cursor_pos,
+            Truncated(code),
         )
         # Default completion results. It is modelled after ipkernel.py#do_complete
         # implementation to provide metadata for JupyterLab.
@@ -342,36 +483,95 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
             "completions": [],
         }
 
-        # Fetch tab completion results. Blocks untils either tab completion
-        # results are received from MATLAB or communication with MATLAB fails.
+        # Fetch tab completion results. Blocks until either tab completion results
+        # are received from MATLAB, the request times out or communication with
+        # MATLAB fails.
 
         magic_completion_results = get_completion_result_for_magics(
             code, cursor_pos, self.log
         )
 
-        self.log.debug(
-            f"Received Completion results from MAGIC:\n{magic_completion_results}"
+        mwi_logger.debug_sampled(
+            self.log,
+            "Received Completion results from MAGIC:\n%s",
+            Truncated(magic_completion_results),
         )
 
+        # Fields and properties of variables are completed without MATLAB.
+        workspace_completion_results = None
+        if not magic_completion_results:
+            workspace_completion_results = self.workspace_index.complete_field(
+                code, cursor_pos
+            )
+
+        local_completion_results = None
+        if not magic_completion_results and workspace_completion_results is None:
+            local_completion_results = self._complete_function_name_locally(
+                code, cursor_pos
+            )
+
         if magic_completion_results:
             completion_results = magic_completion_results
+        elif workspace_completion_results is not None:
+            completion_results = workspace_completion_results
+        elif local_completion_results is not None:
+            completion_results = local_completion_results
+        elif self.mwi_comm_helper is None:
+            # matlab-proxy is not yet available, for example while it is being started.
+            self.log.debug("Skipping completion request as MATLAB is not available")
+            completion_results = (
+                self._complete_locally(code, cursor_pos) or completion_results
+            )
         else:
-            try:
-                completion_results = (
-                    await self.mwi_comm_helper.send_completion_request_to_matlab(
+            cached_completion_results = self.completion_cache.get(
+                code, cursor_pos, self.workspace_generation
+            )
+            mwi_logger.debug_sampled(
+                self.log,
+                "Completion cache statistics: %s",
+                self.completion_cache.get_stats(),
+            )
+
+            if cached_completion_results is not None:
+                completion_results = cached_completion_results
+            else:
+                try:
+                    matlab_completion_results = await self._send_completion_request(
                         code, cursor_pos
                     )
-                )
-            except (
-                MATLABConnectionError,
-                aiohttp.client_exceptions.ClientResponseError,
-            ) as e:
-                self.log.error(
-                    f"Exception occurred while sending completion request to MATLAB:\n{e}"
-                )
+                    if matlab_completion_results is not None:
+                        completion_results = matlab_completion_results
+                        self.completion_cache.put(
+                            code,
+                            cursor_pos,
+                            self.workspace_generation,
+                            completion_results,
+                        )
+                    else:
+                        # Fall back to earlier results for the same word or to the
+                        # names known to the kernel.
+                        completion_results = (
+                            self.completion_cache.get_stale(code, cursor_pos)
+                            or self._complete_locally(code, cursor_pos)
+                            or completion_results
+                        )
+                except (
+                    MATLABConnectionError,
+                    aiohttp.client_exceptions.ClientResponseError,
+                ) as e:
+                    self.log.error(
+                        f"Exception occurred while sending completion request to MATLAB:\n{e}"
+                    )
 
-            self.log.debug(
-                f"Received completion results from MATLAB:\n{completion_results}"
+            mwi_logger.debug_sampled(
+                self.log,
+                "Completion results:\n%s",
+                Truncated(completion_results),
+            )
+
+        if not magic_completion_results:
+            completion_results = self._rank_completion_results(
+                completion_results, code, cursor_pos
             )
 
         return {
@@ -384,13 +584,242 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
             },
         }
 
+    def _rank_completion_results(self, completion_results, code, cursor_pos):
+        """
+        Ranks completion results and caps their number, so that the size of the
+        reply and the rendering time of the frontend stay bounded. All the results
+        are returned when the request for capped results is repeated.
+
+        Args:
+            completion_results (dict): Completion results in the format returned
+                by MATLAB.
+            code (str): Code on which Tab completion is requested.
+            cursor_pos (int): Position of the cursor when Tab completion is requested.
+
+        Returns:
+            dict: The ranked completion results.
+        """
+        limit = kernel_settings.get_max_completions()
+        if self._capped_completion_request == (code, cursor_pos):
+            self.log.debug("Returning all completion results for a repeated request")
+            limit = None
+
+        from jupyter_matlab_kernel.completions import rank_completion_results
+
+        ranked_results = rank_completion_results(
+            completion_results,
+            code,
+            self.workspace_index,
+            self.recent_names,
+            limit,
+        )
+        is_capped = len(ranked_results["matches"]) < ranked_results["total"]
+        self._capped_completion_request = (code, cursor_pos) if is_capped else None
+        return ranked_results
+
+    async def _send_completion_request(self, code, cursor_pos):
+        """
+        Sends a completion request to MATLAB and waits for its results until the
+        completion timeout elapses, for example while MATLAB is executing a cell.
+
+        Args:
+            code (str): Code on which Tab completion is requested.
+            cursor_pos (int): Position of the cursor when Tab completion is requested.
+
+        Returns:
+            dict: Completion results received from MATLAB. None if the request
+                timed out.
+        """
+        try:
+            return await asyncio.wait_for(
+                self.mwi_comm_helper.send_completion_request_to_matlab(
+                    code, cursor_pos
+                ),
+                kernel_settings.get_completion_timeout(),
+            )
+        except asyncio.TimeoutError:
+            self.log.debug("Completion request to MATLAB timed out")
+            return None
+
+    def _complete_locally(self, code, cursor_pos):
+        """
+        Completes the names of variables and functions without a request to MATLAB.
+        Functions which are not part of the MATLAB installation, for example in the
+        current folder, are not included.
+
+        Returns:
+            dict: Completion results. None if the code before the cursor is not a name.
+        """
+        from jupyter_matlab_kernel.completions import merge_completion_results
+
+        return merge_completion_results(
+            self.workspace_index.complete_variable(code, cursor_pos),
+            self.function_index.complete(code, cursor_pos),
+        )
+
+    def _complete_function_name_locally(self, code, cursor_pos):
+        """
+        Completes the name of a function or variable without a request to MATLAB,
+        once the kernel knows the functions of the MATLAB assigned to this Kernel and
+        the variables in its workspace. Names which are known only to MATLAB, such
+        as the functions in the current folder, are completed by MATLAB when the
+        kernel finds no match.
+
+        Returns:
+            dict: Completion results. None if MATLAB needs to complete the code.
+        """
+        from jupyter_matlab_kernel.completions import get_function_name_before_cursor
+
+        if (
+            not kernel_settings.is_workspace_completion_enabled()
+            or not self.workspace_index.is_synchronized
+            or not self._is_function_index_updated()
+            or get_function_name_before_cursor(code, cursor_pos) is None
+        ):
+            return None
+
+        completion_results = self._complete_locally(code, cursor_pos)
+        if not completion_results or not completion_results["matches"]:
+            return None
+        self.log.debug("Completed function name without a request to MATLAB")
+        return completion_results
+
+    def _is_function_index_updated(self):
+        """
+        Checks if the function index of the MATLAB assigned to this Kernel is loaded.
+        """
+        update = self._function_index_update
+        return (
+            update is not None
+            and update.done()
+            and not update.cancelled()
+            and update.exception() is None
+            and update.result()
+        )
+
+    def _update_function_index(self):
+        """
+        Updates the index of function names for the MATLAB assigned to this Kernel
+        in a background thread, as scanning the MATLAB installation takes time.
+        """
+        if not self.matlab_root_path or not self.matlab_version:
+            return
+        self._function_index_update = asyncio.get_running_loop().run_in_executor(
+            None, self.function_index.update, self.matlab_root_path, self.matlab_version
+        )
+        self._help_cache_warm_up = asyncio.create_task(self._warm_up_help_cache())
+
     async def do_is_complete(self, code):
-        # TODO: Seems like indentation rules. https://jupyter-client.readthedocs.io/en/stable/messaging.html#code-completeness
-        return super().do_is_complete(code)
+        """
+        Used by ipykernel infrastructure to check if code is ready to be executed,
+        for example by terminal clients such as jupyter console. For more info, look
+        at https://jupyter-client.readthedocs.io/en/stable/messaging.html#code-completeness
+        """
+        state = self.block_parser.parse(code)
+        if state.unmatched_end is not None:
+            return {"status": "invalid"}
+        if state.is_incomplete():
+            return {"status": "incomplete", "indent": "    " * len(state.blocks)}
+        return {"status": "complete"}
 
     async def do_inspect(self, code, cursor_pos, detail_level=0, omit_sections=...):
-        # TODO: Implement Shift+Tab functionality. Can be used to provide any contextual information.
-        return super().do_inspect(code, cursor_pos, detail_level, omit_sections)
+        """
+        Used by ipykernel infrastructure for Shift+Tab. Shows the MATLAB help text
+        of the function or class at the cursor. For more info, look at
+        https://jupyter-client.readthedocs.io/en/stable/messaging.html#introspection
+        """
+        from jupyter_matlab_kernel.completions import get_name_at_cursor
+
+        name = get_name_at_cursor(code, cursor_pos)
+        self.log.debug("Received inspect request for %s", name)
+
+        help_text = ""
+        if name and self.mwi_comm_helper is not None:
+            try:
+                help_texts = await asyncio.wait_for(
+                    self._get_help_texts([name]),
+                    kernel_settings.get_completion_timeout(),
+                )
+                help_text = help_texts.get(name, "")
+            except (
+                asyncio.TimeoutError,
+                MATLABConnectionError,
+                aiohttp.client_exceptions.ClientError,
+            ) as e:
+                self.log.error(f"Unable to fetch help text of {name} from MATLAB: {e}")
+
+        return {
+            "status": "ok",
+            "found": bool(help_text.strip()),
+            "data": {"text/plain": help_text} if help_text.strip() else {},
+            "metadata": {},
+        }
+
+    async def _get_help_texts(self, names):
+        """
+        Gets the help text of functions and classes. Help texts of the functions of
+        the MATLAB installation are cached, the remaining help texts are requested
+        from MATLAB in a single request.
+
+        Args:
+            names (List[str]): Names of the functions or classes.
+
+        Returns:
+            dict: Help text of each name.
+        """
+        help_texts = {}
+        missing_names = []
+        for name in names:
+            help_text = None
+            if self._is_help_cacheable(name):
+                help_text = self.help_cache.get(self.matlab_version, name)
+            if help_text is None:
+                missing_names.append(name)
+            else:
+                help_texts[name] = help_text
+
+        if missing_names:
+            received_help_texts = (
+                await self.mwi_comm_helper.send_inspect_request_to_matlab(missing_names)
+            )
+            for name, help_text in zip(missing_names, received_help_texts):
+                help_texts[name] = help_text
+                # Help of user functions may change, it is never cached.
+                if self._is_help_cacheable(name):
+                    self.help_cache.put(self.matlab_version, name, help_text)
+        return help_texts
+
+    def _is_help_cacheable(self, name):
+        """
+        Checks if the help text of a function does not change for a MATLAB version,
+        which holds for the functions of the MATLAB installation.
+        """
+        return bool(self.matlab_version) and self.function_index.contains(name)
+
+    async def _warm_up_help_cache(self):
+        """
+        Fetches the help text of commonly used functions which are not cached yet,
+        once the function index of the MATLAB assigned to this Kernel is available.
+        """
+        from jupyter_matlab_kernel.completions import COMMON_FUNCTION_NAMES
+
+        try:
+            if self._function_index_update is not None:
+                await self._function_index_update
+            names = [
+                name for name in COMMON_FUNCTION_NAMES if self._is_help_cacheable(name)
+            ]
+            if names:
+                await self._get_help_texts(names)
+        except Exception as e:
+            self.log.debug("Unable to warm up the help cache: %s", e)
+
+    def do_shutdown(self, restart):
+        # The worker processes which optimize images are not needed anymore. The
+        # image optimizer is not created if no figure was displayed.
+        if "image_optimizer" in self.__dict__:
+            self.image_optimizer.shutdown()
+        return super().do_shutdown(restart)
 
     async def do_history(
         self,
@@ -418,6 +847,7 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
             "matlab_version": self.matlab_version,
             "matlab_root_path": self.matlab_root_path,
             "licensing_mode": self.licensing_mode,
+            "matlab_startup_time": self.matlab_startup_time,
         }
 
     def _modify_kernel(self, states_to_modify):
@@ -502,6 +932,33 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
         """
         raise NotImplementedError("Subclasses should implement this method")
 
+    async def _send_execution_request(self, code):
+        """
+        Sends code to MATLAB for execution and returns its outputs.
+
+        Args:
+            code (str): The code to be executed.
+
+        Returns:
+            list: The outputs received from MATLAB.
+        """
+        return await self.mwi_comm_helper.send_execution_request_to_matlab(
+            code, self._get_execution_options()
+        )
+
+    def _get_execution_options(self):
+        """
+        Gets the options of execution requests which depend on the state of the kernel.
+
+        Returns:
+            dict: Options passed to jupyter.execute. None if there are no options.
+        """
+        if not self.figure_settings:
+            return None
+        # MATLAB reports the resolution at which figures were rendered, with which
+        # the kernel converts them to the resolution set by the figure magic.
+        return {"figureSettings": dict(self.figure_settings)}
+
     async def _perform_before_cell_execution(self, code) -> list:
         """
         Perform actions before cell execution and handle magic outputs.
@@ -562,6 +1019,112 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
             response = out["content"]
         self.send_response(self.iopub_socket, msg_type, response)
 
+    def _create_output_budget(self):
+        """
+        Creates the budget for the size of the outputs displayed for the cell which
+        is executed. Outputs beyond the budget are written to a file named after the
+        execution count of the cell and the time of the execution, in a directory of
+        the kernel inside the cache directory. The files are kept after the kernel
+        shuts down, as saved notebooks show their paths.
+
+        Returns:
+            OutputBudget: The budget. None if the size of outputs is not limited.
+        """
+        max_size = kernel_settings.get_max_cell_output_size()
+        if max_size is None:
+            return None
+
+        from jupyter_matlab_kernel.outputs import OutputBudget
+
+        # Cells are numbered again after a restart of the kernel, so the time
+        # distinguishes the files of cells with the same execution count.
+        file_name = f"cell{self.execution_count}-{time.strftime('%Y%m%d-%H%M%S')}.txt"
+        return OutputBudget(
+            max_size, self._get_output_spill_directory() / file_name, self.log
+        )
+
+    def _get_output_spill_directory(self):
+        """
+        Returns:
+            Path: The directory into which outputs beyond the budget of a cell are
+                written.
+        """
+        return kernel_settings.get_cache_directory() / "outputs" / self.kernel_id
+
+    async def _optimize_figures(self, outputs):
+        """
+        Converts the images of figures to the figure settings of the kernel, and
+        reduces their size with the preset selected in the kernel settings.
+
+        Args:
+            outputs (list): The outputs received from MATLAB. Modified in place.
+
+        Returns:
+            tuple: The size in bytes of the images before and after optimization.
+        """
+        preset = kernel_settings.get_image_optimization()
+        if preset is None and not self.figure_settings:
+            return 0, 0
+        return await self.image_optimizer.optimize_outputs(
+            outputs, preset, self.figure_settings
+        )
+
+    def _log_figure_optimization(self, figure_sizes):
+        """
+        Logs the number of bytes saved by optimizing the figures of a cell.
+
+        Args:
+            figure_sizes (list): Size of the figures before and after optimization,
+                for each response received from MATLAB.
+        """
+        size = sum(sizes[0] for sizes in figure_sizes)
+        optimized_size = sum(sizes[1] for sizes in figure_sizes)
+        if size:
+            self.log.info(
+                "Optimized figures of cell %s: saved %s of %s bytes (%.0f%%)",
+                self.execution_count,
+                size - optimized_size,
+                size,
+                100 * (size - optimized_size) / size,
+            )
+
+    def _display_execution_outputs(self, outputs, output_budget=None):
+        """
+        Displays the outputs produced by MATLAB during the execution of code.
+        Repeated warnings are displayed once and adjacent outputs of the same stream
+        are sent to Jupyter as a single message.
+
+        Args:
+            outputs (list): The outputs received from MATLAB.
+            output_budget (OutputBudget, optional): Budget for the size of the outputs
+                of the cell. Outputs beyond the budget are not displayed.
+        """
+        from jupyter_matlab_kernel.outputs import (
+            coalesce_stream_outputs,
+            collapse_repeated_messages,
+        )
+
+        if kernel_settings.is_collapse_repeated_messages_enabled():
+            outputs = collapse_repeated_messages(
+                outputs, kernel_settings.is_collapse_messages_ignoring_numbers_enabled()
+            )
+        outputs = coalesce_stream_outputs(outputs)
+        if output_budget is not None:
+            outputs = output_budget.apply(outputs)
+
+        for idx, data in enumerate(outputs):
+            mwi_logger.debug_sampled(
+                self.log, "Displaying output %d:\n%s", idx + 1, Truncated(data)
+            )
+
+            # Ignore empty values returned from MATLAB.
+            if not data:
+                continue
+            if data.get("type") == "workspace":
+                self.workspace_index.update(data["content"])
+                continue
+            self.display_output(data)
+
     async def perform_startup_checks(
         self, jupyter_base_url="", matlab_proxy_base_url=""
     ):
@@ -628,6 +1191,9 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
     async def poll_for_matlab_startup(self, matlab_proxy_status):
         """Wait until MATLAB has started or time has run out
 
+        The wait does not block the event loop, and the status of matlab-proxy is
+        polled with an adaptive interval (see _get_startup_poll_interval).
+
         Args:
         matlab_proxy_status: The status object from matlab-proxy
 
@@ -637,15 +1203,17 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
             within the expected timeframe.
         """
         self.log.debug("Waiting until MATLAB is started")
-        timeout = 0
+        licensed_at = None
+        elapsed_time = 0
+        attempt = 0
         while (
             matlab_proxy_status
             and matlab_proxy_status.matlab_status != "up"
-            and timeout != _MATLAB_STARTUP_TIMEOUT
+            and elapsed_time < _MATLAB_STARTUP_TIMEOUT
             and not matlab_proxy_status.matlab_proxy_has_error
         ):
             if matlab_proxy_status.is_matlab_licensed:
-                if timeout == 0:
+                if licensed_at is None:
                     self.log.debug("Licensing completed. Clearing output area")
                     self.display_output(
                         {"type": "clear_output", "content": {"wait": False}}
@@ -659,14 +1227,26 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
                             },
                         }
                     )
-                timeout += 1
-            time.sleep(1)
+                    licensed_at = time.monotonic()
+                    attempt = 0
+                elapsed_time = time.monotonic() - licensed_at
+
+            await asyncio.sleep(
+                _get_startup_poll_interval(
+                    attempt, elapsed_time, self.matlab_startup_time
+                )
+            )
+            attempt += 1
             matlab_proxy_status = await self.mwi_comm_helper.fetch_matlab_proxy_status()
 
-        # If MATLAB is not available after 15 seconds of licensing information
+        # If MATLAB is not available after the startup timeout of licensing information
         # being available either through user input or through matlab-proxy cache,
         # then display connection error to the user.
-        if timeout == _MATLAB_STARTUP_TIMEOUT:
+        if (
+            matlab_proxy_status
+            and matlab_proxy_status.matlab_status != "up"
+            and elapsed_time >= _MATLAB_STARTUP_TIMEOUT
+        ):
             self.log.error(
                 f"MATLAB has not started after {_MATLAB_STARTUP_TIMEOUT} seconds."
             )
@@ -676,10 +1256,15 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
             self.log.error("matlab-proxy encountered error.")
             raise MATLABConnectionError
 
+        if licensed_at is not None:
+            self.matlab_startup_time = time.monotonic() - licensed_at
+            self.log.debug(f"MATLAB started in {self.matlab_startup_time:.2f} seconds")
+
         # Update the kernel state with information from matlab proxy server
         self.licensing_mode = matlab_proxy_status.licensing_mode
         self.matlab_version = matlab_proxy_status.matlab_version
         self.matlab_root_path = await self.mwi_comm_helper.fetch_matlab_root_path()
+        self._update_function_index()
 
         self.log.debug("MATLAB is running, startup checks completed.")
 
@@ -0,0 +1,12 @@
+# Copyright 2026 The MathWorks, Inc.
+
+from .cache import CompletionCache
+from .functions import FunctionIndex
+from .help import COMMON_FUNCTION_NAMES, HelpCache
+from .ranking import RecentNames, rank_completion_results
+from .results import (
+    get_function_name_before_cursor,
+    get_name_at_cursor,
+    merge_completion_results,
+)
+from .workspace import WorkspaceIndex
@@ -0,0 +1,135 @@
+# Copyright 2026 The MathWorks, Inc.
+# Kernel-side cache of Tab completion results received from MATLAB
+
+import re
+
+# Characters which extend the word being completed without changing its context.
+_WORD_CONTINUATION_PATTERN = re.compile(r"\w*")
+
+
+class CompletionCache:
+    """
+    Remembers the most recent Tab completion results received from MATLAB so that
+    completion requests for a longer version of the same word can be answered by
+    filtering the earlier results locally, without a round trip to MATLAB.
+
+    Results are only reused within the same workspace generation. The kernel
+    increments the generation whenever code is executed, since execution can
+    change the variables, functions and files which MATLAB would suggest.
+    """
+
+    def __init__(self):
+        self._entry = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, code, cursor_pos, generation):
+        """
+        Gets completion results for a request by filtering the cached results.
+
+        Args:
+            code (str): Code on which Tab completion is requested.
+            cursor_pos (int): Position of the cursor when Tab completion is requested.
+            generation (int): Current workspace generation of the kernel.
+
+        Returns:
+            dict: Completion results in the format returned by MATLAB. None if the
+                cached results cannot be used for this request.
+        """
+        results = self._filter(code, cursor_pos, generation)
+        if results is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return results
+
+    def get_stale(self, code, cursor_pos):
+        """
+        Gets completion results for a request by filtering the cached results,
+        even if code was executed since they were cached. Used when MATLAB cannot
+        provide up-to-date results in time. Not counted in the usage statistics.
+
+        Args:
+            code (str): Code on which Tab completion is requested.
+            cursor_pos (int): Position of the cursor when Tab completion is requested.
+
+        Returns:
+            dict: Completion results in the format returned by MATLAB. None if the
+                cached results do not apply to this request.
+        """
+        return self._filter(code, cursor_pos)
+
+    def put(self, code, cursor_pos, generation, results):
+        """
+        Caches the completion results received from MATLAB for a request.
+
+        Args:
+            code (str): Code on which Tab completion was requested.
+            cursor_pos (int): Position of the cursor when Tab completion was requested.
+            generation (int): Workspace generation in which the request was made.
+            results (dict): Completion results received from MATLAB.
+        """
+        completions = results.get("completions") or []
+        # Without completions, the start of the word which MATLAB completed is unknown.
+        if not completions or any(
+            completion["end"] != cursor_pos for completion in completions
+        ):
+            self._entry = None
+            return
+
+        self._entry = {
+            "code_before_cursor": code[:cursor_pos],
+            "code_after_cursor": code[cursor_pos:],
+            "cursor_pos": cursor_pos,
+            "generation": generation,
+            "completions": completions,
+        }
+
+    def get_stats(self):
+        """
+        Gets the usage statistics of the cache.
+
+        Returns:
+            dict: The number of requests answered from the cache ("hits"), which is
+                also the number of round trips to MATLAB saved, the number of
+                requests which were sent to MATLAB ("misses") and the hit rate.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _filter(self, code, cursor_pos, generation=None):
+        entry = self._entry
+        if entry is None:
+            return None
+        if generation is not None and entry["generation"] != generation:
+            return None
+
+        cached_cursor_pos = entry["cursor_pos"]
+        if (
+            cursor_pos < cached_cursor_pos
+            or code[cursor_pos:] != entry["code_after_cursor"]
+            or code[:cached_cursor_pos] != entry["code_before_cursor"]
+        ):
+            return None
+
+        # Only characters which continue the completed word may have been typed.
+        typed_text = code[cached_cursor_pos:cursor_pos]
+        if not _WORD_CONTINUATION_PATTERN.fullmatch(typed_text):
+            return None
+
+        completions = []
+        for completion in entry["completions"]:
+            word = code[completion["start"] : cursor_pos].lower()
+            if completion["text"].lower().startswith(word):
+                completions.append(dict(completion, end=cursor_pos))
+
+        return {
+            "matches": [completion["text"] for completion in completions],
+            "completions": completions,
+            "start": completions[0]["start"] if completions else cursor_pos,
+            "end": cursor_pos,
+        }
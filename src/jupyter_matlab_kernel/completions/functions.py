@@ -0,0 +1,337 @@
+# Copyright 2026 The MathWorks, Inc.
+# Persistent index of the function and class names of a MATLAB installation
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from jupyter_matlab_kernel import mwi_logger
+
+from .results import create_completion_results, get_symbol_before_cursor
+
+_logger = mwi_logger.get()
+
+# File types of the files which define functions or classes, keyed by extension
+_FILE_TYPES = {
+    ".m": "mFile",
+    ".p": "pFile",
+    ".mexa64": "mex",
+    ".mexmaci64": "mex",
+    ".mexmaca64": "mex",
+    ".mexw64": "mex",
+}
+
+# Completion types of the indexed file types, consistent with +jupyter/complete.m
+_COMPLETION_TYPES = {"mFile": "function", "pFile": "function", "mex": "function"}
+
+# Directories whose functions are not callable by their name alone
+_SKIPPED_DIRECTORIES = {"private", "resources"}
+
+_NAME_PATTERN = re.compile(r"[A-Za-z]\w*")
+
+# Maximum number of names returned for a single completion request
+_MAX_COMPLETIONS = 1000
+
+
+class FunctionIndex:
+    """
+    Index of the names of the functions and classes in the toolbox folder of a
+    MATLAB installation, used to complete function names without a request to
+    MATLAB.
+
+    The index is stored in a cache directory as a file of sorted lines which is
+    memory-mapped and searched with a binary search, so that it is not read into
+    memory. Each MATLAB installation has its own index, along with the modification
+    times of the indexed folders, so that updating the index only scans folders
+    which changed.
+    """
+
+    def __init__(self, cache_directory, logger=_logger):
+        self._cache_directory = Path(cache_directory)
+        self._logger = logger
+        self._index = None
+        self._is_latest_loaded = False
+
+    @property
+    def is_loaded(self):
+        """bool: True if an index is available for completion, False otherwise."""
+        return self._index is not None
+
+    def load_latest(self):
+        """
+        Loads the index which was updated most recently, for example to complete
+        function names while MATLAB is still starting. Called by the first search
+        if no index was loaded before.
+
+        Returns:
+            bool: True if an index was loaded, False otherwise.
+        """
+        self._is_latest_loaded = True
+        try:
+            index_files = sorted(
+                self._cache_directory.glob("functions-*.idx"),
+                key=lambda index_file: index_file.stat().st_mtime,
+            )
+        except OSError:
+            return False
+        return bool(index_files) and self._load(index_files[-1])
+
+    def update(self, matlab_root, matlab_version):
+        """
+        Updates and loads the index of a MATLAB installation. The toolbox folder is
+        scanned only when no index exists for the installation or when folders
+        changed. This function blocks and must not be called on the event loop.
+
+        Args:
+            matlab_root (str): Root folder of the MATLAB installation.
+            matlab_version (str): Version of MATLAB, for example "R2025b".
+
+        Returns:
+            bool: True if the index was loaded, False otherwise.
+        """
+        index_file, state_file = self._get_index_files(matlab_root, matlab_version)
+        try:
+            previous_directories = json.loads(state_file.read_text())
+        except (OSError, ValueError):
+            previous_directories = {}
+
+        try:
+            directories = _scan_toolbox_folder(matlab_root, previous_directories)
+            if directories != previous_directories or not index_file.exists():
+                self._logger.debug("Writing index of MATLAB functions: %s", index_file)
+                self._cache_directory.mkdir(parents=True, exist_ok=True)
+                _write_atomically(index_file, _create_index(directories))
+                _write_atomically(state_file, json.dumps(directories).encode("utf-8"))
+            else:
+                # Mark the index as the most recently used one.
+                os.utime(index_file)
+        except OSError as e:
+            self._logger.error(f"Unable to update index of MATLAB functions: {e}")
+
+        return self._load(index_file)
+
+    def search(self, prefix, limit=_MAX_COMPLETIONS):
+        """
+        Finds the names in the index which begin with the prefix, ignoring case.
+
+        Args:
+            prefix (str): Beginning of the name.
+            limit (int, optional): Maximum number of names returned.
+
+        Returns:
+            List[Tuple[str, str]]: Names and file types, sorted by name.
+        """
+        if self._index is None and not self._is_latest_loaded:
+            self.load_latest()
+        index = self._index
+        if index is None:
+            return []
+
+        key = prefix.lower().encode("utf-8")
+        position = _find_first_line(index, key)
+        names = []
+        while position < len(index) and len(names) < limit:
+            line_end = index.find(b"\n", position)
+            if line_end == -1:
+                line_end = len(index)
+            line_key, name, file_type = index[position:line_end].split(b"\t")
+            if not line_key.startswith(key):
+                break
+            names.append((name.decode("utf-8"), file_type.decode("utf-8")))
+            position = line_end + 1
+        return names
+
+    def contains(self, name):
+        """
+        Checks if a function or class is part of the MATLAB installation.
+
+        Args:
+            name (str): Name of the function or class.
+
+        Returns:
+            bool: True if the name is in the index, False otherwise.
+        """
+        return any(indexed_name == name for indexed_name, _ in self.search(name, 10))
+
+    def complete(self, code, cursor_pos):
+        """
+        Completes the name of a function or class.
+
+        Args:
+            code (str): Code on which Tab completion is requested.
+            cursor_pos (int): Position of the cursor when Tab completion is requested.
+
+        Returns:
+            dict: Completion results in the format returned by MATLAB. None if no
+                index is loaded or the code before the cursor is not a name.
+        """
+        symbol = get_symbol_before_cursor(code, cursor_pos)
+        if symbol is None or symbol["field"] is not None:
+            return None
+
+        prefix = symbol["variable"]
+        names = self.search(prefix)
+        if not self.is_loaded:
+            return None
+        return create_completion_results(
+            [
+                (name, _COMPLETION_TYPES.get(file_type, "class"))
+                for name, file_type in names
+            ],
+            prefix,
+            cursor_pos - len(prefix),
+            cursor_pos,
+        )
+
+    def _get_index_files(self, matlab_root, matlab_version):
+        # Different installations of the same MATLAB version may contain
+        # different toolboxes.
+        root_hash = hashlib.sha256(str(matlab_root).encode("utf-8")).hexdigest()[:12]
+        version = re.sub(r"[^\w.-]", "_", str(matlab_version))
+        name = f"functions-{version}-{root_hash}"
+        return (
+            self._cache_directory / f"{name}.idx",
+            self._cache_directory / f"{name}.json",
+        )
+
+    def _load(self, index_file):
+        try:
+            with open(index_file, "rb") as f:
+                # The mapping remains valid after the file is closed or replaced.
+                self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            # Empty files cannot be mapped.
+            self._logger.debug("Unable to load index of MATLAB functions: %s", e)
+            return False
+        return True
+
+
+def _scan_toolbox_folder(matlab_root, previous_directories):
+    """
+    Finds the functions and classes in the toolbox folder of a MATLAB installation.
+    Folders whose modification time is unchanged are not scanned again, as adding,
+    removing or renaming a file changes the modification time of its folder.
+
+    Args:
+        matlab_root (str): Root folder of the MATLAB installation.
+        previous_directories (dict): Result of an earlier scan.
+
+    Returns:
+        dict: The modification time, the names and file types of the functions and
+            classes, and the subfolders of each folder, keyed by its path relative
+            to the toolbox folder.
+    """
+    toolbox_folder = os.path.join(matlab_root, "toolbox")
+    directories = {}
+    pending = [""]
+    while pending:
+        relative_path = pending.pop()
+        path = os.path.join(toolbox_folder, relative_path)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+
+        directory = previous_directories.get(relative_path)
+        if not directory or directory["mtime"] != mtime:
+            directory = _scan_folder(path, mtime)
+        directories[relative_path] = directory
+        pending.extend(
+            f"{relative_path}/{subfolder}" if relative_path else subfolder
+            for subfolder in directory["subfolders"]
+        )
+    return directories
+
+
+def _scan_folder(path, mtime):
+    """
+    Finds the functions and classes in a single folder.
+
+    Returns:
+        dict: The modification time, the names and file types of the functions and
+            classes, and the subfolders which are scanned for further functions.
+    """
+    entries = []
+    subfolders = []
+    try:
+        with os.scandir(path) as folder_entries:
+            for entry in folder_entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name.startswith("@") and _NAME_PATTERN.fullmatch(name[1:]):
+                        entries.append([name[1:], "class"])
+                    elif name not in _SKIPPED_DIRECTORIES and name[0] not in "+@.":
+                        subfolders.append(name)
+                    continue
+
+                stem, extension = os.path.splitext(name)
+                file_type = _FILE_TYPES.get(extension.lower())
+                if file_type and stem != "Contents" and _NAME_PATTERN.fullmatch(stem):
+                    entries.append([stem, file_type])
+    except OSError:
+        pass
+    return {
+        "mtime": mtime,
+        "entries": sorted(entries),
+        "subfolders": sorted(subfolders),
+    }
+
+
+def _create_index(directories):
+    """
+    Creates the content of an index file. Each line contains the lowercase name,
+    the name and the file type, separated by tabs. Lines are sorted by the
+    lowercase name, and only the first definition of a name is kept.
+
+    Returns:
+        bytes: Content of the index file.
+    """
+    file_types = {}
+    for relative_path in sorted(directories):
+        for name, file_type in directories[relative_path]["entries"]:
+            file_types.setdefault(name, file_type)
+
+    lines = sorted(
+        f"{name.lower()}\t{name}\t{file_type}\n"
+        for name, file_type in file_types.items()
+    )
+    return "".join(lines).encode("utf-8")
+
+
+def _find_first_line(index, key):
+    """
+    Finds the first line in the index whose lowercase name is not less than the key
+    with a binary search over the bytes of the index.
+
+    Returns:
+        int: Position of the beginning of the line. The length of the index if no
+            such line exists.
+    """
+    low, high = 0, len(index)
+    while low < high:
+        middle = (low + high) // 2
+        line_start = index.rfind(b"\n", 0, middle) + 1
+        line_end = index.find(b"\n", line_start)
+        if line_end == -1:
+            line_end = len(index)
+        if index[line_start:line_end].split(b"\t", 1)[0] < key:
+            low = line_end + 1
+        else:
+            high = line_start
+    return low
+
+
+def _write_atomically(path, data):
+    """Writes a file such that other processes never read a partially written file"""
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except OSError:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
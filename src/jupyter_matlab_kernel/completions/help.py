@@ -0,0 +1,152 @@
+# Copyright 2026 The MathWorks, Inc.
+# Cache of the help text of MATLAB functions shared by kernels and sessions
+
+import os
+import re
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+# Functions whose help text is fetched in the background when a MATLAB version is
+# used for the first time, as they are the most likely to be inspected.
+COMMON_FUNCTION_NAMES = [
+    "disp",
+    "plot",
+    "figure",
+    "zeros",
+    "ones",
+    "size",
+    "numel",
+    "length",
+    "sum",
+    "max",
+    "min",
+    "mean",
+    "linspace",
+    "fprintf",
+    "sprintf",
+    "find",
+    "reshape",
+    "cellfun",
+    "struct",
+    "table",
+]
+
+_NAME_PATTERN = re.compile(r"[A-Za-z]\w*(\.[A-Za-z]\w*)*")
+
+
+class HelpCache:
+    """
+    Two-level cache of the help text of MATLAB functions, keyed by the MATLAB
+    version and the function name. Recently used help texts are kept in memory,
+    and all help texts are stored in a cache directory so that other kernels and
+    later sessions do not need to request them from MATLAB.
+
+    Both levels are bounded. The least recently used entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        cache_directory,
+        max_memory_entries=256,
+        max_disk_size=16 * 1024 * 1024,
+        logger=_logger,
+    ):
+        self._cache_directory = Path(cache_directory)
+        self._max_memory_entries = max_memory_entries
+        self._max_disk_size = max_disk_size
+        self._logger = logger
+        self._memory = OrderedDict()
+
+    def get(self, matlab_version, name):
+        """
+        Gets the help text of a function.
+
+        Args:
+            matlab_version (str): Version of MATLAB, for example "R2025b".
+            name (str): Name of the function.
+
+        Returns:
+            str: The help text, which is empty if the function has no help. None if
+                the help text is not cached.
+        """
+        key = (matlab_version, name)
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        help_file = self._get_help_file(matlab_version, name)
+        if help_file is None:
+            return None
+        try:
+            text = help_file.read_text(encoding="utf-8")
+            # Mark the file as recently used for the eviction from disk.
+            os.utime(help_file)
+        except OSError:
+            return None
+
+        self._remember(key, text)
+        return text
+
+    def put(self, matlab_version, name, text):
+        """
+        Caches the help text of a function.
+
+        Args:
+            matlab_version (str): Version of MATLAB, for example "R2025b".
+            name (str): Name of the function.
+            text (str): Help text received from MATLAB.
+        """
+        self._remember((matlab_version, name), text)
+
+        help_file = self._get_help_file(matlab_version, name)
+        if help_file is None:
+            return
+        try:
+            help_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so that other kernels never read a
+            # partially written file.
+            fd, temp_path = tempfile.mkstemp(dir=help_file.parent, prefix=".help.")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(text)
+                os.replace(temp_path, help_file)
+            finally:
+                Path(temp_path).unlink(missing_ok=True)
+            self._evict_from_disk(help_file.parent)
+        except OSError as e:
+            self._logger.debug("Unable to store help text of %s: %s", name, e)
+
+    def _remember(self, key, text):
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _get_help_file(self, matlab_version, name):
+        if not _NAME_PATTERN.fullmatch(name):
+            return None
+        version = re.sub(r"[^\w.-]", "_", str(matlab_version))
+        return self._cache_directory / version / f"{name}.txt"
+
+    def _evict_from_disk(self, version_directory):
+        """Deletes the least recently used help files until the size limit is met"""
+        help_files = []
+        total_size = 0
+        for help_file in version_directory.glob("*.txt"):
+            try:
+                stat = help_file.stat()
+            except OSError:
+                continue
+            help_files.append((stat.st_mtime, stat.st_size, help_file))
+            total_size += stat.st_size
+
+        for _, size, help_file in sorted(help_files):
+            if total_size <= self._max_disk_size:
+                break
+            help_file.unlink(missing_ok=True)
+            total_size -= size
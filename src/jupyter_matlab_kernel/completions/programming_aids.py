@@ -0,0 +1,105 @@
+# Copyright 2026 The MathWorks, Inc.
+# Conversion of the raw completion data of MATLAB into Tab completion results
+
+import json
+
+# Completion types of the match types reported by MATLAB, consistent with the
+# getCompletionType helper of +jupyter/complete.m. This data is extracted from LSP.
+_COMPLETION_TYPES = {
+    **dict.fromkeys(
+        [
+            "unknown",
+            "mFile",
+            "pFile",
+            "mlxFile",
+            "mlappFile",
+            "mex",
+            "mdlFile",
+            "slxFile",
+            "slxpFile",
+            "sscFile",
+            "sscpFile",
+            "function",
+            "localFunction",
+        ],
+        "function",
+    ),
+    **dict.fromkeys(["literal", "username", "feature", "messageId"], "text"),
+    **dict.fromkeys(["pathItem", "filename"], "file"),
+    **dict.fromkeys(["keyword", "attribute"], "keyword"),
+    **dict.fromkeys(["class", "sfxFile"], "class"),
+    **dict.fromkeys(["logical", "cellString"], "value"),
+    "folder": "folder",
+    "fieldname": "field",
+    "package": "package",
+    "method": "method",
+    "enumeration": "enum",
+    "property": "property",
+    "variable": "variable",
+}
+
+# Live Editor tasks are not available in Jupyter
+_IGNORED_MATCH_TYPES = {"mlappFile"}
+
+
+def create_completion_results_from_programming_aids(completion_data, cursor_pos):
+    """
+    Creates Tab completion results from the completion data returned by MATLAB
+    when it is asked for the raw output of its programming aids. The completion
+    choices of the code and of the input arguments of each function signature
+    are combined, as in +jupyter/complete.m.
+
+    Args:
+        completion_data (str): JSON encoded completion data.
+        cursor_pos (int): Position of the cursor when Tab completion is requested.
+
+    Returns:
+        dict: Completion results in the format returned by +jupyter/complete.m.
+    """
+    completion_data = json.loads(completion_data) if completion_data else {}
+    if not isinstance(completion_data, dict):
+        completion_data = {}
+
+    completions = _get_completions(completion_data, cursor_pos)
+    for signature in _as_list(completion_data.get("signatures")):
+        for input_argument in _as_list(signature.get("inputArguments")):
+            completions.extend(_get_completions(input_argument, cursor_pos))
+
+    if completions:
+        start, end = completions[0]["start"], completions[0]["end"]
+    else:
+        start, end = cursor_pos, cursor_pos
+    return {
+        "matches": [completion["text"] for completion in completions],
+        "start": start,
+        "end": end,
+        "completions": completions,
+    }
+
+
+def _get_completions(completion_data, cursor_pos):
+    """Extracts the completions from the choices of a single completion widget"""
+    widget_data = completion_data.get("widgetData")
+    if not isinstance(widget_data, dict):
+        return []
+
+    start = cursor_pos - len(completion_data.get("value", ""))
+    completion_types = _COMPLETION_TYPES
+    return [
+        {
+            "text": choice["completion"],
+            "type": completion_types.get(choice.get("matchType"), "function"),
+            "start": start,
+            "end": cursor_pos,
+        }
+        for choice in _as_list(widget_data.get("choices"))
+        if "completion" in choice
+        and choice.get("matchType") not in _IGNORED_MATCH_TYPES
+    ]
+
+
+def _as_list(value):
+    """Returns a value which can be a single object or an array as a list"""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
@@ -0,0 +1,102 @@
+# Copyright 2026 The MathWorks, Inc.
+# Ranking and capping of Tab completion results inside the kernel process
+
+import re
+from collections import OrderedDict
+
+_NAME_PATTERN = re.compile(r"[A-Za-z]\w*")
+
+
+class RecentNames:
+    """
+    Remembers the names used in recently executed code, so that completions which
+    the user is likely to type again are ranked higher.
+    """
+
+    def __init__(self, max_names=1000):
+        self._max_names = max_names
+        self._names = OrderedDict()
+        self._counter = 0
+
+    def add(self, code):
+        """
+        Records the names used in executed code as the most recently used names.
+
+        Args:
+            code (str): Executed code.
+        """
+        for name in _NAME_PATTERN.findall(code):
+            self._counter += 1
+            self._names[name] = self._counter
+            self._names.move_to_end(name)
+        while len(self._names) > self._max_names:
+            self._names.popitem(last=False)
+
+    def get_recency(self, name):
+        """
+        Gets how recently a name was used.
+
+        Args:
+            name (str): The name.
+
+        Returns:
+            int: A number which is larger for more recently used names. 0 if the
+                name was not used recently.
+        """
+        return self._names.get(name, 0)
+
+
+def rank_completion_results(results, code, workspace_names, recent_names, limit):
+    """
+    Sorts completion results by relevance and keeps only the most relevant ones.
+    Completions are ranked by the following criteria, in order:
+    1. The completion begins with the typed prefix, including its case.
+    2. The completion is a variable in the workspace.
+    3. The completion was used in recently executed code.
+    4. The completion begins with the prefix ignoring case, contains the prefix
+       or neither.
+    Remaining ties are broken by the length and then the name of the completion.
+
+    Args:
+        results (dict): Completion results in the format returned by MATLAB.
+        code (str): Code on which Tab completion is requested.
+        workspace_names (Container[str]): Names of the variables in the workspace.
+        recent_names (RecentNames): Names used in recently executed code.
+        limit (int): Maximum number of completions returned. None for no limit.
+
+    Returns:
+        dict: The ranked completion results, with the total number of completions
+            before the limit was applied as "total".
+    """
+    prefix = code[results["start"] : results["end"]]
+    lowercase_prefix = prefix.lower()
+
+    def get_rank(completion):
+        text = completion["text"]
+        lowercase_text = text.lower()
+        if lowercase_text.startswith(lowercase_prefix):
+            fuzzy_rank = 0
+        elif lowercase_prefix in lowercase_text:
+            fuzzy_rank = 1
+        else:
+            fuzzy_rank = 2
+        return (
+            not text.startswith(prefix),
+            completion["type"] != "variable" and text not in workspace_names,
+            -recent_names.get_recency(text),
+            fuzzy_rank,
+            len(text),
+            text,
+        )
+
+    completions = sorted(results["completions"], key=get_rank)
+    total = len(completions)
+    if limit is not None:
+        completions = completions[:limit]
+    return {
+        "matches": [completion["text"] for completion in completions],
+        "start": results["start"],
+        "end": results["end"],
+        "completions": completions,
+        "total": total,
+    }
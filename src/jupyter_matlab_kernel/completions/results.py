@@ -0,0 +1,140 @@
+# Copyright 2026 The MathWorks, Inc.
+# Helper functions to create Tab completion results inside the kernel process
+
+import re
+
+# Matches a name, optionally followed by a '.' and the beginning of a field or
+# property name, at the end of the code before the cursor.
+_SYMBOL_BEFORE_CURSOR_PATTERN = re.compile(
+    r"(?<![\w.])(?P<variable>[A-Za-z]\w*)(?:\.(?P<field>\w*))?$"
+)
+
+# Matches a name at the beginning of a statement or of an operand, where MATLAB
+# expects the name of a function or variable. A name which follows another name
+# and a space, such as 'fo' in 'cd fo', is an argument in command syntax.
+_NAME_IN_EXPRESSION_PATTERN = re.compile(
+    r"(?:^|[=(,;\[{+\-*/\\^&|~<>:@])\s*(?P<name>[A-Za-z]\w*)$"
+)
+
+# Matches a possibly package-qualified name, such as 'matlab.net.base64encode'
+_QUALIFIED_NAME_PATTERN = re.compile(r"[A-Za-z]\w*(?:\.[A-Za-z]\w*)*")
+
+
+def get_symbol_before_cursor(code, cursor_pos):
+    """
+    Finds the name and the beginning of a field name directly before the cursor.
+    Names inside comments and strings are not completed by the kernel.
+
+    Args:
+        code (str): Code on which Tab completion is requested.
+        cursor_pos (int): Position of the cursor when Tab completion is requested.
+
+    Returns:
+        dict: The "variable" and "field" names. "field" is None if there is no '.'
+            after the name. None if there is no name before the cursor.
+    """
+    line = code[:cursor_pos].rsplit("\n", 1)[-1]
+    if any(char in line for char in "%'\""):
+        return None
+    match = _SYMBOL_BEFORE_CURSOR_PATTERN.search(line)
+    return match.groupdict() if match else None
+
+
+def get_function_name_before_cursor(code, cursor_pos):
+    """
+    Finds the beginning of the name of a function or variable directly before the
+    cursor, for example 'plo' in 'x = plo'.
+
+    Args:
+        code (str): Code on which Tab completion is requested.
+        cursor_pos (int): Position of the cursor when Tab completion is requested.
+
+    Returns:
+        str: The beginning of the name. None if the code before the cursor is not
+            the beginning of the name of a function or variable.
+    """
+    line = code[:cursor_pos].rsplit("\n", 1)[-1]
+    if any(char in line for char in "%'\""):
+        return None
+    match = _NAME_IN_EXPRESSION_PATTERN.search(line)
+    return match.group("name") if match else None
+
+
+def get_name_at_cursor(code, cursor_pos):
+    """
+    Finds the possibly package-qualified name which contains the cursor or ends
+    directly before it.
+
+    Args:
+        code (str): Code on which the name is requested.
+        cursor_pos (int): Position of the cursor.
+
+    Returns:
+        str: The name. None if there is no name at the cursor.
+    """
+    line_start = code.rfind("\n", 0, cursor_pos) + 1
+    line_end = code.find("\n", cursor_pos)
+    if line_end == -1:
+        line_end = len(code)
+
+    for match in _QUALIFIED_NAME_PATTERN.finditer(code, line_start, line_end):
+        if match.start() <= cursor_pos <= match.end():
+            return match.group()
+    return None
+
+
+def create_completion_results(candidates, prefix, start, end):
+    """
+    Creates completion results for the candidates which begin with the prefix.
+
+    Args:
+        candidates (Iterable[Tuple[str, str]]): Names and types of the candidates.
+        prefix (str): Text typed so far.
+        start (int): Position in the code at which the prefix begins.
+        end (int): Position of the cursor.
+
+    Returns:
+        dict: Completion results in the format returned by MATLAB.
+    """
+    lowercase_prefix = prefix.lower()
+    completions = [
+        {"text": name, "type": completion_type, "start": start, "end": end}
+        for name, completion_type in sorted(candidates)
+        if name.lower().startswith(lowercase_prefix)
+    ]
+    return {
+        "matches": [completion["text"] for completion in completions],
+        "start": start,
+        "end": end,
+        "completions": completions,
+    }
+
+
+def merge_completion_results(*results):
+    """
+    Merges completion results for the same word. Matches which appear in more
+    than one of the results are kept only once, in the first position.
+
+    Args:
+        results (dict): Completion results in the format returned by MATLAB. None
+            values are ignored.
+
+    Returns:
+        dict: The merged completion results. None if all results are None.
+    """
+    results = [result for result in results if result is not None]
+    if not results:
+        return None
+
+    merged = {
+        "matches": [],
+        "start": results[0]["start"],
+        "end": results[0]["end"],
+        "completions": [],
+    }
+    for result in results:
+        for completion in result["completions"]:
+            if completion["text"] not in merged["matches"]:
+                merged["matches"].append(completion["text"])
+                merged["completions"].append(completion)
+    return merged
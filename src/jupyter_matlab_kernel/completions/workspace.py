@@ -0,0 +1,121 @@
+# Copyright 2026 The MathWorks, Inc.
+# Kernel-side index of the variables in the MATLAB workspace used for Tab completion
+
+from .results import create_completion_results, get_symbol_before_cursor
+
+
+class WorkspaceIndex:
+    """
+    Keeps the names, classes, field names and methods of the variables in the
+    MATLAB workspace, so that the names of variables, fields, properties and
+    methods can be completed without a request to MATLAB.
+
+    The index is updated with the changes which MATLAB reports after each execution
+    as an output of type "workspace". As MATLAB computes the changes from the actual
+    workspace, variables created by other kernels sharing the MATLAB are included.
+    """
+
+    def __init__(self):
+        self._variables = {}
+        self._is_synchronized = False
+
+    @property
+    def is_synchronized(self):
+        """bool: True once MATLAB reported all the variables in the workspace."""
+        return self._is_synchronized
+
+    def __len__(self):
+        return len(self._variables)
+
+    def __contains__(self, name):
+        return name in self._variables
+
+    def update(self, changes):
+        """
+        Applies the changes to the workspace reported by MATLAB.
+
+        Args:
+            changes (dict): Content of a "workspace" output with the keys "full",
+                "updated" and "removed". When "full" is True, "updated" contains
+                all the variables in the workspace.
+        """
+        if changes.get("full"):
+            self._variables.clear()
+            self._is_synchronized = True
+
+        for name in changes.get("removed") or []:
+            self._variables.pop(name, None)
+
+        for variable in changes.get("updated") or []:
+            self._variables[variable["name"]] = {
+                "class": variable.get("class"),
+                "field_type": variable.get("fieldType") or None,
+                "fields": list(variable.get("fields") or []),
+                "methods": (
+                    list(variable.get("methods") or [])
+                    if "methods" in variable
+                    else None
+                ),
+            }
+
+    def complete_field(self, code, cursor_pos):
+        """
+        Completes the name of a field of a struct, or of a property or method of an
+        object in the workspace, for example 's.na' to 's.name'. Objects whose
+        methods were not reported, and objects without a matching property or
+        method, for example with dynamic properties, are left to MATLAB.
+
+        Args:
+            code (str): Code on which Tab completion is requested.
+            cursor_pos (int): Position of the cursor when Tab completion is requested.
+
+        Returns:
+            dict: Completion results in the format returned by MATLAB. None if the
+                code before the cursor is not a field or property of a known variable.
+        """
+        symbol = get_symbol_before_cursor(code, cursor_pos)
+        if symbol is None or symbol["field"] is None:
+            return None
+
+        variable = self._variables.get(symbol["variable"])
+        if not variable or not variable["field_type"]:
+            return None
+
+        candidates = [(field, variable["field_type"]) for field in variable["fields"]]
+        if variable["field_type"] == "property":
+            if variable["methods"] is None:
+                return None
+            candidates.extend((method, "method") for method in variable["methods"])
+
+        results = create_completion_results(
+            candidates,
+            symbol["field"],
+            cursor_pos - len(symbol["field"]),
+            cursor_pos,
+        )
+        if not results["matches"] and variable["field_type"] == "property":
+            return None
+        return results
+
+    def complete_variable(self, code, cursor_pos):
+        """
+        Completes the name of a variable in the workspace.
+
+        Args:
+            code (str): Code on which Tab completion is requested.
+            cursor_pos (int): Position of the cursor when Tab completion is requested.
+
+        Returns:
+            dict: Completion results in the format returned by MATLAB. None if the
+                code before the cursor is not the beginning of a name.
+        """
+        symbol = get_symbol_before_cursor(code, cursor_pos)
+        if symbol is None or symbol["field"] is not None:
+            return None
+
+        return create_completion_results(
+            [(name, "variable") for name in self._variables],
+            symbol["variable"],
+            cursor_pos - len(symbol["variable"]),
+            cursor_pos,
+        )
@@ -0,0 +1,79 @@
+# Copyright 2026 The MathWorks, Inc.
+# Helper functions to share the connection details of a matlab-proxy started by a
+# Jupyter server with the MATLAB Kernels of that Jupyter server.
+
+import json
+import os
+from pathlib import Path
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+
+def get_connection_file_path(jupyter_server_pid):
+    """
+    Gets the path of the file containing the connection details of the matlab-proxy
+    started by a Jupyter server.
+
+    Args:
+        jupyter_server_pid (int | str): Process ID of the Jupyter server.
+
+    Returns:
+        Path: Path of the connection file inside the Jupyter runtime directory.
+    """
+    from jupyter_core.paths import jupyter_runtime_dir
+
+    file_name = f"jupyter-matlab-proxy-{jupyter_server_pid}.json"
+    return Path(jupyter_runtime_dir()) / file_name
+
+
+def write_connection_file(jupyter_server_pid, url, headers, logger=_logger):
+    """
+    Writes the connection details of matlab-proxy into a file which is readable
+    only by the current user, as the headers contain authentication information.
+
+    Args:
+        jupyter_server_pid (int | str): Process ID of the Jupyter server.
+        url (str): URL at which matlab-proxy is directly reachable.
+        headers (dict): HTTP headers required to authenticate with matlab-proxy.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+
+    Returns:
+        Path: Path of the connection file. None if the file could not be written.
+    """
+    connection_file = get_connection_file_path(jupyter_server_pid)
+    try:
+        connection_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(connection_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"url": url, "headers": headers}, f)
+    except OSError as e:
+        logger.error(f"Unable to write matlab-proxy connection file: {e}")
+        return None
+
+    logger.debug(f"Wrote matlab-proxy connection file: {connection_file}")
+    return connection_file
+
+
+def read_connection_file(jupyter_server_pid, logger=_logger):
+    """
+    Reads the connection details of the matlab-proxy started by a Jupyter server.
+
+    Args:
+        jupyter_server_pid (int | str): Process ID of the Jupyter server.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+
+    Returns:
+        Tuple (string, dict):
+            url (string): URL at which matlab-proxy is directly reachable
+            headers (dict): HTTP headers required to authenticate with matlab-proxy
+        None if the connection file does not exist or is invalid.
+    """
+    connection_file = get_connection_file_path(jupyter_server_pid)
+    try:
+        connection_details = json.loads(connection_file.read_text())
+        return connection_details["url"], connection_details["headers"]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f"Unable to read matlab-proxy connection file: {e}")
+        return None
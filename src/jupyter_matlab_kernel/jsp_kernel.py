@@ -1,4 +1,4 @@
-# Copyright 2024-2025 The MathWorks, Inc.
+# Copyright 2024-2026 The MathWorks, Inc.
 
 """This module contains derived class implementation of MATLABKernel that uses
 Jupyter Server to manage interactions with matlab-proxy & MATLAB.
@@ -11,16 +11,25 @@ import os
 # Import Dependencies
 import aiohttp
 import aiohttp.client_exceptions
-import requests
 
 from jupyter_matlab_kernel import base_kernel as base
-from jupyter_matlab_kernel import mwi_logger, test_utils
+from jupyter_matlab_kernel import (
+    direct_connection,
+    kernel_settings,
+    mwi_logger,
+    test_utils,
+)
 from jupyter_matlab_kernel.mwi_comm_helpers import MWICommHelper
 from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
 
 _logger = mwi_logger.get()
 
 
+# This is content that is present in the matlab-proxy index.html page which
+# can be used to validate a proper response.
+_MATLAB_PROXY_INDEX_PAGE_IDENTIFIER = "MWI_MATLAB_PROXY_IDENTIFIER"
+
+
 def _start_matlab_proxy_using_jupyter(url, headers, logger=_logger):
     """
     Start matlab-proxy using jupyter server which started the current kernel
@@ -34,13 +43,12 @@ def _start_matlab_proxy_using_jupyter(url, headers, logger=_logger):
     Returns:
         bool: True if jupyter server has successfully started matlab-proxy else False.
     """
-    # This is content that is present in the matlab-proxy index.html page which
-    # can be used to validate a proper response.
-    matlab_proxy_index_page_identifier = "MWI_MATLAB_PROXY_IDENTIFIER"
-
     logger.debug(
         f"Sending request to jupyter to start matlab-proxy at {url} with headers: {headers}"
     )
+    # Imported on first use, the kernel uses the asynchronous variant of this function.
+    import requests
+
     # send request to the matlab-proxy endpoint to make sure it is available.
     # If matlab-proxy is not started, jupyter-server starts it at this point.
     resp = requests.get(url, headers=headers, verify=False)
@@ -48,31 +56,54 @@ def _start_matlab_proxy_using_jupyter(url, headers, logger=_logger):
 
     return (
         resp.status_code == http.HTTPStatus.OK
-        and matlab_proxy_index_page_identifier in resp.text
+        and _MATLAB_PROXY_INDEX_PAGE_IDENTIFIER in resp.text
     )
 
 
-def start_matlab_proxy(logger=_logger):
+async def _start_matlab_proxy_using_jupyter_async(
+    session, url, headers, logger=_logger
+):
     """
-    Start matlab-proxy registered with the jupyter server which started the
-    current kernel process.
+    Asynchronous variant of _start_matlab_proxy_using_jupyter.
 
-    Raises:
-        MATLABConnectionError: Occurs when kernel is not started by jupyter server.
+    Args:
+        session (aiohttp.ClientSession): Session used to send the HTTP request
+        url (string): URL to send HTTP request
+        headers (dict): HTTP headers required for the request
 
     Returns:
-        Tuple (string, string, dict):
-            url (string): Complete URL to send HTTP requests to matlab-proxy
-            base_url (string): Complete base url for matlab-proxy provided by jupyter server
-            headers (dict): HTTP headers required while sending HTTP requests to matlab-proxy
+        bool: True if jupyter server has successfully started matlab-proxy else False.
     """
+    logger.debug(
+        "Sending request to jupyter to start matlab-proxy at %s with headers: %s",
+        url,
+        headers,
+    )
+    try:
+        async with session.get(url, headers=headers) as resp:
+            logger.debug("Received status code: %s", resp.status)
+            text = await resp.text()
+    except aiohttp.ClientError as e:
+        logger.debug("Request to start matlab-proxy failed: %s", e)
+        return False
+
+    return (
+        resp.status == http.HTTPStatus.OK
+        and _MATLAB_PROXY_INDEX_PAGE_IDENTIFIER in text
+    )
 
-    # If jupyter testing is enabled, then a standalone matlab-proxy server would be
-    # launched by the tests and kernel would expect the configurations of this matlab-proxy
-    # server which is provided through environment variables to 'start_matlab_proxy_for_testing'
-    if test_utils.is_jupyter_testing_enabled():
-        return test_utils.start_matlab_proxy_for_testing(logger)
 
+def _find_jupyter_server(logger=_logger):
+    """
+    Finds the jupyter server which started the current kernel process.
+
+    Raises:
+        MATLABConnectionError: Occurs when kernel is not started by jupyter server
+            or when the jupyter server uses a password.
+
+    Returns:
+        dict: Information about the jupyter server as listed by the jupyter server.
+    """
     nb_server_list = []
 
     # The matlab-proxy server, if running, could have been started by either
@@ -125,33 +156,77 @@ def start_matlab_proxy(logger=_logger):
             """
         )
 
+    return nb_server
+
+
+def _get_matlab_proxy_url(nb_server):
+    """
+    Args:
+        nb_server (dict): Information about the jupyter server.
+
+    Returns:
+        string: URL of matlab-proxy behind the jupyter server.
+    """
     # Using nb_server["url"] to construct matlab-proxy URL as it handles the following cases
     # 1. For normal usage of Jupyter, the URL returned by nb_server uses localhost
     # 2. For explicitly specified IP with Jupyter, the URL returned by nb_server
     #       a. uses FQDN hostname when specified IP is 0.0.0.0
     #       b. uses specified IP for all other cases
-    matlab_proxy_url = "{jupyter_server_url}matlab".format(
-        jupyter_server_url=nb_server["url"]
-    )
+    return "{jupyter_server_url}matlab".format(jupyter_server_url=nb_server["url"])
 
+
+def _get_candidate_headers(nb_server):
+    """
+    Args:
+        nb_server (dict): Information about the jupyter server.
+
+    Returns:
+        list: HTTP headers to try for authenticating with the jupyter server,
+            in order of preference. None for requests without authentication.
+    """
     available_tokens = {
         "jupyter_server": nb_server.get("token"),
         "jupyterhub": os.getenv("JUPYTERHUB_API_TOKEN"),
         "default": None,
     }
+    return [
+        {"Authorization": f"token {token}"} if token else None
+        for token in available_tokens.values()
+    ]
 
-    for token in available_tokens.values():
-        if token:
-            headers = {"Authorization": f"token {token}"}
-        else:
-            headers = None
 
-        if _start_matlab_proxy_using_jupyter(matlab_proxy_url, headers, logger):
-            logger.debug(
-                f"Started matlab-proxy using jupyter at {matlab_proxy_url} with headers: {headers}"
-            )
-            return matlab_proxy_url, nb_server["base_url"], headers
+def _get_connection_details(matlab_proxy_url, nb_server, headers, logger=_logger):
+    """
+    Gets the details which the kernel uses to connect to matlab-proxy once it was
+    started through the jupyter server.
+
+    Args:
+        matlab_proxy_url (string): URL of matlab-proxy behind the jupyter server.
+        nb_server (dict): Information about the jupyter server.
+        headers (dict): HTTP headers which were accepted by the jupyter server.
 
+    Returns:
+        Tuple (string, string, dict): See start_matlab_proxy.
+    """
+    logger.debug(
+        f"Started matlab-proxy using jupyter at {matlab_proxy_url} with headers: {headers}"
+    )
+
+    # Send subsequent requests directly to matlab-proxy instead of routing
+    # them through the Jupyter server, if it shared its connection details.
+    if kernel_settings.is_direct_connection_enabled():
+        connection_details = direct_connection.read_connection_file(
+            nb_server["pid"], logger
+        )
+        if connection_details:
+            direct_url, direct_headers = connection_details
+            logger.debug(f"Connecting directly to matlab-proxy at {direct_url}")
+            return direct_url, nb_server["base_url"], direct_headers
+
+    return matlab_proxy_url, nb_server["base_url"], headers
+
+
+def _raise_matlab_proxy_unreachable_error(nb_server, logger=_logger):
     logger.error(
         "MATLABKernel could not communicate with matlab-proxy through Jupyter server"
     )
@@ -164,29 +239,126 @@ def start_matlab_proxy(logger=_logger):
     )
 
 
+def start_matlab_proxy(logger=_logger):
+    """
+    Start matlab-proxy registered with the jupyter server which started the
+    current kernel process.
+
+    Raises:
+        MATLABConnectionError: Occurs when kernel is not started by jupyter server.
+
+    Returns:
+        Tuple (string, string, dict):
+            url (string): Complete URL to send HTTP requests to matlab-proxy
+            base_url (string): Complete base url for matlab-proxy provided by jupyter server
+            headers (dict): HTTP headers required while sending HTTP requests to matlab-proxy
+    """
+
+    # If jupyter testing is enabled, then a standalone matlab-proxy server would be
+    # launched by the tests and kernel would expect the configurations of this matlab-proxy
+    # server which is provided through environment variables to 'start_matlab_proxy_for_testing'
+    if test_utils.is_jupyter_testing_enabled():
+        return test_utils.start_matlab_proxy_for_testing(logger)
+
+    nb_server = _find_jupyter_server(logger)
+    matlab_proxy_url = _get_matlab_proxy_url(nb_server)
+
+    for headers in _get_candidate_headers(nb_server):
+        if _start_matlab_proxy_using_jupyter(matlab_proxy_url, headers, logger):
+            return _get_connection_details(matlab_proxy_url, nb_server, headers, logger)
+
+    _raise_matlab_proxy_unreachable_error(nb_server, logger)
+
+
+async def start_matlab_proxy_async(logger=_logger):
+    """
+    Asynchronous variant of start_matlab_proxy. The candidate tokens for the jupyter
+    server are tried concurrently, and the most preferred token which is accepted
+    is used.
+
+    Raises:
+        MATLABConnectionError: Occurs when kernel is not started by jupyter server.
+
+    Returns:
+        Tuple (string, string, dict): See start_matlab_proxy.
+    """
+    if test_utils.is_jupyter_testing_enabled():
+        return test_utils.start_matlab_proxy_for_testing(logger)
+
+    # Listing the jupyter servers reads files from the disk.
+    nb_server = await asyncio.get_running_loop().run_in_executor(
+        None, _find_jupyter_server, logger
+    )
+    matlab_proxy_url = _get_matlab_proxy_url(nb_server)
+    candidate_headers = _get_candidate_headers(nb_server)
+
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(ssl=False), trust_env=True
+    ) as session:
+        results = await asyncio.gather(
+            *(
+                _start_matlab_proxy_using_jupyter_async(
+                    session, matlab_proxy_url, headers, logger
+                )
+                for headers in candidate_headers
+            )
+        )
+
+    for headers, is_started in zip(candidate_headers, results):
+        if is_started:
+            return _get_connection_details(matlab_proxy_url, nb_server, headers, logger)
+
+    _raise_matlab_proxy_unreachable_error(nb_server, logger)
+
+
 class MATLABKernelUsingJSP(base.BaseMATLABKernel):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        # Task which starts matlab-proxy in the background, so that the kernel can
+        # respond to requests from Jupyter, such as kernel_info, in the meantime.
+        # The event loop of the kernel is not running yet, so the task is created
+        # when the kernel handles its first request.
+        self._matlab_proxy_discovery = None
+
+    # ipykernel Interface API
+    # https://ipython.readthedocs.io/en/stable/development/wrapperkernels.html
+
+    def pre_handler_hook(self):
+        """Starts matlab-proxy before the first request of the kernel is handled"""
+        super().pre_handler_hook()
+        self._start_matlab_proxy_discovery()
+
+    def _start_matlab_proxy_discovery(self):
+        """Starts matlab-proxy in the event loop of the kernel, unless started"""
+        if self._matlab_proxy_discovery is None:
+            self._matlab_proxy_discovery = asyncio.create_task(
+                self._discover_matlab_proxy()
+            )
+
+    async def _discover_matlab_proxy(self):
+        """
+        Starts matlab-proxy using the jupyter-matlab-proxy registered endpoint and
+        initializes the communication helper for it.
+        """
         try:
-            # Start matlab-proxy using the jupyter-matlab-proxy registered endpoint.
-            murl, self.jupyter_base_url, headers = start_matlab_proxy(self.log)
+            murl, self.jupyter_base_url, headers = await start_matlab_proxy_async(
+                self.log
+            )
 
-            # Using asyncio.get_event_loop for shell_loop as io_loop variable is
-            # not yet initialized because start() is called after the __init__
-            # is completed.
-            shell_loop = asyncio.get_event_loop()
+            shell_loop = asyncio.get_running_loop()
             control_loop = self.control_thread.io_loop.asyncio_loop
-            self.mwi_comm_helper = MWICommHelper(
+            mwi_comm_helper = MWICommHelper(
                 self.kernel_id, murl, shell_loop, control_loop, headers, self.log
             )
-            shell_loop.run_until_complete(self.mwi_comm_helper.connect())
+            await mwi_comm_helper.connect()
+            self.mwi_comm_helper = mwi_comm_helper
         except MATLABConnectionError as err:
             self.startup_error = err
 
     async def do_shutdown(self, restart):
         self.log.debug("Received shutdown request from Jupyter")
-        if self.is_matlab_assigned:
+        if self.is_matlab_assigned and self.mwi_comm_helper:
             try:
                 await self.mwi_comm_helper.send_shutdown_request_to_matlab()
                 await self.mwi_comm_helper.disconnect()
@@ -205,5 +377,7 @@ class MATLABKernelUsingJSP(base.BaseMATLABKernel):
         await super().perform_startup_checks(self.jupyter_base_url, "matlab")
 
     async def start_matlab_proxy_and_comm_helper(self):
-        """Default implementation assumes that matlab is assigned"""
+        """Waits until matlab-proxy, which is started in the background, is available"""
+        self._start_matlab_proxy_discovery()
+        await self._matlab_proxy_discovery
         self.is_matlab_assigned = True
@@ -1,10 +1,13 @@
-# Copyright 2024-2025 The MathWorks, Inc.
+# Copyright 2024-2026 The MathWorks, Inc.
 
 import os
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
-from jupyter_matlab_kernel.jsp_kernel import MATLABKernelUsingJSP
-from jupyter_matlab_kernel.mpm_kernel import MATLABKernelUsingMPM
+# The kernel classes are imported only when they are selected, as each of them
+# pulls in a different set of dependencies which slow down the kernel startup.
+if TYPE_CHECKING:
+    from jupyter_matlab_kernel.jsp_kernel import MATLABKernelUsingJSP
+    from jupyter_matlab_kernel.mpm_kernel import MATLABKernelUsingMPM
 
 
 class KernelFactory:
@@ -29,7 +32,7 @@ class KernelFactory:
         return use_fallback_kernel.lower().strip() == "true"
 
     @staticmethod
-    def get_kernel_class() -> Union[MATLABKernelUsingJSP, MATLABKernelUsingMPM]:
+    def get_kernel_class() -> Union["MATLABKernelUsingJSP", "MATLABKernelUsingMPM"]:
         """
         Determines and returns the appropriate MATLAB kernel class to use.
 
@@ -38,8 +41,11 @@ class KernelFactory:
             be either `MATLABKernelUsingJSP` if the fallback kernel is enabled,
             or `MATLABKernelUsingMPM` otherwise.
         """
-        return (
-            MATLABKernelUsingJSP
-            if KernelFactory._is_fallback_kernel_enabled()
-            else MATLABKernelUsingMPM
-        )
+        if KernelFactory._is_fallback_kernel_enabled():
+            from jupyter_matlab_kernel.jsp_kernel import MATLABKernelUsingJSP
+
+            return MATLABKernelUsingJSP
+
+        from jupyter_matlab_kernel.mpm_kernel import MATLABKernelUsingMPM
+
+        return MATLABKernelUsingMPM
@@ -0,0 +1,289 @@
+# Copyright 2026 The MathWorks, Inc.
+# Helper functions to access the settings which control the behavior of the MATLAB Kernel
+
+import os
+from pathlib import Path
+
+
+def _get_bool_env(env_name, default=False):
+    """
+    Reads a boolean toggle from the environment.
+
+    Args:
+        env_name (str): Name of the environment variable.
+        default (bool): Value to use when the environment variable is not set.
+
+    Returns:
+        bool: True if the environment variable is set to "true" (case-insensitive), else False.
+    """
+    value = os.getenv(env_name)
+    if value is None:
+        return default
+    return value.lower().strip() == "true"
+
+
+def get_env_name_stream_outputs():
+    """Specifies whether outputs of a cell are displayed as each section of the cell finishes"""
+    return "MWI_JUPYTER_STREAM_OUTPUTS"
+
+
+def is_output_streaming_enabled():
+    """
+    Checks if the outputs of a cell should be streamed to the notebook as MATLAB produces them.
+
+    Returns:
+        bool: True if streaming of outputs is enabled, False otherwise.
+    """
+    return _get_bool_env(get_env_name_stream_outputs())
+
+
+def get_env_name_figure_transport():
+    """Specifies how figures are transferred from MATLAB to the kernel"""
+    return "MWI_JUPYTER_FIGURE_TRANSPORT"
+
+
+def get_figure_transport():
+    """
+    Gets the mechanism used to transfer figures from MATLAB to the kernel.
+
+    Returns:
+        str: "file" if MATLAB writes figures as binary files which the kernel reads,
+            "inline" (default) if figures are embedded as base64 in the response of MATLAB.
+    """
+    transport = os.getenv(get_env_name_figure_transport(), "inline").lower().strip()
+    return "file" if transport == "file" else "inline"
+
+
+def get_env_name_direct_connection():
+    """Specifies whether the kernel bypasses the Jupyter server to reach matlab-proxy"""
+    return "MWI_JUPYTER_DIRECT_CONNECTION"
+
+
+def is_direct_connection_enabled():
+    """
+    Checks if the kernel should send requests directly to the port of matlab-proxy
+    instead of routing them through the Jupyter server.
+
+    Returns:
+        bool: True if direct connection is enabled, False otherwise.
+    """
+    return _get_bool_env(get_env_name_direct_connection())
+
+
+def get_env_name_matlab_proxy_unix_socket():
+    """Specifies the Unix domain socket over which the kernel reaches matlab-proxy"""
+    return "MWI_JUPYTER_MATLAB_PROXY_UNIX_SOCKET"
+
+
+def get_matlab_proxy_unix_socket():
+    """
+    Gets the path of the Unix domain socket over which the kernel sends requests
+    to matlab-proxy.
+
+    Returns:
+        str: Path of the socket. None if requests are sent over TCP.
+    """
+    return os.getenv(get_env_name_matlab_proxy_unix_socket()) or None
+
+
+def get_env_name_session_pool_size():
+    """Specifies the number of idle dedicated MATLAB sessions kept ready for use"""
+    return "MWI_JUPYTER_SESSION_POOL_SIZE"
+
+
+def get_session_pool_size():
+    """
+    Gets the number of idle dedicated MATLAB sessions which are kept running, so that
+    "%%matlab new_session" can claim one of them instead of starting a new MATLAB.
+
+    Returns:
+        int: The size of the pool. Defaults to 0, which disables the pool.
+    """
+    try:
+        return max(int(os.getenv(get_env_name_session_pool_size(), "0")), 0)
+    except ValueError:
+        return 0
+
+
+def get_env_name_session_pool_refill():
+    """Specifies when the pool of idle dedicated MATLAB sessions is refilled"""
+    return "MWI_JUPYTER_SESSION_POOL_REFILL"
+
+
+def get_session_pool_refill_policy():
+    """
+    Gets the policy for refilling the pool of idle dedicated MATLAB sessions.
+
+    Returns:
+        str: "eager" (default) if the pool is refilled when a kernel starts and after
+            a session is claimed, "lazy" if the pool is refilled only when a kernel starts.
+    """
+    policy = os.getenv(get_env_name_session_pool_refill(), "eager").lower().strip()
+    return "lazy" if policy == "lazy" else "eager"
+
+
+def get_env_name_completion_timeout():
+    """Specifies the time the kernel waits for Tab completion results from MATLAB"""
+    return "MWI_JUPYTER_COMPLETION_TIMEOUT"
+
+
+def get_completion_timeout():
+    """
+    Gets the time in seconds after which the kernel stops waiting for the results
+    of a Tab completion request to MATLAB, for example when MATLAB is busy
+    executing code.
+
+    Returns:
+        float: The timeout in seconds. Defaults to 3.
+    """
+    try:
+        timeout = float(os.getenv(get_env_name_completion_timeout(), "3"))
+    except ValueError:
+        return 3.0
+    return timeout if timeout > 0 else 3.0
+
+
+def get_env_name_max_completions():
+    """Specifies the maximum number of Tab completion results sent to the frontend"""
+    return "MWI_JUPYTER_MAX_COMPLETIONS"
+
+
+def get_max_completions():
+    """
+    Gets the maximum number of Tab completion results returned for a completion
+    request. All results are returned when the same request is repeated.
+
+    Returns:
+        int: The maximum number of results. None if the number is not limited.
+            Defaults to 100.
+    """
+    try:
+        max_completions = int(os.getenv(get_env_name_max_completions(), "100"))
+    except ValueError:
+        return 100
+    return max_completions if max_completions > 0 else None
+
+
+def get_env_name_workspace_completion():
+    """Environment variable to complete workspace variables without MATLAB"""
+    return "MWI_JUPYTER_WORKSPACE_COMPLETION"
+
+
+def is_workspace_completion_enabled():
+    """
+    Checks whether MATLAB reports the changes to its workspace after each execution,
+    so that variables and their fields are completed without a request to MATLAB.
+
+    Returns:
+        bool: True if the environment variable is set to "true", False otherwise.
+    """
+    return _get_bool_env(get_env_name_workspace_completion())
+
+
+def get_env_name_cache_directory():
+    """Specifies the directory in which the kernel persists data across sessions"""
+    return "MWI_JUPYTER_CACHE_DIR"
+
+
+def get_cache_directory():
+    """
+    Gets the directory in which the kernel stores data which is reused by other
+    kernels and later sessions, such as the index of MATLAB function names.
+
+    Returns:
+        Path: The cache directory. Defaults to "jupyter_matlab_kernel" inside the
+            user's cache directory ($XDG_CACHE_HOME or ~/.cache).
+    """
+    cache_directory = os.getenv(get_env_name_cache_directory())
+    if cache_directory:
+        return Path(cache_directory)
+    user_cache_directory = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(user_cache_directory) / "jupyter_matlab_kernel"
+
+
+def get_env_name_output_processing():
+    """Specifies where the outputs of executed code are converted for Jupyter"""
+    return "MWI_JUPYTER_OUTPUT_PROCESSING"
+
+
+def get_output_processing():
+    """
+    Gets the process which converts the outputs of executed code into the outputs
+    displayed by Jupyter.
+
+    Returns:
+        str: "kernel" if MATLAB returns the outputs of the Live Editor API as is and
+            the kernel converts them, "matlab" (default) if MATLAB converts them.
+    """
+    processing = os.getenv(get_env_name_output_processing(), "matlab").lower().strip()
+    return "kernel" if processing == "kernel" else "matlab"
+
+
+def get_env_name_max_cell_output_size():
+    """Specifies the maximum size of the outputs displayed for a cell"""
+    return "MWI_JUPYTER_MAX_CELL_OUTPUT_SIZE"
+
+
+def get_max_cell_output_size():
+    """
+    Gets the maximum number of characters of the outputs displayed for a cell.
+    Outputs beyond the limit are written to a file instead.
+
+    Returns:
+        int: The maximum number of characters. None (default) if the size is not
+            limited.
+    """
+    try:
+        size_in_mb = float(os.getenv(get_env_name_max_cell_output_size(), "0"))
+    except ValueError:
+        size_in_mb = 0.0
+    return int(size_in_mb * 1024 * 1024) if size_in_mb > 0 else None
+
+
+def get_env_name_collapse_repeated_messages():
+    """Environment variable to collapse repeated warnings in the outputs of a cell"""
+    return "MWI_JUPYTER_COLLAPSE_REPEATED_MESSAGES"
+
+
+def is_collapse_repeated_messages_enabled():
+    """
+    Checks whether repeated warnings are collapsed into one output.
+
+    Returns:
+        bool: True unless the environment variable is set to a value other than "true".
+    """
+    return _get_bool_env(get_env_name_collapse_repeated_messages(), default=True)
+
+
+def get_env_name_collapse_messages_ignoring_numbers():
+    """Environment variable to collapse warnings which differ only in their numbers"""
+    return "MWI_JUPYTER_COLLAPSE_MESSAGES_IGNORING_NUMBERS"
+
+
+def is_collapse_messages_ignoring_numbers_enabled():
+    """
+    Checks whether repeated warnings which differ only in their numbers, such as
+    iteration counts, are collapsed into one output.
+
+    Returns:
+        bool: True if the environment variable is set to "true", False otherwise.
+    """
+    return _get_bool_env(get_env_name_collapse_messages_ignoring_numbers())
+
+
+def get_env_name_image_optimization():
+    """Specifies the preset with which the kernel optimizes the images of figures"""
+    return "MWI_JUPYTER_IMAGE_OPTIMIZATION"
+
+
+def get_image_optimization():
+    """
+    Gets the preset with which the kernel optimizes the PNG images of figures before
+    they are displayed.
+
+    Returns:
+        str: "lossless", "balanced" or "small". None (default) if images are
+            displayed as received from MATLAB.
+    """
+    preset = os.getenv(get_env_name_image_optimization(), "off").lower().strip()
+    return preset if preset in ("lossless", "balanced", "small") else None
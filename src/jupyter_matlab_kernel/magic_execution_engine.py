@@ -1,10 +1,14 @@
-# Copyright 2024-2025 The MathWorks, Inc.
+# Copyright 2024-2026 The MathWorks, Inc.
 
 import importlib
 import re
 
 from jupyter_matlab_kernel import mwi_logger
-from jupyter_matlab_kernel.magic_helper import get_magic_names
+from jupyter_matlab_kernel.magic_helper import (
+    LineIndex,
+    MagicRegistry,
+    get_magic_names,
+)
 from jupyter_matlab_kernel.mwi_exceptions import MagicError, MagicExecutionEngineError
 
 _logger = mwi_logger.get()
@@ -100,17 +104,22 @@ def get_magic_class(magic_name, logger=_logger):
         class: The class of the magic_name
 
     Raises:
-        ModuleNotFoundError: When the magic file does not exist.
-        AttributeError: When the magic file exists but it does not contain a class with <magic_name>
+        ModuleNotFoundError: When the magic or the module of the magic does not exist.
+        AttributeError: When the magic module does not contain the class of the magic
     """
+    magic_spec = MagicRegistry.get_magic_spec(magic_name)
+    if magic_spec is None:
+        raise ModuleNotFoundError(f"No magic named {magic_name}")
+
     if not MagicExecutionEngine.get_magic_module(magic_name):
-        path_of_magic_in_module = f"jupyter_matlab_kernel.magics.{magic_name}"
-        magic_module = importlib.import_module(path_of_magic_in_module)
+        magic_module = importlib.import_module(magic_spec.module)
         MagicExecutionEngine.set_magic_module(magic_name, magic_module)
         logger.debug(
             f"The magic {magic_name} was not found initializing and adding it to imported_magic_module"
         )
-    return getattr(MagicExecutionEngine.get_magic_module(magic_name), magic_name)
+    return getattr(
+        MagicExecutionEngine.get_magic_module(magic_name), magic_spec.attribute
+    )
 
 
 def get_magics_from_cell(cell_code):
@@ -131,11 +140,10 @@ def get_magics_from_cell(cell_code):
         matlab_starts_from_line_number (int): The line in the cell from which MATLAB code starts. None if no MATLAB code
 
     """
-    lines = cell_code.split("\n")
     magics = []
     line_number = 0
     matlab_starts_from_line_number = None
-    for line in lines:
+    for line in _iterate_lines(cell_code):
         # Whitespaces before the magic commands are accepted. Consistent with Ipython's magic
         line = line.strip()
         line_number += 1
@@ -164,6 +172,21 @@ def get_magics_from_cell(cell_code):
     return magics, matlab_starts_from_line_number
 
 
+def _iterate_lines(cell_code):
+    """
+    Yields the lines of the cell one by one, so that cells which begin with MATLAB
+    code are not split entirely.
+    """
+    line_start = 0
+    while True:
+        line_end = cell_code.find("\n", line_start)
+        if line_end == -1:
+            yield cell_code[line_start:]
+            return
+        yield cell_code[line_start:line_end]
+        line_start = line_end + 1
+
+
 def magic_executor(magics_for_execution, magic_execution_function):
     """
     Used to execute a specific function from the magics extracted from cell_code.
@@ -232,8 +255,9 @@ def get_completion_result_for_magics(cell_code, cursor_pos, logger=_logger):
             },...
         }
     """
-    cursor_at_line_number, cursor_pos_relative_to_line = find_cursor_line(
-        cell_code, cursor_pos
+    line_index = LineIndex(cell_code)
+    cursor_at_line_number, cursor_pos_relative_to_line = line_index.find_line(
+        cursor_pos
     )
 
     magics, matlab_code_starts_from_line_number = get_magics_from_cell(cell_code)
@@ -248,6 +272,7 @@ def get_completion_result_for_magics(cell_code, cursor_pos, logger=_logger):
             cursor_at_line_number,
             cursor_pos_relative_to_line,
             logger,
+            line_index,
         )
 
         if matches is None:
@@ -269,6 +294,7 @@ def get_completion_matches(
     cursor_at_line_number,
     cursor_pos_relative_to_line,
     logger=_logger,
+    line_index=None,
 ):
     """
     For tab completion gives the possible matches for magic commands
@@ -278,15 +304,16 @@ def get_completion_matches(
         magics (List[dict]): A list of magics in cell_code.
         cursor_at_line_number (int): The line number at which the cursor is positioned.
         cursor_pos_relative_to_line (int): The position of the cursor relative to the line.
+        line_index (LineIndex, optional): Index of the lines of cell_code. Created
+            from cell_code if not given.
 
     Returns:
         matches (List[str]): The possible matches for tab completion.
         cursor_pos_relative_to_word (int): The position of the cursor relative to the word.
     """
-    formatted_cell_code = cell_code.split("\n")
-    # The line numbers of the cell starts from 1 while the indexing starts from 0.
-    # Subtracting 1 from the line number to get the correct line of code.
-    line_code_at_cursor_pos = formatted_cell_code[cursor_at_line_number - 1]
+    if line_index is None:
+        line_index = LineIndex(cell_code)
+    line_code_at_cursor_pos = line_index.get_line(cursor_at_line_number)
     cursor_is_on_word_number, cursor_pos_relative_to_word = find_cursor_word(
         line_code_at_cursor_pos, cursor_pos_relative_to_line
     )
@@ -470,17 +497,7 @@ def find_cursor_line(cell_code, cursor_pos):
         line_number (int): The line number at the position of the cursor.
         cursor_pos_relative_to_line (int): The number of letters before the cursor with respect to the line.
     """
-    line_number = 1
-    current_pos = 0
-    cursor_pos_relative_to_line = 0
-    while cursor_pos != current_pos:
-        cursor_pos_relative_to_line = cursor_pos_relative_to_line + 1
-        # When next line character is encountered increase the line number and reset relative cursor position.
-        if cell_code[current_pos] == "\n":
-            cursor_pos_relative_to_line = 0
-            line_number = line_number + 1
-        current_pos = current_pos + 1
-    return line_number, cursor_pos_relative_to_line
+    return LineIndex(cell_code).find_line(cursor_pos)
 
 
 def find_cursor_word(line_code, cursor_pos):
@@ -525,17 +542,16 @@ class MagicExecutionEngine:
 
     # Dictionary to store magic modules as key-value pairs: {<magic_name>: <imported_magic_module>}
     # This dictionary populates itself when magics are executed from the kernel
-    # to prevent repeated lookups of modules in the file system.
+    # to prevent repeated lookups of modules in the file system. Magics are not
+    # imported ahead of their first use to keep the startup of the kernel fast.
     # The lifetime of this dictionary is the same as the lifetime of the kernel.
     imported_magic_modules = {}
 
     @classmethod
     def pre_load_magic_modules(cls):
-        magic_names = get_magic_names()
-        for magic_name in magic_names:
-            path_of_magic_in_module = f"jupyter_matlab_kernel.magics.{magic_name}"
+        for magic_name, magic_spec in MagicRegistry.get_magics().items():
             cls.imported_magic_modules[magic_name] = importlib.import_module(
-                path_of_magic_in_module
+                magic_spec.module
             )
 
     @classmethod
@@ -548,7 +564,6 @@ class MagicExecutionEngine:
 
     def __init__(self, logger=_logger):
         self.logger = logger
-        MagicExecutionEngine.pre_load_magic_modules()
 
     def process_before_cell_execution(self, cell_code, execution_count):
         """
@@ -1,7 +1,80 @@
-# Copyright 2024 The MathWorks, Inc.
+# Copyright 2024-2026 The MathWorks, Inc.
 
+import bisect
 import importlib
+import os
+from importlib.metadata import entry_points
+from itertools import accumulate
 from pathlib import Path
+from typing import NamedTuple
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+# Entry point group under which other packages register magic commands. The name
+# of each entry point is the name of the magic and its value is the magic class,
+# for example "mymagic = my_package.magics:mymagic".
+MAGIC_ENTRY_POINT_GROUP = "jupyter_matlab_kernel.magics"
+
+_BUNDLED_MAGICS_PACKAGE = "jupyter_matlab_kernel.magics"
+
+
+class MagicSpec(NamedTuple):
+    """Location of the class of a magic command, used to import it on first use"""
+
+    name: str
+    module: str
+    attribute: str
+    source: str
+
+
+class MagicRegistry:
+    """
+    Registry of the available magic commands. The registry is built on first use
+    from the magics bundled with the kernel and from the magics which other
+    packages register as entry points in the MAGIC_ENTRY_POINT_GROUP group, and
+    is kept for the lifetime of the kernel. Bundled magics take precedence over
+    entry points of the same name.
+
+    Magic classes are not imported until they are used, to keep the startup of the
+    kernel fast.
+    """
+
+    _magics = None
+
+    @classmethod
+    def get_magics(cls):
+        """
+        Gets the available magic commands.
+
+        Returns:
+            dict: MagicSpec of each magic, keyed by the name of the magic.
+        """
+        if cls._magics is None:
+            cls._magics = {
+                **_find_entry_point_magics(),
+                **_find_bundled_magics(),
+            }
+        return cls._magics
+
+    @classmethod
+    def get_magic_spec(cls, magic_name):
+        """
+        Gets the location of the class of a magic command.
+
+        Args:
+            magic_name (str): Name of the magic.
+
+        Returns:
+            MagicSpec: The location of the magic class. None if there is no such magic.
+        """
+        return cls.get_magics().get(magic_name)
+
+    @classmethod
+    def clear(cls):
+        """Discards the registry so that it is built again on the next use."""
+        cls._magics = None
 
 
 def get_magic_names():
@@ -9,19 +82,89 @@ def get_magic_names():
     Lists the names of all the magic commands.
 
     Returns:
-    [str]: All the available magics.
+    [str]: All the available magics, sorted by name.
+    """
+    return sorted(MagicRegistry.get_magics())
+
+
+def _find_bundled_magics():
+    """Finds the magics in the magics folder of the kernel"""
+    module_spec = importlib.util.find_spec(__name__)
+    if not module_spec or not module_spec.origin:
+        return {}
+
+    magic_path = Path(module_spec.origin).parent / "magics"
+    magics = {}
+    try:
+        with os.scandir(magic_path) as entries:
+            for entry in entries:
+                name, extension = os.path.splitext(entry.name)
+                if extension == ".py" and entry.is_file():
+                    magics[name] = MagicSpec(
+                        name, f"{_BUNDLED_MAGICS_PACKAGE}.{name}", name, "bundled"
+                    )
+    except OSError as e:
+        _logger.error(f"Unable to list the bundled magic commands: {e}")
+    return magics
+
+
+def _find_entry_point_magics():
+    """Finds the magics registered by other packages as entry points"""
+    magics = {}
+    try:
+        magic_entry_points = entry_points(group=MAGIC_ENTRY_POINT_GROUP)
+    except Exception as e:
+        _logger.error(f"Unable to list the magic commands of other packages: {e}")
+        return magics
+
+    for entry_point in magic_entry_points:
+        module, _, attribute = entry_point.value.partition(":")
+        source = entry_point.dist.name if entry_point.dist else "entry point"
+        magics[entry_point.name] = MagicSpec(
+            entry_point.name,
+            module.strip(),
+            attribute.strip() or entry_point.name,
+            source,
+        )
+    return magics
+
+
+class LineIndex:
+    """
+    Offsets at which the lines of a cell begin, used to find the line at a position
+    in the cell with a binary search instead of walking the cell character by
+    character.
     """
-    module_name = __name__
-    module_spec = importlib.util.find_spec(module_name)
-    magic_names = []
-    if module_spec and module_spec.origin:
-        magic_path = Path(module_spec.origin).parent / "magics"
-        magic_names = [
-            s.replace(".py", "")
-            for s in [
-                f.name
-                for f in magic_path.iterdir()
-                if f.is_file() and f.name.endswith(".py")
-            ]
-        ]
-    return magic_names
+
+    def __init__(self, cell_code):
+        self.lines = cell_code.split("\n")
+        self.offsets = list(
+            accumulate((len(line) + 1 for line in self.lines[:-1]), initial=0)
+        )
+
+    def find_line(self, position):
+        """
+        Finds the line which contains a position in the cell.
+
+        Args:
+            position (int): Position in the cell.
+
+        Returns:
+            line_number (int): The line number at the position, starting from 1.
+            position_relative_to_line (int): The number of characters in the line
+                before the position.
+        """
+        line_index = bisect.bisect_right(self.offsets, position) - 1
+        return line_index + 1, position - self.offsets[line_index]
+
+    def get_line(self, line_number):
+        """
+        Gets a line of the cell.
+
+        Args:
+            line_number (int): The line number, starting from 1.
+
+        Returns:
+            str: The line, without its line break.
+        """
+        return self.lines[line_number - 1]
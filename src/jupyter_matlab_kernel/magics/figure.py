@@ -0,0 +1,163 @@
+# Copyright 2026 The MathWorks, Inc.
+
+import importlib.util
+
+from jupyter_matlab_kernel.magics.base.matlab_magic import MATLABMagic
+from jupyter_matlab_kernel.mwi_exceptions import MagicError
+
+# Module constants
+FIGURE_FORMATS = ["png", "jpeg"]
+CMD_RESET = "reset"
+
+# Parameters which take a positive integer, mapped to the figure settings sent
+# to MATLAB
+INTEGER_PARAMETERS = {
+    "dpi": "dpi",
+    "width": "maxWidth",
+    "height": "maxHeight",
+}
+
+
+def format_figure_settings(figure_settings) -> str:
+    """
+    Formats the figure settings of a kernel into a string.
+
+    Args:
+        figure_settings (dict): Figure settings of the kernel.
+
+    Returns:
+        str: Formatted string with the figure settings.
+    """
+    if not figure_settings:
+        return "Figures are displayed as rendered by MATLAB.\n"
+
+    info_text = f'Figure Format: {figure_settings.get("format", "png")}\n'
+    if "dpi" in figure_settings:
+        info_text += f'Figure Resolution: {figure_settings["dpi"]} DPI\n'
+    if "maxWidth" in figure_settings:
+        info_text += f'Maximum Figure Width: {figure_settings["maxWidth"]} pixels\n'
+    if "maxHeight" in figure_settings:
+        info_text += f'Maximum Figure Height: {figure_settings["maxHeight"]} pixels\n'
+    return info_text
+
+
+class figure(MATLABMagic):
+    info_about_magic = f"""
+    Sets the format, resolution and maximum size of the figures displayed by the kernel.
+    The settings apply to the current cell and to all the cells executed afterwards, until the kernel restarts.
+
+    Usage: %%figure [format={"|".join(FIGURE_FORMATS)}] [dpi=<dpi>] [width=<pixels>] [height=<pixels>] [{CMD_RESET}]
+
+    Use %%figure without arguments to display the current settings, and %%figure {CMD_RESET} to display figures as rendered by MATLAB.
+
+    Example: %%figure format=jpeg dpi=72 width=800
+
+    Note: Figures are only scaled down. Settings which would enlarge a figure are ignored.
+    The kernel converts figures with the pillow package, which must be installed in the Python environment of the kernel.
+    """
+    skip_matlab_execution = False
+
+    def before_cell_execute(self):
+        """
+        Validates the parameters of the figure magic and updates the figure settings
+        of the kernel.
+
+        Raises:
+            MagicError: If a parameter is unknown or has an invalid value.
+
+        Yields:
+            dict: A dictionary containing callback information for the kernel to process.
+        """
+        reset, settings = self._parse_parameters()
+
+        async def update_figure_settings(kernel):
+            if reset:
+                kernel.figure_settings.clear()
+            kernel.figure_settings.update(settings)
+            output = format_figure_settings(kernel.figure_settings)
+            yield {
+                "type": "execute_result",
+                "mimetype": ["text/plain", "text/html"],
+                "value": [output, f"<html><body><pre>{output}</pre></body></html>"],
+            }
+
+        yield {
+            "type": "callback",
+            "callback_function": update_figure_settings,
+        }
+
+    def _parse_parameters(self):
+        """
+        Parses the parameters of the figure magic.
+
+        Raises:
+            MagicError: If a parameter is unknown or has an invalid value.
+
+        Returns:
+            bool: Whether the settings are reset before they are updated.
+            dict: The figure settings to update.
+        """
+        reset = False
+        settings = {}
+        for parameter in self.parameters:
+            if parameter == CMD_RESET:
+                reset = True
+                continue
+
+            name, separator, value = parameter.partition("=")
+            if not separator:
+                raise MagicError(
+                    f"Unknown argument {parameter}. Choose from: {self.get_supported_arguments()}"
+                )
+            if name == "format":
+                if value.lower() not in FIGURE_FORMATS:
+                    raise MagicError(
+                        f"Unsupported figure format {value}. Choose one of: {FIGURE_FORMATS}"
+                    )
+                settings["format"] = value.lower()
+            elif name in INTEGER_PARAMETERS:
+                if not value.isdigit() or int(value) == 0:
+                    raise MagicError(
+                        f"The value of {name} must be a positive integer. Received: {value}"
+                    )
+                settings[INTEGER_PARAMETERS[name]] = int(value)
+            else:
+                raise MagicError(
+                    f"Unknown argument {name}. Choose from: {self.get_supported_arguments()}"
+                )
+
+        if settings and importlib.util.find_spec("PIL") is None:
+            raise MagicError(
+                "The figure magic requires the pillow package. Install it with: pip install pillow"
+            )
+        return reset, settings
+
+    def do_complete(self, parameters, parameter_pos, cursor_pos):
+        """
+        Provides autocompletion for the figure magic command.
+
+        Args:
+            parameters (list): The parameters passed to the magic command
+            parameter_pos (int): The position of the parameter being completed
+            cursor_pos (int): The cursor position within the parameter
+
+        Returns:
+            list: A list of possible completions
+        """
+        parameter = ""
+        if 0 < parameter_pos <= len(parameters):
+            parameter = parameters[parameter_pos - 1]
+        prefix = parameter[:cursor_pos]
+        return [s for s in self.get_supported_arguments() if s.startswith(prefix)]
+
+    def get_supported_arguments(self) -> list:
+        """
+        Returns a list of supported arguments for the figure magic command.
+
+        Returns:
+            list: A list of supported arguments
+        """
+        arguments = [f"format={figure_format}" for figure_format in FIGURE_FORMATS]
+        arguments += [f"{name}=" for name in INTEGER_PARAMETERS]
+        arguments.append(CMD_RESET)
+        return arguments
@@ -1,9 +1,15 @@
-# Copyright 2025 The MathWorks, Inc.
+# Copyright 2025-2026 The MathWorks, Inc.
+
+from typing import TYPE_CHECKING
 
 from jupyter_matlab_kernel.magics.base.matlab_magic import MATLABMagic
-from jupyter_matlab_kernel.mpm_kernel import MATLABKernelUsingMPM
 from jupyter_matlab_kernel.mwi_exceptions import MagicError
 
+# Imported only for type annotations, the magic is also used by the kernel which
+# does not depend on MATLAB Proxy Manager.
+if TYPE_CHECKING:
+    from jupyter_matlab_kernel.mpm_kernel import MATLABKernelUsingMPM
+
 # Module constants
 LICENSING_MODES = {
     "mhlm": "Online Licensing",
@@ -18,7 +24,7 @@ DEDICATED_SESSION_CONFIRMATION_MSG = (
 )
 
 
-async def handle_new_matlab_session(kernel: MATLABKernelUsingMPM):
+async def handle_new_matlab_session(kernel: "MATLABKernelUsingMPM"):
     """
     Handles the creation of a new dedicated MATLAB session for the kernel.
     Args:
@@ -79,7 +85,7 @@ async def handle_new_matlab_session(kernel: MATLABKernelUsingMPM):
     }
 
 
-def _reset_kernel_state(kernel: MATLABKernelUsingMPM):
+def _reset_kernel_state(kernel: "MATLABKernelUsingMPM"):
     """
     Resets the kernel to its initial state for MATLAB session management.
 
@@ -123,6 +129,16 @@ def _format_info(info) -> str:
     info_text += f'MATLAB Root Path: {info.get("matlab_root_path")}\n'
     info_text += f'Licensing Mode: {LICENSING_MODES.get(info.get("licensing_mode"), "Unknown")}\n'
     info_text += f'MATLAB Shared With Other Notebooks: {info.get("is_shared_matlab")}\n'
+    if info.get("matlab_startup_time") is not None:
+        info_text += (
+            f'MATLAB Startup Time: {info.get("matlab_startup_time"):.2f} seconds\n'
+        )
+    session_pool = info.get("session_pool")
+    if session_pool:
+        info_text += (
+            f'Dedicated MATLAB Session Pool: {session_pool["ready"]} of {session_pool["size"]} sessions ready, '
+            f'{session_pool["hits"]} hits, {session_pool["misses"]} misses\n'
+        )
     return info_text
 
 
@@ -3,15 +3,32 @@
 % change without any prior notice. Usage of these undocumented APIs outside of
 % these files is not supported.
 
-function result = complete(code, cursorPosition)
+function result = complete(code, cursorPosition, options)
 % COMPLETE A helper function to provide tab completion results
+%
+% The optional options struct controls the post-processing of the results.
+%   - rawCompletionData - logical - If true, the JSON encoded completion data
+%                                   of the programming aids is returned as is,
+%                                   so that it is post-processed by the kernel
+%                                   instead of in MATLAB.
 
-% Copyright 2023-2024 The MathWorks, Inc.
+% Copyright 2023-2026 The MathWorks, Inc.
+
+if nargin < 3
+    options = struct();
+end
 
 % Get tab completion data for matlab code. Using evalin('base',..) so that the
 % function workspace does not affect the results.
 completionCmd = ['builtin(''_programmingAidsTest'','''',' mat2str(code) ',' mat2str(cursorPosition) ', [])'];
-completionData = jsondecode(evalin('base', completionCmd));
+completionJSON = evalin('base', completionCmd);
+
+if isfield(options, 'rawCompletionData') && options.rawCompletionData
+    result = completionJSON;
+    return
+end
+
+completionData = jsondecode(completionJSON);
 
 [result.matches, result.completions] = getCompletions(completionData, cursorPosition);
 
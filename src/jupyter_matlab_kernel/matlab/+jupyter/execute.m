@@ -3,16 +3,39 @@
 % change without any prior notice. Usage of these undocumented APIs outside of
 % these files is not supported.
 
-function result = execute(code, kernelId)
+function result = execute(code, kernelId, options)
 % EXECUTE A helper function for handling execution of MATLAB code and post-processing
 % the outputs to conform to Jupyter API. We use the Live Editor API for majority
 % of the work.
 %
+% The optional options struct controls the post-processing of the outputs.
+%   - figureDirectory - char array - If present, figures are written as binary
+%                                    files into this directory instead of being
+%                                    returned as base64 encoded data.
+%   - workspaceSymbols - logical   - If true, an output of type 'workspace' with
+%                                    the changes to the variables of the base
+%                                    workspace is appended to the outputs.
+%   - rawOutputs       - logical   - If true, the JSON encoded outputs of the
+%                                    Live Editor API are returned as is in an
+%                                    output of type 'raw_outputs', so that they
+%                                    are post-processed by the kernel. Outputs
+%                                    which contain symbolic results, and outputs
+%                                    requested with figureSettings, are always
+%                                    post-processed in MATLAB.
+%   - figureSettings   - struct    - If present, figure outputs contain the
+%                                    screen resolution at which the Live Editor
+%                                    rendered them, with which the kernel
+%                                    converts them to these settings.
+%
 % The entire MATLAB code given by user is treated as code within a single cell
 % of a unique Live Script. Hence, each execution request can be considered as
 % creating and running a new Live Script file.
 
-% Copyright 2023-2025 The MathWorks, Inc.
+% Copyright 2023-2026 The MathWorks, Inc.
+
+if nargin < 3
+    options = struct();
+end
 
 % Embed user MATLAB code in a try-catch block for MATLAB versions less than R2022b.
 % This is will disable inbuilt ErrorRecovery mechanism. Any exceptions created in
@@ -55,10 +78,28 @@ if ~isMATLABReleaseOlderThan("R2025b")
 end
 
 % Use the Live editor API for execution of MATLAB code and capturing the outputs
-resp = jsondecode(matlab.internal.editor.evaluateSynchronousRequest(request));
+respJSON = matlab.internal.editor.evaluateSynchronousRequest(request);
+
+% Symbolic outputs are converted to LaTeX using a webwindow, which is only
+% available in MATLAB. The screen resolution of figures is only known in MATLAB.
+if isfield(options, 'rawOutputs') && options.rawOutputs && ...
+        ~isfield(options, 'figureSettings') && ...
+        isempty(builtin('regexp', respJSON, '"type"\s*:\s*"symbolic"', 'once'))
+    result = {struct('type', 'raw_outputs', 'content', respJSON)};
+else
+    % Post-process the outputs to conform to Jupyter API.
+    resp = jsondecode(respJSON);
+    result = processOutputs(resp.outputs, options);
+end
+
+ME = jupyter.getOrStashExceptions([], true);
+if ~isempty(ME)
+    result{end+1} = processError(ME.message);
+end
 
-% Post-process the outputs to conform to Jupyter API.
-result = processOutputs(resp.outputs);
+if isfield(options, 'workspaceSymbols') && options.workspaceSymbols
+    result{end+1} = jupyter.getWorkspaceSymbols(kernelId);
+end
 
 % Helper function to update fields in the request based on MATLAB and LiveEditor
 % API version.
@@ -112,7 +153,7 @@ request = updateRequestFromVersion1(request, code);
 request.preferBasicOutputs = true;
 
 % Helper function to process different types of outputs given by LiveEditor API.
-function result = processOutputs(outputs)
+function result = processOutputs(outputs, options)
 result =cell(1,length(outputs));
 figureTrackingMap = containers.Map;
 
@@ -130,9 +171,9 @@ for ii = 1:length(outputs)
         case 'symbolic'
             result{ii} = processSymbolic(outputData);
         case 'error'
-            result{ii} = processStream('stderr', outputData.text);
+            result{ii} = processError(outputData.text);
         case 'warning'
-            result{ii} = processStream('stderr', outputData.text);
+            result{ii} = processWarning(outputData.text);
         case 'text'
             result{ii} = processStream('stdout', outputData.text);
         case 'stderr'
@@ -155,18 +196,17 @@ for ii = 1:length(outputs)
                 else
                     idx = ii;
                 end
-                result{idx} = processFigure(outputData.figureImage);
+                % Delete the file of an earlier rendering of the same figure.
+                if isstruct(result{idx}) && isfield(result{idx}, 'file')
+                    deleteFile(result{idx}.file);
+                end
+                result{idx} = processFigure(outputData.figureImage, options);
             end
         case 'text/html'
             result{ii} = processHtml(outputData);
     end
 end
 
-ME = jupyter.getOrStashExceptions([], true);
-if ~isempty(ME)
-    result{end+1} = processStream('stderr', ME.message);
-end
-
 % Helper functions to post process output of type 'matrix', 'variable' and
 % 'variableString'. These outputs are of HTML type due to various HTML tags
 % used in MATLAB outputs such as the <strong> tag in tables.
@@ -264,17 +304,61 @@ result.type = 'stream';
 result.content.name = stream;
 result.content.text = text;
 
+% Helper function for processing error outputs. Errors are displayed as 'stderr'
+% streams and flagged so that the kernel can identify code which failed.
+function result = processError(text)
+result = processStream('stderr', text);
+result.isError = true;
+
+% Helper function for processing warning outputs. Warnings are displayed as 'stderr'
+% streams and flagged so that the kernel can collapse repeated warnings.
+function result = processWarning(text)
+result = processStream('stderr', text);
+result.isWarning = true;
+
 % Helper function for processing figure outputs.
 % base64Data will be 'data:image/png;base64,<base64_value>'
-function result = processFigure(base64Data)
+function result = processFigure(base64Data, options)
 pattern = "data:(?<mimetype>.*);base64,(?<value>.*)";
 result = builtin('regexp', base64Data, pattern, 'names');
 assert(builtin('startsWith', result.mimetype, 'image'), 'Error in processFigure. ''mimetype'' is not an image');
 assert(~isempty(result.value), 'Error in processFigure. ''value'' is empty');
-result.mimetype = {result.mimetype};
+mimetype = result.mimetype;
+result.mimetype = {mimetype};
 result.value = {result.value};
 result.type = 'execute_result';
 
+if isfield(options, 'figureSettings')
+    % The kernel scales figures to the requested resolution relative to the
+    % resolution at which they were rendered.
+    result.screenPixelsPerInch = get(groot, 'ScreenPixelsPerInch');
+end
+
+if isfield(options, 'figureDirectory')
+    result = writeFigureFile(result, mimetype, options.figureDirectory);
+end
+
+% Helper function to delete a file if it exists.
+function deleteFile(fileName)
+if isfile(fileName)
+    delete(fileName);
+end
+
+% Helper function to write the image data of a figure output as a binary file.
+% The kernel reads the file instead of decoding the image from the JSON response.
+% The figure is returned inline if the file cannot be written.
+function result = writeFigureFile(result, mimetype, figureDirectory)
+[~, extension] = strtok(mimetype, '/');
+fileName = [tempname(figureDirectory) '.' extension(2:end)];
+fid = fopen(fileName, 'w');
+if fid == -1
+    return
+end
+fileCleanupObj = onCleanup(@() fclose(fid));
+fwrite(fid, matlab.net.base64decode(result.value{1}));
+result.value = {''};
+result.file = fileName;
+
 % Helper function for processing text/html mime-type outputs.
 function result = processHtml(text)
 result.type = 'execute_result';
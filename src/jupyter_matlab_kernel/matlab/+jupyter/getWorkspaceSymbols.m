@@ -0,0 +1,126 @@
+function result = getWorkspaceSymbols(kernelId, resetFlag)
+% GETWORKSPACESYMBOLS A helper function to report the changes to the variables of
+% the base workspace since the previous call for a kernel. The kernel uses the
+% variable names, classes and field names to complete them without a request
+% to MATLAB.
+%
+%   Inputs:
+%       kernelId  - string  - ID of the kernel
+%       resetFlag - logical - (optional) When set, the snapshot of the kernel is
+%                             discarded and nothing is returned.
+%   Outputs:
+%       result    - struct  - output of type 'workspace' with the content
+%           - full    - logical    - true if updated lists all the variables, for
+%                                    example on the first call for a kernel
+%           - updated - cell array - structs with the name, class, fields and
+%                                    methods of each new or changed variable
+%           - removed - cell array - names of the variables which were cleared
+
+% Copyright 2026 The MathWorks, Inc.
+
+% Maximum number of field or property names reported for a variable
+maxFields = 256;
+
+% Maximum number of variables whose fields or properties are reported. Only the
+% names and classes of variables are reported for larger workspaces, as getting
+% the fields of each variable would slow down every execution.
+maxIntrospectedVariables = 1000;
+
+% Snapshots of the workspace reported to each kernel. Each snapshot maps the name
+% of a variable to a key which changes when its class or fields change.
+persistent snapshots
+
+if isempty(snapshots)
+    snapshots = containers.Map;
+end
+
+if nargin == 2 && resetFlag == true
+    if isKey(snapshots, kernelId)
+        remove(snapshots, kernelId);
+    end
+    result = {};
+    return
+end
+
+isFull = ~isKey(snapshots, kernelId);
+if isFull
+    previous = containers.Map;
+else
+    previous = snapshots(kernelId);
+end
+
+variables = evalin('base', 'whos');
+if numel(variables) > maxIntrospectedVariables
+    maxFields = 0;
+end
+current = containers.Map;
+updated = {};
+for ii = 1:numel(variables)
+    variable = variables(ii);
+    [fields, fieldType] = getFields(variable, maxFields);
+    key = strjoin([{variable.class}, fields], ',');
+    current(variable.name) = key;
+    if ~isKey(previous, variable.name) || ~strcmp(previous(variable.name), key)
+        symbol.name = variable.name;
+        symbol.class = variable.class;
+        symbol.fieldType = fieldType;
+        symbol.fields = fields;
+        % Methods depend only on the class, so they are reported only with the
+        % changes to a variable.
+        symbol.methods = getMethods(variable, fieldType, maxFields);
+        updated{end+1} = symbol; %#ok<AGROW>
+    end
+end
+
+removed = setdiff(keys(previous), keys(current));
+snapshots(kernelId) = current;
+
+result.type = 'workspace';
+result.content.full = isFull;
+result.content.updated = updated;
+result.content.removed = removed;
+
+% Helper function to get the names of the fields of a scalar struct or the
+% properties of a scalar object in the base workspace. Variables of fundamental
+% classes have neither, and are not inspected.
+function [fields, fieldType] = getFields(variable, maxFields)
+fields = {};
+fieldType = '';
+fundamentalClasses = {'double', 'single', 'logical', 'char', 'string', 'cell', ...
+    'int8', 'uint8', 'int16', 'uint16', 'int32', 'uint32', 'int64', 'uint64', ...
+    'function_handle'};
+if maxFields == 0 || prod(variable.size) ~= 1 || ...
+        any(strcmp(variable.class, fundamentalClasses))
+    return
+end
+
+try
+    if strcmp(variable.class, 'struct')
+        fields = evalin('base', sprintf('fieldnames(%s)', variable.name));
+        fieldType = 'field';
+    elseif evalin('base', sprintf('isobject(%s)', variable.name))
+        fields = evalin('base', sprintf('properties(%s)', variable.name));
+        fieldType = 'property';
+    end
+catch
+    fields = {};
+    fieldType = '';
+end
+
+fields = reshape(fields(1:min(numel(fields), maxFields)), 1, []);
+
+% Helper function to get the names of the methods of a scalar object in the base
+% workspace, completed along with its properties.
+function names = getMethods(variable, fieldType, maxFields)
+names = {};
+if ~strcmp(fieldType, 'property')
+    return
+end
+
+try
+    names = evalin('base', sprintf('methods(%s)', variable.name));
+catch
+    names = {};
+end
+
+names = reshape(names(1:min(numel(names), maxFields)), 1, []);
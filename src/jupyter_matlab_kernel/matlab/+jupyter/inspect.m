@@ -0,0 +1,27 @@
+function result = inspect(names)
+% INSPECT A helper function to get the help text of functions and classes, which
+% is displayed by Jupyter when the user presses Shift+Tab.
+%
+%   Inputs:
+%       names  - cell array - names of the functions or classes
+%   Outputs:
+%       result - cell array - help text of each name. The help text is empty if
+%                             there is no help for the name.
+
+% Copyright 2026 The MathWorks, Inc.
+
+names = cellstr(names);
+
+% Disable Hotlinks in the help text. The hotlinks do not have a purpose in
+% Jupyter notebooks.
+hotlinksPreviousState = feature('hotlinks','off');
+hotlinksCleanupObj = onCleanup(@() feature('hotlinks', hotlinksPreviousState));
+
+result = cell(1, numel(names));
+for ii = 1:numel(names)
+    try
+        result{ii} = help(names{ii});
+    catch
+        result{ii} = '';
+    end
+end
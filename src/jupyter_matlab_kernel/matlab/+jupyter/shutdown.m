@@ -6,7 +6,7 @@
 function output = shutdown(kernelId)
 % SHUTDOWN A helper function to perform cleanup activities when a kernel shuts down.
 
-% Copyright 2023 The MathWorks, Inc.
+% Copyright 2023-2026 The MathWorks, Inc.
 
 import matlab.internal.editor.SynchronousEvaluationOutputsService
 
@@ -15,5 +15,8 @@ if ~isMATLABReleaseOlderThan("R2023b")
     SynchronousEvaluationOutputsService.cleanup(kernelId);
 end
 
+% Discard the snapshot of the workspace reported to the kernel
+jupyter.getWorkspaceSymbols(kernelId, true);
+
 output = {};
 end
\ No newline at end of file
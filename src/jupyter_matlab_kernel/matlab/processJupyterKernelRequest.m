@@ -3,7 +3,8 @@ function result = processJupyterKernelRequest(request_type, execution_request_ty
 % features such as code execution, code completion etc.
 %   Inputs:
 %       request_type - string     - identifier to differentiate multiple features.
-%                                   Supported values are "execute" and "complete"
+%                                   Supported values are "execute", "complete",
+%                                   "inspect" and "shutdown"
 %       execution_request_type - string - identifier to differentiate how this
 %                                   function is run in MATLAB. Supported values
 %                                   are "feval" and "eval"
@@ -12,9 +13,16 @@ function result = processJupyterKernelRequest(request_type, execution_request_ty
 %                                   - "execute"
 %                                      - string - MATLAB code to be executed
 %                                      - string - ID of the kernel
+%                                      - string - (optional) JSON encoded options
+%                                                 passed to jupyter.execute
 %                                   - "complete"
 %                                      - string - MATLAB code
 %                                      - number - cursor position
+%                                      - string - (optional) JSON encoded options
+%                                                 passed to jupyter.complete
+%                                   - "inspect"
+%                                      - string - JSON encoded array with the
+%                                                 names of functions
 %                                   - "shutdown"
 %                                      - string - ID of the kernel
 %   Outputs:
@@ -31,7 +39,7 @@ function result = processJupyterKernelRequest(request_type, execution_request_ty
 %               - value - string - content of the stream
 %
 
-% Copyright 2023 The MathWorks, Inc.
+% Copyright 2023-2026 The MathWorks, Inc.
 
 % Lock the function on the first use to prevent it from being cleared from the memory
 mlock;
@@ -51,10 +59,21 @@ try
     switch(request_type)
         case 'execute'
             kernelId = varargin{2};
-            output = jupyter.execute(code, kernelId);
+            options = struct();
+            if numel(varargin) > 2
+                options = jsondecode(varargin{3});
+            end
+            output = jupyter.execute(code, kernelId, options);
         case 'complete'
             cursorPosition = varargin{2};
-            output = jupyter.complete(code, cursorPosition);
+            options = struct();
+            if numel(varargin) > 2
+                options = jsondecode(varargin{3});
+            end
+            output = jupyter.complete(code, cursorPosition, options);
+        case 'inspect'
+            names = jsondecode(code);
+            output = jupyter.inspect(names);
         case 'shutdown'
             kernelId = varargin{1};
             output = jupyter.shutdown(kernelId);
@@ -0,0 +1,388 @@
+# Copyright 2026 The MathWorks, Inc.
+# Lightweight helpers to analyze the structure of MATLAB code inside the kernel process
+
+import re
+from typing import NamedTuple, Optional, Tuple
+
+# Keywords which always open a block terminated by 'end'
+_BLOCK_KEYWORDS = {
+    "for",
+    "parfor",
+    "while",
+    "if",
+    "switch",
+    "try",
+    "function",
+    "spmd",
+    "classdef",
+}
+
+# Reserved keywords which cannot be used as names. They are keywords wherever they
+# appear outside of brackets, strings and comments.
+_RESERVED_KEYWORDS = _BLOCK_KEYWORDS | {
+    "end",
+    "else",
+    "elseif",
+    "case",
+    "otherwise",
+    "catch",
+    "break",
+    "continue",
+    "return",
+    "global",
+    "persistent",
+}
+
+# Reserved keywords which form a complete statement, so that a new statement can
+# follow them on the same line without a ',' or ';'
+_STANDALONE_KEYWORDS = {
+    "end",
+    "else",
+    "try",
+    "otherwise",
+    "break",
+    "continue",
+    "return",
+}
+
+# Keywords which open a block only when they appear directly inside a 'classdef' block
+_CLASSDEF_BLOCK_KEYWORDS = {"properties", "methods", "events", "enumeration"}
+
+# Keywords which are not reserved, and can also be used as names, for example in
+# 'arguments = varargin'. They open a block only when they are followed by the end
+# of the statement or by attributes in parentheses.
+_CONTEXTUAL_KEYWORDS = _CLASSDEF_BLOCK_KEYWORDS | {"arguments"}
+_BLOCK_ATTRIBUTES_PATTERN = re.compile(
+    r"\s*(\([^()]*\)\s*)?($|[,;%]|\.\.\.)|\s*\([^()]*\.\.\."
+)
+
+_SECTION_BREAK_PATTERN = re.compile(r"^\s*%%(\s|$)")
+_BLOCK_COMMENT_START_PATTERN = re.compile(r"^\s*%\{\s*$")
+_BLOCK_COMMENT_END_PATTERN = re.compile(r"^\s*%\}\s*$")
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_]\w*")
+
+# A name at the start of a statement followed by whitespace and a word or a quote is
+# a command, as in 'hold on' or "disp 'done'", and the rest of its statement is text.
+_COMMAND_SYNTAX_PATTERN = re.compile(r"[ \t]+[\w'\"]")
+
+
+class BlockState(NamedTuple):
+    """
+    State of the block structure of MATLAB code after a line.
+
+    Attributes:
+        blocks: Keyword and line number (starting at 0) of each open block.
+        in_block_comment: True if the line is inside a block comment ('%{ ... %}').
+        is_continuation: True if the line ends with a continuation ('...').
+        depth: Number of brackets which are open.
+        unmatched_end: Line number of the first 'end' without an open block.
+        defines_functions: True if the code defines functions or classes.
+    """
+
+    blocks: Tuple[Tuple[str, int], ...] = ()
+    in_block_comment: bool = False
+    is_continuation: bool = False
+    depth: int = 0
+    unmatched_end: Optional[int] = None
+    defines_functions: bool = False
+
+    def is_incomplete(self):
+        """
+        Checks if the code needs more lines, for example to close a block.
+
+        Returns:
+            bool: True if the code is incomplete, False otherwise.
+        """
+        return bool(
+            self.blocks or self.in_block_comment or self.is_continuation or self.depth
+        )
+
+
+def _skip_string(line, idx):
+    """
+    Skips over the string literal which starts at a quote. Quotes are escaped by
+    doubling them.
+
+    Args:
+        line (str): A single line of MATLAB code.
+        idx (int): Position of the opening quote.
+
+    Returns:
+        int: Position after the closing quote, or the length of the line if the
+            string is not closed.
+    """
+    quote = line[idx]
+    idx += 1
+    length = len(line)
+    while idx < length:
+        if line[idx] == quote:
+            if idx + 1 < length and line[idx + 1] == quote:
+                idx += 2
+                continue
+            return idx + 1
+        idx += 1
+    return length
+
+
+def _skip_command_arguments(line, idx):
+    """
+    Skips over the arguments of a command, which are text up to the next ',' or ';'
+    outside of quotes, a comment or a continuation.
+
+    Args:
+        line (str): A single line of MATLAB code.
+        idx (int): Position after the name of the command.
+
+    Returns:
+        int: Position of the end of the arguments.
+    """
+    length = len(line)
+    while idx < length:
+        char = line[idx]
+        if char in ",;%" or line.startswith("...", idx):
+            return idx
+        if char in "'\"":
+            idx = _skip_string(line, idx)
+        else:
+            idx += 1
+    return length
+
+
+def _statement_keywords(line, starts_statement=True, depth=0):
+    """
+    Finds the keywords of the statements in a single line of MATLAB code. Strings,
+    comments and the arguments of commands are skipped. Reserved keywords are found
+    wherever they appear outside of brackets, while keywords which can also be names
+    are only found at the start of a statement. A statement starts at the beginning
+    of the line, after every ',' or ';' which is not enclosed in brackets and after
+    keywords which form a complete statement, such as 'else' or 'end'.
+
+    Args:
+        line (str): A single line of MATLAB code.
+        starts_statement (bool): False if the line continues the statement of the previous line.
+        depth (int): Number of brackets left open by the previous lines.
+
+    Returns:
+        Tuple(List[str], bool, int): The keywords in order of their appearance, a flag
+            indicating whether the line ends with a continuation ('...') and the number
+            of brackets which are open at the end of the line.
+    """
+    keywords = []
+    at_statement_start = starts_statement
+    previous = ""
+    idx = 0
+    length = len(line)
+    while idx < length:
+        char = line[idx]
+        if char in " \t":
+            # Inside brackets, whitespace separates elements, so that a following
+            # quote starts a string instead of transposing the previous element.
+            if depth:
+                previous = " "
+            idx += 1
+            continue
+
+        if char == "%":
+            break
+
+        if line.startswith("...", idx):
+            return keywords, True, depth
+
+        if char == '"' or (
+            char == "'" and not (previous.isalnum() or previous in "_)]}.'")
+        ):
+            idx = _skip_string(line, idx)
+            previous = char
+            at_statement_start = False
+            continue
+
+        match = _IDENTIFIER_PATTERN.match(line, idx)
+        if match:
+            word = match.group()
+            idx = match.end()
+            is_keyword_position = depth == 0 and previous != "."
+            previous = word[-1]
+            if is_keyword_position and word in _RESERVED_KEYWORDS:
+                keywords.append(word)
+                at_statement_start = word in _STANDALONE_KEYWORDS
+                continue
+
+            if is_keyword_position and at_statement_start:
+                if word in _CONTEXTUAL_KEYWORDS and _BLOCK_ATTRIBUTES_PATTERN.match(
+                    line, idx
+                ):
+                    keywords.append(word)
+                elif _COMMAND_SYNTAX_PATTERN.match(line, idx):
+                    idx = _skip_command_arguments(line, idx)
+            at_statement_start = False
+            continue
+
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth = max(depth - 1, 0)
+        elif char in ",;" and depth == 0:
+            at_statement_start = True
+        else:
+            at_statement_start = False
+
+        previous = char
+        idx += 1
+
+    return keywords, False, depth
+
+
+def _update_block_stack(stack, words, line_number=0):
+    """
+    Updates the stack of open blocks with the keywords of a line.
+
+    Args:
+        stack (List[Tuple[str, int]]): Keyword and line number of the blocks which
+            are currently open.
+        words (List[str]): Keywords found in the line.
+        line_number (int): Number of the line on which the words were found.
+
+    Returns:
+        bool: True if the line contains an 'end' without an open block.
+    """
+    has_unmatched_end = False
+    for word in words:
+        innermost_block = stack[-1][0] if stack else None
+        if word == "end":
+            if stack:
+                stack.pop()
+            else:
+                has_unmatched_end = True
+        elif word in _BLOCK_KEYWORDS:
+            stack.append((word, line_number))
+        elif word in _CLASSDEF_BLOCK_KEYWORDS and innermost_block == "classdef":
+            stack.append((word, line_number))
+        elif word == "arguments" and innermost_block == "function":
+            stack.append((word, line_number))
+    return has_unmatched_end
+
+
+def _parse_line(line, line_number, state):
+    """
+    Computes the state of the block structure after a line of MATLAB code.
+
+    Args:
+        line (str): A single line of MATLAB code.
+        line_number (int): Number of the line, starting at 0.
+        state (BlockState): State after the previous line.
+
+    Returns:
+        BlockState: State after the line.
+    """
+    if state.in_block_comment:
+        if _BLOCK_COMMENT_END_PATTERN.match(line):
+            return state._replace(in_block_comment=False)
+        return state
+
+    if _BLOCK_COMMENT_START_PATTERN.match(line) and not state.is_continuation:
+        return state._replace(in_block_comment=True)
+
+    starts_statement = not state.is_continuation and not state.depth
+    words, continues, depth = _statement_keywords(line, starts_statement, state.depth)
+    if not words:
+        return state._replace(is_continuation=continues, depth=depth)
+
+    blocks = list(state.blocks)
+    has_unmatched_end = _update_block_stack(blocks, words, line_number)
+    unmatched_end = state.unmatched_end
+    if unmatched_end is None and has_unmatched_end:
+        unmatched_end = line_number
+    return state._replace(
+        blocks=tuple(blocks),
+        is_continuation=continues,
+        depth=depth,
+        unmatched_end=unmatched_end,
+        defines_functions=state.defines_functions
+        or any(word in ("function", "classdef") for word in words),
+    )
+
+
+class MATLABBlockParser:
+    """
+    Incremental parser of the block structure of MATLAB code. The parser keeps the
+    state after each line of the most recently parsed code, so that code which
+    begins with the same lines, for example while a cell is being typed, is parsed
+    starting from the first line which differs.
+    """
+
+    def __init__(self):
+        self._lines = []
+        self._states = []
+
+    def parse(self, code):
+        """
+        Parses the block structure of MATLAB code.
+
+        Args:
+            code (str): MATLAB code to parse.
+
+        Returns:
+            BlockState: State of the block structure at the end of the code.
+        """
+        lines = code.split("\n")
+        reused_lines = 0
+        for old_line, new_line in zip(self._lines, lines):
+            if old_line != new_line:
+                break
+            reused_lines += 1
+
+        states = self._states[:reused_lines]
+        state = states[-1] if states else BlockState()
+        for line_number in range(reused_lines, len(lines)):
+            state = _parse_line(lines[line_number], line_number, state)
+            states.append(state)
+
+        self._lines = lines
+        self._states = states
+        return state
+
+
+def split_into_sections(code):
+    """
+    Splits MATLAB code into its sections. A section starts with a line beginning
+    with '%%' followed by a whitespace or the end of the line, as long as that line
+    is not inside a block comment, a continued statement or a control flow block.
+
+    Code containing function or class definitions is never split because local
+    functions must be defined in the same file in which they are used.
+
+    Each returned section is prefixed with empty lines so that the line numbers
+    reported by MATLAB in errors and warnings match the line numbers of the cell.
+
+    Args:
+        code (str): MATLAB code to split.
+
+    Returns:
+        List[str]: The sections of the MATLAB code. The list contains only the
+            original code if it cannot be split.
+    """
+    lines = code.split("\n")
+    section_starts = [0]
+    state = BlockState()
+
+    for line_number, line in enumerate(lines):
+        if (
+            line_number > 0
+            and not state.is_incomplete()
+            and _SECTION_BREAK_PATTERN.match(line)
+        ):
+            section_starts.append(line_number)
+            continue
+
+        state = _parse_line(line, line_number, state)
+        if state.defines_functions:
+            return [code]
+
+    section_starts.append(len(lines))
+    sections = []
+    for start, end in zip(section_starts, section_starts[1:]):
+        section = "\n".join(lines[start:end])
+        if section.strip():
+            sections.append("\n" * start + section)
+
+    return sections or [code]
@@ -1,15 +1,17 @@
-# Copyright 2024-2025 The MathWorks, Inc.
+# Copyright 2024-2026 The MathWorks, Inc.
 
 """This module contains derived class implementation of MATLABKernel that uses
 MATLAB Proxy Manager to manage interactions with matlab-proxy & MATLAB.
 """
 
+import asyncio
 from logging import Logger
 
 import matlab_proxy_manager.lib.api as mpm_lib
 from requests.exceptions import HTTPError
 
 from jupyter_matlab_kernel import base_kernel as base
+from jupyter_matlab_kernel import kernel_settings
 from jupyter_matlab_kernel.mwi_comm_helpers import MWICommHelper
 from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
 
@@ -29,9 +31,40 @@ class MATLABKernelUsingMPM(base.BaseMATLABKernel):
         # Required for performing licensing using Jupyter Server
         self.jupyter_base_url = base._fetch_jupyter_base_url(self.parent_pid, self.log)
 
+        # Identifies this kernel to the proxy manager as the user of its matlab-proxy.
+        # Differs from the kernel id when a dedicated MATLAB is claimed from the pool.
+        self.mpm_caller_id = self.kernel_id
+
+        # Pool of idle dedicated MATLAB sessions shared by the kernels of the Jupyter
+        # server. None if the pool is disabled.
+        self.session_pool = None
+        self._session_pool_tasks = set()
+        pool_size = kernel_settings.get_session_pool_size()
+        if pool_size:
+            from jupyter_matlab_kernel.session_pool import MATLABSessionPool
+
+            self.session_pool = MATLABSessionPool(
+                self.parent_pid,
+                self.jupyter_base_url,
+                pool_size,
+                kernel_settings.get_session_pool_refill_policy(),
+                self.log,
+            )
+
+        # The event loop of the kernel is not running yet. The pool is refilled when
+        # the kernel handles its first request.
+        self._is_session_pool_refill_pending = self.session_pool is not None
+
     # ipykernel Interface API
     # https://ipython.readthedocs.io/en/stable/development/wrapperkernels.html
 
+    def pre_handler_hook(self):
+        """Refills the session pool before the first request of the kernel is handled"""
+        super().pre_handler_hook()
+        if self._is_session_pool_refill_pending:
+            self._is_session_pool_refill_pending = False
+            self._refill_session_pool()
+
     async def do_shutdown(self, restart):
         self.log.debug("Received shutdown request from Jupyter")
         if self.is_matlab_assigned and self.mwi_comm_helper:
@@ -57,8 +90,9 @@ class MATLABKernelUsingMPM(base.BaseMATLABKernel):
         # Shuts down matlab-proxy and MATLAB assigned to this Kernel.
         # matlab-proxy process is cleaned up when this Kernel process is the
         # only reference to the assigned matlab-proxy instance
-        await mpm_lib.shutdown(self.parent_pid, self.kernel_id, self.mpm_auth_token)
+        await mpm_lib.shutdown(self.parent_pid, self.mpm_caller_id, self.mpm_auth_token)
         self.is_matlab_assigned = False
+        self.mpm_caller_id = self.kernel_id
 
     async def perform_startup_checks(self):
         """Overriding base function to provide a different iframe source"""
@@ -71,17 +105,54 @@ class MATLABKernelUsingMPM(base.BaseMATLABKernel):
         Starts the MATLAB proxy using the proxy manager and fetches its status.
         """
         try:
-            (
-                murl,
-                self.matlab_proxy_base_url,
-                headers,
-                self.mpm_auth_token,
-            ) = await self._initialize_matlab_proxy_with_mpm(self.log)
+            session = self._claim_pooled_session()
+            if session:
+                murl = session["absolute_url"]
+                self.matlab_proxy_base_url = session["mwi_base_url"]
+                headers = session["headers"]
+                self.mpm_auth_token = session["mpm_auth_token"]
+                self.mpm_caller_id = session["caller_id"]
+            else:
+                (
+                    murl,
+                    self.matlab_proxy_base_url,
+                    headers,
+                    self.mpm_auth_token,
+                ) = await self._initialize_matlab_proxy_with_mpm(self.log)
 
             await self._initialize_mwi_comm_helper(murl, headers)
         except MATLABConnectionError as err:
             self.startup_error = err
 
+    def _claim_pooled_session(self):
+        """
+        Claims an idle dedicated MATLAB session from the pool, if this kernel
+        requires a dedicated MATLAB and the pool is enabled.
+
+        Returns:
+            dict: Details of the claimed session. None if no session was claimed.
+        """
+        if self.is_shared_matlab or not self.session_pool:
+            return None
+
+        session = self.session_pool.claim(self.kernel_id)
+        if self.session_pool.refill_policy == "eager":
+            self._refill_session_pool()
+        return session
+
+    def _refill_session_pool(self):
+        """Starts idle dedicated MATLAB sessions for the free slots of the pool in the background"""
+        task = asyncio.create_task(self.session_pool.refill())
+        # Keep a reference to the task until it is done to prevent its garbage collection
+        self._session_pool_tasks.add(task)
+        task.add_done_callback(self._session_pool_tasks.discard)
+
+    def _get_kernel_info(self):
+        info = super()._get_kernel_info()
+        if self.session_pool:
+            info["session_pool"] = self.session_pool.get_stats()
+        return info
+
     async def _initialize_matlab_proxy_with_mpm(self, _logger: Logger):
         """
         Initializes the MATLAB proxy process using the Proxy Manager (MPM) library.
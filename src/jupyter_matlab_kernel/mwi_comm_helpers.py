@@ -1,11 +1,16 @@
-# Copyright 2023-2025 The MathWorks, Inc.
+# Copyright 2023-2026 The MathWorks, Inc.
 # Helper functions to communicate with matlab-proxy and MATLAB
 
+import asyncio
 import http
+import ipaddress
 import json
 import pathlib
+import shutil
+import tempfile
 from dataclasses import dataclass
 from typing import Optional
+from urllib.parse import urlparse
 
 import aiohttp
 from matlab_proxy.util.mwi.embedded_connector.helpers import (
@@ -14,7 +19,9 @@ from matlab_proxy.util.mwi.embedded_connector.helpers import (
     get_mvm_endpoint,
 )
 
-from jupyter_matlab_kernel import mwi_logger
+from jupyter_matlab_kernel import kernel_settings, mwi_logger
+from jupyter_matlab_kernel.matlab_parser import split_into_sections
+from jupyter_matlab_kernel.mwi_logger import Truncated
 from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
 
 _logger = mwi_logger.get()
@@ -50,6 +57,22 @@ class MATLABStatus:
     matlab_root_path: str = ""
 
 
+def _is_undefined_function_fault(fault_message, fname):
+    """Checks whether an FEval request faulted because MATLAB could not find fname.
+
+    Args:
+        fault_message (str): Message of the fault in the FEval response
+        fname (str): Name of the MATLAB function called by the FEval request
+
+    Returns:
+        bool: True if MATLAB reported fname as an undefined function
+    """
+    return fname in fault_message and (
+        "Undefined function" in fault_message
+        or "Unrecognized function" in fault_message
+    )
+
+
 class MWICommHelper:
     def __init__(
         self, kernel_id, url, shell_loop, control_loop, headers=None, logger=_logger
@@ -73,6 +96,15 @@ class MWICommHelper:
         self._http_shell_client = None
         self._http_control_client = None
 
+        # Tracks whether the MATLAB code shipped with the kernel has been added to the
+        # MATLAB path. Adding it to the path on every request makes MATLAB rescan its
+        # path cache, hence it is added only until a request succeeds.
+        self._is_kernel_path_registered = False
+
+        # Directory into which MATLAB writes figures when the file figure transport
+        # is enabled. Created on first use and removed on disconnect.
+        self._figure_directory = None
+
     async def _create_http_session(self, loop):
         """Helper function to create a aiohttp ClientSession which uses a given asyncio event loop
 
@@ -85,11 +117,20 @@ class MWICommHelper:
         # Disable timeout as the execution of MATLAB code might be longer.
         timeout = aiohttp.ClientTimeout(total=None)
 
+        # Requests to a matlab-proxy on the same host can skip the TCP stack. The URL
+        # is still used to construct the HTTP requests, but not to open connections.
+        unix_socket = kernel_settings.get_matlab_proxy_unix_socket()
+        if unix_socket:
+            self.logger.debug(f"Connecting to matlab-proxy over socket: {unix_socket}")
+            connector = aiohttp.UnixConnector(path=unix_socket, loop=loop)
+        else:
+            connector = aiohttp.TCPConnector(ssl=False, loop=loop)
+
         # Creation of ClientSession needs to be done in an async function. We cannot
         # specify base url as it may contain additional path (such as in jupyterhub.com/user/matlab)
         # which is not supported by ClientSession
         return aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(ssl=False, loop=loop),
+            connector=connector,
             headers=self.headers,
             trust_env=True,
             timeout=timeout,
@@ -97,6 +138,10 @@ class MWICommHelper:
 
     async def connect(self):
         """Initializes the HTTP clients"""
+        # The MATLAB on the other end of a new connection may not have the kernel's
+        # MATLAB code on its path.
+        self.reset_kernel_path_registration()
+
         if self._http_shell_client is None:
             self._http_shell_client = await self._create_http_session(self._shell_loop)
 
@@ -105,11 +150,56 @@ class MWICommHelper:
                 self._control_loop
             )
 
+    def reset_kernel_path_registration(self):
+        """
+        Marks the MATLAB code shipped with the kernel as not being on the MATLAB path.
+        The path is registered again with the next request sent to MATLAB. This is
+        required when MATLAB is restarted or the kernel reconnects to matlab-proxy.
+        """
+        self._is_kernel_path_registered = False
+
     async def disconnect(self):
         if self._http_shell_client:
             await self._http_shell_client.close()
         if self._http_control_client:
             await self._http_control_client.close()
+        if self._figure_directory:
+            shutil.rmtree(self._figure_directory, ignore_errors=True)
+            self._figure_directory = None
+
+    def _is_figure_directory_shared(self):
+        """
+        Checks whether MATLAB can write into a directory created by the kernel. This
+        requires MATLAB to share the filesystem of the kernel, which is assumed when
+        matlab-proxy is reached over a Unix domain socket or a loopback address.
+
+        Returns:
+            bool: True if MATLAB runs on the host of the kernel.
+        """
+        if kernel_settings.get_matlab_proxy_unix_socket():
+            return True
+
+        hostname = urlparse(self.url).hostname
+        if hostname == "localhost":
+            return True
+        try:
+            return ipaddress.ip_address(hostname).is_loopback
+        except ValueError:
+            return False
+
+    def _get_figure_directory(self):
+        """
+        Gets the directory into which MATLAB writes figure files for this kernel.
+
+        Returns:
+            str: Path of the directory.
+        """
+        if self._figure_directory is None:
+            self._figure_directory = tempfile.mkdtemp(
+                prefix="jupyter_matlab_kernel_figures_"
+            )
+            self.logger.debug(f"Created figure directory: {self._figure_directory}")
+        return self._figure_directory
 
     async def fetch_matlab_root_path(self) -> Optional[str]:
         """
@@ -130,7 +220,7 @@ class MWICommHelper:
 
         if resp.status == http.HTTPStatus.OK:
             data = await resp.json()
-            self.logger.debug(f"get-env-config data:\n{data}")
+            self.logger.debug("get-env-config data:\n%s", Truncated(data))
             matlab_data = data.get("matlab") or {}
             return matlab_data.get("rootPath", None)
 
@@ -173,10 +263,10 @@ class MWICommHelper:
         """
         self.logger.debug("Fetching matlab-proxy status")
         resp = await self._http_shell_client.get(self.url + "/get_status")
-        self.logger.debug(f"Received status code: {resp.status}")
+        self.logger.debug("Received status code: %s", resp.status)
         if resp.status == http.HTTPStatus.OK:
             data = await resp.json()
-            self.logger.debug(f"matlab-proxy status:\n{data}")
+            self.logger.debug("matlab-proxy status:\n%s", Truncated(data))
             matlab_data = data.get("matlab") or {}
             return MATLABStatus(
                 is_matlab_licensed=check_licensing_status(data),
@@ -190,12 +280,14 @@ class MWICommHelper:
             resp.raise_for_status()
             return None
 
-    async def send_execution_request_to_matlab(self, code):
+    async def send_execution_request_to_matlab(self, code, options=None):
         """
         Evaluate MATLAB code and capture results.
 
         Args:
             code (string): MATLAB code to be evaluated
+            options (dict, optional): Options which control how MATLAB processes the
+                outputs. Passed to jupyter.execute as a JSON encoded struct.
 
         Returns:
             List(dict): list of outputs captured during evaluation.
@@ -204,10 +296,124 @@ class MWICommHelper:
             HTTPStatusError: Occurs when connection to matlab-proxy cannot be established.
         """
         self.logger.debug("Sending execution request to MATLAB")
-        return await self._send_jupyter_request_to_matlab(
-            "execute", [code, self.kernel_id], self._http_shell_client
+        options = self._get_execution_options(options)
+
+        inputs = [code, self.kernel_id]
+        if options:
+            inputs.append(json.dumps(options))
+
+        outputs = await self._send_jupyter_request_to_matlab(
+            "execute", inputs, self._http_shell_client
+        )
+        outputs = await self._process_raw_outputs(outputs, options)
+        return await self._load_figure_files(outputs, options)
+
+    def _get_execution_options(self, options):
+        """
+        Adds the options required by the kernel settings to the options of an
+        execution request.
+
+        Args:
+            options (dict): Options of the execution request. Can be None.
+
+        Returns:
+            dict: A copy of the options with the options required by the kernel settings.
+        """
+        options = dict(options or {})
+        if kernel_settings.is_workspace_completion_enabled():
+            # MATLAB reports the changes to its workspace, used for Tab completion.
+            options["workspaceSymbols"] = True
+        if kernel_settings.get_output_processing() == "kernel":
+            # MATLAB returns the outputs of the Live Editor API as is, along with
+            # the image data of figures, and the kernel converts them.
+            options["rawOutputs"] = True
+        elif kernel_settings.get_figure_transport() == "file":
+            if self._is_figure_directory_shared():
+                # MATLAB writes figures as binary files instead of embedding them
+                # as base64 into its JSON response.
+                options["figureDirectory"] = self._get_figure_directory()
+            else:
+                self.logger.debug(
+                    "matlab-proxy is not on the host of the kernel, figures are embedded in the response"
+                )
+        return options
+
+    async def _process_raw_outputs(self, outputs, options):
+        """
+        Converts the raw outputs of the Live Editor API returned by MATLAB into
+        Jupyter outputs.
+
+        Args:
+            outputs (List(dict)): list of outputs received from MATLAB.
+            options (dict): Options with which the outputs were requested.
+
+        Returns:
+            List(dict): list of outputs in the format expected by Jupyter.
+        """
+        if not options.get("rawOutputs"):
+            return outputs
+
+        from jupyter_matlab_kernel.outputs import process_raw_outputs
+
+        # Outputs may be large, convert them without blocking the event loop.
+        return await asyncio.get_running_loop().run_in_executor(
+            None, process_raw_outputs, outputs, self.logger
         )
 
+    async def _load_figure_files(self, outputs, options):
+        """
+        Replaces the figure files written by MATLAB with their image data.
+
+        Args:
+            outputs (List(dict)): list of outputs received from MATLAB.
+            options (dict): Options with which the outputs were requested.
+
+        Returns:
+            List(dict): list of outputs with the image data of each figure.
+        """
+        if "figureDirectory" not in options:
+            return outputs
+
+        from jupyter_matlab_kernel.outputs import load_figure_files
+
+        # Figures may be large, read them without blocking the event loop.
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            load_figure_files,
+            outputs,
+            options["figureDirectory"],
+            self.logger,
+        )
+
+    async def stream_execution_request_to_matlab(self, code, options=None):
+        """
+        Evaluate MATLAB code section by section and yield the results of each section
+        as soon as they are available. Evaluation stops after the first section which
+        produces an error, consistent with the evaluation of the whole code at once.
+
+        Args:
+            code (string): MATLAB code to be evaluated
+            options (dict, optional): Options which control how MATLAB processes the
+                outputs. Passed to jupyter.execute as a JSON encoded struct.
+
+        Yields:
+            List(dict): list of outputs captured during evaluation of a section.
+
+        Raises:
+            HTTPStatusError: Occurs when connection to matlab-proxy cannot be established.
+        """
+        sections = split_into_sections(code)
+        self.logger.debug(f"Streaming execution request in {len(sections)} section(s)")
+        for section in sections:
+            outputs = await self.send_execution_request_to_matlab(section, options)
+            yield outputs
+
+            if any(output and output.get("isError") for output in outputs):
+                self.logger.debug(
+                    "Section produced an error, skipping the remaining sections"
+                )
+                break
+
     async def send_completion_request_to_matlab(self, code, cursor_pos):
         """
         Fetch Tab completion results.
@@ -234,9 +440,44 @@ class MWICommHelper:
             HTTPError: Occurs when connection to matlab-proxy cannot be established.
         """
         self.logger.debug("Sending completion request to MATLAB")
-        return await self._send_jupyter_request_to_matlab(
-            "complete", [code, cursor_pos], self._http_shell_client
+        # MATLAB returns the completion data of its programming aids without
+        # processing it, so that the shared MATLAB interpreter is not blocked by
+        # the conversion of a large number of choices.
+        options = {"rawCompletionData": True}
+        completion_data = await self._send_jupyter_request_to_matlab(
+            "complete", [code, cursor_pos, json.dumps(options)], self._http_shell_client
         )
+        if not isinstance(completion_data, str):
+            # Errors in MATLAB are returned as a list of outputs.
+            return completion_data
+
+        from jupyter_matlab_kernel.completions.programming_aids import (
+            create_completion_results_from_programming_aids,
+        )
+
+        return create_completion_results_from_programming_aids(
+            completion_data, cursor_pos
+        )
+
+    async def send_inspect_request_to_matlab(self, names):
+        """
+        Fetch the help text of functions and classes.
+
+        Args:
+            names (List[string]): Names of the functions or classes.
+
+        Returns:
+            List[string]: Help text of each name. Empty if there is no help for a name.
+
+        Raises:
+            HTTPError: Occurs when connection to matlab-proxy cannot be established.
+        """
+        self.logger.debug("Sending inspect request for %s to MATLAB", names)
+        help_texts = await self._send_jupyter_request_to_matlab(
+            "inspect", [json.dumps(names)], self._http_shell_client
+        )
+        # MATLAB encodes a cell array with a single element as a string.
+        return [help_texts] if isinstance(help_texts, str) else help_texts
 
     async def send_shutdown_request_to_matlab(self):
         """
@@ -270,11 +511,11 @@ class MWICommHelper:
         }
         url = get_mvm_endpoint(self.url)
 
-        self.logger.debug(f"Request URL: {url}")
-        self.logger.debug(f"Request Headers:\n{self.headers}")
-        self.logger.debug(f"Request Body:\n{req_body}")
+        self.logger.debug("Request URL: %s", url)
+        self.logger.debug("Request Headers:\n%s", self.headers)
+        self.logger.debug("Request Body:\n%s", Truncated(req_body))
         resp = await self._http_control_client.post(url, json=req_body)
-        self.logger.debug(f"Received status code: {resp.status}")
+        self.logger.debug("Received status code: %s", resp.status)
         if resp.status != http.HTTPStatus.OK:
             self.logger.error("Error occurred during communication with matlab-proxy")
             resp.raise_for_status()
@@ -299,35 +540,41 @@ class MWICommHelper:
             Exception: If function execution fails or is interrupted by user
         """
         self.logger.debug("Sending FEval request to MATLAB")
-        # Add the MATLAB code shipped with kernel to the Path
-        path = [str(pathlib.Path(__file__).parent / "matlab")]
-        req_body = get_data_to_feval_mcode("addpath", *path, nargout=0)
-        original_request = get_data_to_feval_mcode(fname, *args, nargout=nargout)
-
-        # Add the FEval message of original request to the req_body FEval list.
-        req_body["messages"]["FEval"].append(original_request["messages"]["FEval"][0])
+        req_body = get_data_to_feval_mcode(fname, *args, nargout=nargout)
+
+        # Add the MATLAB code shipped with kernel to the Path, unless an earlier
+        # request in this session has already done so.
+        registers_kernel_path = not self._is_kernel_path_registered
+        if registers_kernel_path:
+            self.logger.debug("Adding the kernel's MATLAB code to the MATLAB path")
+            path = [str(pathlib.Path(__file__).parent / "matlab")]
+            addpath_request = get_data_to_feval_mcode("addpath", *path, nargout=0)
+            req_body["messages"]["FEval"].insert(
+                0, addpath_request["messages"]["FEval"][0]
+            )
 
         # Set the deque mode to make execution synchronous.
-        req_body["messages"]["FEval"][0]["dequeMode"] = "non_debug_prompt"
-        req_body["messages"]["FEval"][1]["dequeMode"] = "non_debug_prompt"
+        for feval_message in req_body["messages"]["FEval"]:
+            feval_message["dequeMode"] = "non_debug_prompt"
 
         url = get_mvm_endpoint(self.url)
 
-        self.logger.debug(f"Request URL: {url}")
-        self.logger.debug(f"Request Headers:\n{self.headers}")
-        self.logger.debug(f"Request Body:\n{req_body}")
+        self.logger.debug("Request URL: %s", url)
+        self.logger.debug("Request Headers:\n%s", self.headers)
+        self.logger.debug("Request Body:\n%s", Truncated(req_body))
 
         resp = await http_client.post(
             url,
             json=req_body,
         )
-        self.logger.debug(f"Received status code: {resp.status}")
+        self.logger.debug("Received status code: %s", resp.status)
         if resp.status == http.HTTPStatus.OK:
             response_data = await resp.json()
-            self.logger.debug(f"Response:\n{response_data}")
+            self.logger.debug("Response:\n%s", Truncated(response_data))
             try:
-                feval_response = response_data["messages"]["FEvalResponse"][1]
-            except KeyError:
+                # The response to the original request is always the last one.
+                feval_response = response_data["messages"]["FEvalResponse"][-1]
+            except (KeyError, IndexError):
                 # In certain cases when the HTTPResponse is received, it does not
                 # contain the expected data. In these cases most likely MATLAB has
                 # gone away. Hence we raise the HTTPError to indicate MATLAB is not
@@ -339,6 +586,7 @@ class MWICommHelper:
 
             # If the feval request succeeded and outputs are present, return the result.
             if not feval_response["isError"]:
+                self._is_kernel_path_registered = True
                 if nargout != 0 and feval_response["results"]:
                     return feval_response["results"][0]
 
@@ -347,13 +595,29 @@ class MWICommHelper:
                 return []
 
             # Handle error case. This happens when "Interrupt Kernel" is issued.
-            if feval_response["messageFaults"][0]["message"] == "":
+            fault_message = feval_response["messageFaults"][0]["message"]
+            if not registers_kernel_path and _is_undefined_function_fault(
+                fault_message, fname
+            ):
+                # MATLAB does not find the kernel's MATLAB code when it has been
+                # restarted since the path was registered. The request was not run,
+                # so register the path and retry the request once. Other faults are
+                # not retried, as the request may already have been run by MATLAB.
+                self.logger.debug(
+                    f"FEval request failed without registering the kernel path, retrying:\n{fault_message}"
+                )
+                self.reset_kernel_path_registration()
+                return await self._send_feval_request_to_matlab(
+                    http_client, fname, nargout, *args
+                )
+
+            if fault_message == "":
                 error_message = (
                     "Failed to execute. Operation may have interrupted by user."
                 )
             else:
                 self.logger.error(
-                    f"Error during execution of FEval request in MATLAB:\n{feval_response['messageFaults'][0]['message']}"
+                    f"Error during execution of FEval request in MATLAB:\n{fault_message}"
                 )
                 error_message = "Failed to execute. Please try again."
             raise Exception(error_message)
@@ -392,24 +656,26 @@ class MWICommHelper:
             HTTPError: If there is an error in communication with matlab-proxy
         """
         self.logger.debug("Sending Eval request to MATLAB")
-        # Add the MATLAB code shipped with kernel to the Path
-        path = str(pathlib.Path(__file__).parent / "matlab")
-        mcode = 'addpath("' + path + '")' + ";" + mcode
+        # Add the MATLAB code shipped with kernel to the Path, unless an earlier
+        # request in this session has already done so.
+        if not self._is_kernel_path_registered:
+            path = str(pathlib.Path(__file__).parent / "matlab")
+            mcode = 'addpath("' + path + '")' + ";" + mcode
 
         req_body = get_data_to_eval_mcode(mcode)
         url = get_mvm_endpoint(self.url)
 
-        self.logger.debug(f"Request URL: {url}")
-        self.logger.debug(f"Request Headers:\n{self.headers}")
-        self.logger.debug(f"Request Body:\n{req_body}")
+        self.logger.debug("Request URL: %s", url)
+        self.logger.debug("Request Headers:\n%s", self.headers)
+        self.logger.debug("Request Body:\n%s", Truncated(req_body))
         resp = await http_client.post(
             url,
             json=req_body,
         )
-        self.logger.debug(f"Received status code: {resp.status}")
+        self.logger.debug("Received status code: %s", resp.status)
         if resp.status == http.HTTPStatus.OK:
             response_data = await resp.json()
-            self.logger.debug(f"Response:\n{response_data}")
+            self.logger.debug("Response:\n%s", Truncated(response_data))
             try:
                 eval_response = response_data["messages"]["EvalResponse"][0]
 
@@ -423,6 +689,8 @@ class MWICommHelper:
                 )
                 raise MATLABConnectionError()
 
+            if not eval_response["isError"]:
+                self._is_kernel_path_registered = True
             return eval_response
 
         else:
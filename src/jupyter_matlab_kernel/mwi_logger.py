@@ -1,8 +1,14 @@
-# Copyright 2024 The MathWorks, Inc.
+# Copyright 2024-2026 The MathWorks, Inc.
 # Helper functions to access & control the logging behavior of the app
 
 import logging
 import os
+import random
+
+# Limits applied when formatting values with Truncated. Request and response bodies
+# may contain megabytes of base64 encoded figure data.
+_DEFAULT_MAX_FIELD_LENGTH = 256
+_DEFAULT_MAX_LENGTH = 4096
 
 
 def get(init=False):
@@ -58,6 +64,86 @@ def __set_logging_configuration():
     return logger
 
 
+class Truncated:
+    """Wraps a value which is formatted for logging only when the message is emitted.
+
+    Strings nested in dicts, lists and tuples are shortened to max_field_length
+    characters and the formatted value is shortened to max_length characters.
+
+    Example:
+        logger.debug("Response:\n%s", Truncated(response_data))
+    """
+
+    __slots__ = ("value", "max_field_length", "max_length")
+
+    def __init__(
+        self,
+        value,
+        max_field_length=_DEFAULT_MAX_FIELD_LENGTH,
+        max_length=_DEFAULT_MAX_LENGTH,
+    ):
+        self.value = value
+        self.max_field_length = max_field_length
+        self.max_length = max_length
+
+    def __str__(self):
+        text = str(self._truncate_fields(self.value))
+        return _truncate_string(text, self.max_length)
+
+    __repr__ = __str__
+
+    def _truncate_fields(self, value):
+        if isinstance(value, str):
+            return _truncate_string(value, self.max_field_length)
+        if isinstance(value, dict):
+            return {key: self._truncate_fields(val) for key, val in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(self._truncate_fields(val) for val in value)
+        return value
+
+
+def _truncate_string(text, max_length):
+    """Shortens text to max_length characters and notes the number of omitted characters"""
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}...<{len(text) - max_length} more characters>"
+
+
+def debug_sampled(logger, msg, *args):
+    """Logs a debug message for a fraction of the calls given by the sample rate.
+        Use it for messages on hot paths, such as those logged for every output of a cell.
+        The arguments are formatted only if the message is emitted.
+
+    Args:
+        logger (Logger): Logger used to log the message.
+        msg (str): Message with %-style placeholders.
+        *args: Arguments for the placeholders in msg.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    sample_rate = get_log_sample_rate()
+    if sample_rate >= 1 or random.random() < sample_rate:
+        logger.debug(msg, *args)
+
+
+def get_log_sample_rate():
+    """Fraction of the hot path debug messages which are logged.
+
+    Returns:
+        float: The sample rate between 0 and 1. Defaults to 1, which logs all messages.
+    """
+    try:
+        sample_rate = float(os.getenv(__get_env_name_log_sample_rate(), "1"))
+    except ValueError:
+        return 1.0
+    return min(max(sample_rate, 0.0), 1.0)
+
+
+def __get_env_name_log_sample_rate():
+    """Specifies the fraction of the hot path debug messages which are logged"""
+    return "MWI_JUPYTER_LOG_SAMPLE_RATE"
+
+
 def __get_env_name_logging_level():
     """Specifies the logging level used by app's loggers"""
     return "MWI_JUPYTER_LOG_LEVEL"
@@ -0,0 +1,7 @@
+# Copyright 2026 The MathWorks, Inc.
+
+from .budget import OutputBudget
+from .editor import process_raw_outputs
+from .figures import load_figure_files
+from .images import ImageOptimizer
+from .streams import coalesce_stream_outputs, collapse_repeated_messages
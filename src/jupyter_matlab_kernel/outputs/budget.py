@@ -0,0 +1,142 @@
+# Copyright 2026 The MathWorks, Inc.
+# Limit on the size of the outputs displayed for a single cell
+
+from pathlib import Path
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+# Outputs which are not displayed and hence do not count towards the budget
+_HIDDEN_OUTPUT_TYPES = {"workspace"}
+
+
+class OutputBudget:
+    """
+    Limits the size of the outputs which are displayed for a cell. Outputs beyond
+    the limit are appended to a spill file as text instead of being sent to Jupyter,
+    so that large outputs do not slow down the frontend or bloat the notebook file.
+    The spill file is written as outputs arrive, so that the outputs do not need
+    to be kept in memory.
+
+    Errors are always displayed, as they are needed to understand why code failed.
+    """
+
+    def __init__(self, max_size, spill_file, logger=_logger):
+        """
+        Args:
+            max_size (int): Maximum number of characters displayed for the cell.
+            spill_file (str): Path of the spill file. The file is created, or
+                overwritten, when the first output is spilled.
+            logger (Logger, optional): Instance of Logger. Defaults to _logger.
+        """
+        self._remaining_size = max_size
+        self.spill_file = Path(spill_file)
+        self._logger = logger
+        self._is_spill_file_written = True
+        self.spilled_size = 0
+
+    def apply(self, outputs):
+        """
+        Selects the outputs which fit into the remaining budget and spills the rest.
+
+        Args:
+            outputs (list): Outputs received from MATLAB.
+
+        Returns:
+            list: The outputs to display.
+        """
+        displayed_outputs = []
+        spilled_texts = []
+        for output in outputs:
+            if not output or output.get("type") in _HIDDEN_OUTPUT_TYPES:
+                displayed_outputs.append(output)
+                continue
+
+            if output.get("type") == "stream":
+                text = output["content"]["text"]
+                if output.get("isError") or len(text) <= self._remaining_size:
+                    self._remaining_size -= min(len(text), self._remaining_size)
+                    displayed_outputs.append(output)
+                    continue
+                # Show as much of the stream as fits and spill the rest.
+                if self._remaining_size > 0:
+                    displayed_outputs.append(
+                        {
+                            "type": "stream",
+                            "content": {
+                                "name": output["content"]["name"],
+                                "text": text[: self._remaining_size],
+                            },
+                        }
+                    )
+                    text = text[self._remaining_size :]
+                    self._remaining_size = 0
+                spilled_texts.append(text)
+                continue
+
+            size = _get_output_size(output)
+            if size <= self._remaining_size:
+                self._remaining_size -= size
+                displayed_outputs.append(output)
+            else:
+                self._remaining_size = 0
+                spilled_texts.append(_get_output_text(output))
+
+        if spilled_texts:
+            self._spill("".join(spilled_texts))
+        return displayed_outputs
+
+    def get_notice(self):
+        """
+        Creates the output which tells the user that outputs were not displayed.
+
+        Returns:
+            dict: A stream output with the size and location of the spilled output.
+                None if no output was spilled.
+        """
+        if not self.spilled_size:
+            return None
+        size_in_mb = self.spilled_size / (1024 * 1024)
+        location = (
+            self.spill_file
+            if self._is_spill_file_written
+            else "a file, which could not be written"
+        )
+        return {
+            "type": "stream",
+            "content": {
+                "name": "stderr",
+                "text": f"Output truncated, {size_in_mb:.1f} MB more in {location}\n",
+            },
+        }
+
+    def _spill(self, text):
+        """Appends text to the spill file, which is overwritten on first use"""
+        is_first_spill = not self.spilled_size
+        self.spilled_size += len(text)
+        try:
+            if is_first_spill:
+                self.spill_file.parent.mkdir(parents=True, exist_ok=True)
+                self._logger.debug("Spilling outputs to %s", self.spill_file)
+            with open(
+                self.spill_file, "w" if is_first_spill else "a", encoding="utf-8"
+            ) as f:
+                f.write(text)
+        except OSError as e:
+            self._is_spill_file_written = False
+            self._logger.error("Unable to write outputs to spill file: %s", e)
+
+
+def _get_output_size(output):
+    """Gets the number of characters of the values of an output"""
+    return sum(len(str(value)) for value in output.get("value") or [])
+
+
+def _get_output_text(output):
+    """Gets the text of an output which is written to the spill file"""
+    values = dict(zip(output.get("mimetype") or [], output.get("value") or []))
+    if "text/plain" in values:
+        return f"{values['text/plain']}\n"
+    mimetypes = ", ".join(values) or output.get("type", "unknown")
+    return f"<{mimetypes} output not shown>\n"
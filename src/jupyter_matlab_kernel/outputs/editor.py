@@ -0,0 +1,164 @@
+# Copyright 2026 The MathWorks, Inc.
+# Conversion of the raw outputs of the Live Editor API into Jupyter outputs
+
+import json
+import re
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+_FIGURE_IMAGE_PATTERN = re.compile(
+    r"data:(?P<mimetype>.*);base64,(?P<value>.*)", re.DOTALL
+)
+
+
+def process_raw_outputs(outputs, logger=_logger):
+    """
+    Replaces the raw outputs which MATLAB returns when the kernel processes the
+    outputs with the outputs expected by Jupyter. The conversion is consistent
+    with processOutputs in +jupyter/execute.m. Other outputs are kept as is.
+
+    Args:
+        outputs (list): Outputs received from MATLAB.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+
+    Returns:
+        list: The outputs with the converted outputs of the Live Editor API in
+            place of each raw output.
+    """
+    processed_outputs = []
+    for output in outputs:
+        if not output or output.get("type") != "raw_outputs":
+            processed_outputs.append(output)
+            continue
+
+        editor_outputs = json.loads(output["content"]).get("outputs") or []
+        if isinstance(editor_outputs, dict):
+            editor_outputs = [editor_outputs]
+        processed_outputs.extend(process_editor_outputs(editor_outputs, logger))
+    return processed_outputs
+
+
+def process_editor_outputs(editor_outputs, logger=_logger):
+    """
+    Converts the outputs of the Live Editor API into Jupyter outputs.
+
+    Args:
+        editor_outputs (list): Outputs of the Live Editor API.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+
+    Returns:
+        list: Jupyter outputs, in the order of the Live Editor outputs.
+    """
+    results = [None] * len(editor_outputs)
+    figure_positions = {}
+
+    for idx, editor_output in enumerate(editor_outputs):
+        output_type = editor_output.get("type")
+        output_data = editor_output.get("outputData")
+
+        if output_type == "figure":
+            # A 'figure' output may be a placeholder for an image which follows in
+            # a later output. The image is shown at the position of its placeholder
+            # to preserve the ordering of the outputs.
+            if "figurePlaceHolderId" in output_data:
+                figure_positions.setdefault(output_data["figurePlaceHolderId"], idx)
+            elif "figureImage" in output_data:
+                position = figure_positions.get(output_data.get("figureId"), idx)
+                results[position] = _process_figure(output_data["figureImage"], logger)
+            continue
+
+        processor = _OUTPUT_PROCESSORS.get(output_type)
+        if processor is not None:
+            results[idx] = processor(output_data)
+
+    return [result for result in results if result is not None]
+
+
+def _process_text(text):
+    """
+    Creates the output of a 'matrix', 'variable' or 'variableString'. These outputs
+    are of HTML type due to HTML tags used in MATLAB outputs, such as the <strong>
+    tag in tables.
+    """
+    return {
+        "type": "execute_result",
+        "mimetype": ["text/html", "text/plain"],
+        "value": [f"<html><body><pre>{text}</pre></body></html>", text],
+    }
+
+
+def _process_matrix(output):
+    text = f"{output['name']} = {output['header']} {output['type']}\n{output['value']}"
+    if output["rows"] > 10 or output["columns"] > 30:
+        text += "..."
+    return _process_text(text)
+
+
+def _process_variable(output):
+    indentation = "\n    " if output["header"] else ""
+    return _process_text(
+        f"{output['name']} = {output['header']}{indentation}{output['value']}"
+    )
+
+
+def _process_variable_string(output):
+    indentation = "\n" if output["header"] or "\n" in output["value"] else ""
+    return _process_text(
+        f"{output['name']} = {output['header']}{indentation}{output['value']}"
+    )
+
+
+def _process_symbolic(output):
+    # MATLAB converts outputs with symbolic results itself. The MathML is embedded
+    # into HTML if such an output reaches the kernel.
+    return _process_text(output["value"])
+
+
+def _process_stream(stream, text):
+    return {"type": "stream", "content": {"name": stream, "text": text}}
+
+
+def _process_error(text):
+    # Errors are flagged so that the kernel can identify code which failed.
+    return {**_process_stream("stderr", text), "isError": True}
+
+
+def _process_warning(text):
+    # Warnings are flagged so that the kernel can collapse repeated warnings.
+    return {**_process_stream("stderr", text), "isWarning": True}
+
+
+def _process_figure(figure_image, logger):
+    """Creates the output of a figure from its data URL"""
+    match = _FIGURE_IMAGE_PATTERN.match(figure_image)
+    if not match or not match["mimetype"].startswith("image") or not match["value"]:
+        logger.error("Ignoring figure output without image data")
+        return None
+    return {
+        "type": "execute_result",
+        "mimetype": [match["mimetype"]],
+        "value": [match["value"]],
+    }
+
+
+def _process_html(text):
+    return {
+        "type": "execute_result",
+        "mimetype": ["text/html", "text/plain"],
+        "value": [text, text],
+    }
+
+
+_OUTPUT_PROCESSORS = {
+    "matrix": _process_matrix,
+    "variable": _process_variable,
+    "variableString": _process_variable_string,
+    "symbolic": _process_symbolic,
+    "error": lambda output: _process_error(output["text"]),
+    "warning": lambda output: _process_warning(output["text"]),
+    "text": lambda output: _process_stream("stdout", output["text"]),
+    "stderr": lambda output: _process_stream("stderr", output["text"]),
+    "text/html": _process_html,
+}
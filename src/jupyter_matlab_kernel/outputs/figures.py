@@ -0,0 +1,67 @@
+# Copyright 2026 The MathWorks, Inc.
+# Helper functions to process figure outputs received from MATLAB
+
+import base64
+import os
+from pathlib import Path
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+
+def load_figure_files(outputs, figure_directory, logger=_logger):
+    """
+    Replaces the figure files written by MATLAB with the base64 encoded image data
+    expected by Jupyter. The files are deleted after they are read.
+
+    MATLAB writes figures as binary files into figure_directory when the file figure
+    transport is enabled. The corresponding outputs contain the path of the file in
+    the "file" field and an empty value. Files which are left in figure_directory
+    belong to figures which MATLAB rendered again, and are deleted as well.
+
+    Args:
+        outputs (list): Outputs received from MATLAB. Modified in place.
+        figure_directory (str): Directory into which MATLAB writes figure files.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+
+    Returns:
+        list: The outputs with the image data of each figure file.
+    """
+    figure_directory = Path(figure_directory).resolve()
+    for idx, output in enumerate(outputs):
+        if not output or "file" not in output:
+            continue
+
+        figure_file = Path(output.pop("file")).resolve()
+
+        # Only read files from the directory which was handed to MATLAB. Figures
+        # which cannot be read are replaced by an empty output, which is not displayed.
+        if figure_file.parent != figure_directory:
+            logger.error(f"Ignoring figure file outside of {figure_directory}")
+            outputs[idx] = {}
+            continue
+
+        try:
+            image_data = figure_file.read_bytes()
+        except OSError as e:
+            logger.error(f"Unable to read figure file {figure_file}: {e}")
+            outputs[idx] = {}
+            continue
+
+        output["value"] = [base64.b64encode(image_data).decode("ascii")]
+        logger.debug(f"Loaded {len(image_data)} bytes from figure file {figure_file}")
+
+        try:
+            os.remove(figure_file)
+        except OSError:
+            logger.error(f"Deleting figure file {figure_file} failed")
+
+    # Only the last rendering of a figure is returned by MATLAB.
+    for superseded_file in figure_directory.iterdir():
+        try:
+            superseded_file.unlink()
+        except OSError:
+            logger.error(f"Deleting figure file {superseded_file} failed")
+
+    return outputs
@@ -0,0 +1,378 @@
+# Copyright 2026 The MathWorks, Inc.
+# Conversion and optimization of the PNG images of figures in worker processes
+
+import asyncio
+import base64
+import io
+import multiprocessing
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple, Optional
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Number of worker processes which optimize images. Cells rarely display more
+# than a few figures, and each worker is a separate Python process.
+_MAX_WORKERS = min(2, os.cpu_count() or 1)
+
+
+class ImagePreset(NamedTuple):
+    """Optimizations applied to the images of figures"""
+
+    # Images which are wider are scaled down to this width. None to keep the size.
+    max_width: Optional[int]
+    # Whether the colors of images are reduced to a palette of at most 256 colors
+    quantize: bool
+
+
+IMAGE_OPTIMIZATION_PRESETS = {
+    # Recompresses images without changing their pixels
+    "lossless": ImagePreset(max_width=None, quantize=False),
+    # Also scales down images which are wider than a typical notebook
+    "balanced": ImagePreset(max_width=1600, quantize=False),
+    # Also reduces the colors of images to a palette
+    "small": ImagePreset(max_width=1000, quantize=True),
+}
+
+# Chunks which describe the color space of an image, kept when images are
+# re-encoded. Other ancillary chunks, such as text and timestamps, are dropped.
+_COLOR_SPACE_CHUNKS = {b"gAMA", b"cHRM", b"sRGB", b"iCCP"}
+
+# Chunks kept when only the image data is recompressed
+_LOSSLESS_CHUNKS = _COLOR_SPACE_CHUNKS | {b"PLTE", b"tRNS", b"sBIT", b"pHYs"}
+
+# Quality of the JPEG images of figures converted by the figure magic
+_JPEG_QUALITY = 90
+
+
+class ImageOptimizer:
+    """
+    Converts and optimizes the PNG images of figure outputs in a pool of worker
+    processes, so that decoding and compressing images neither blocks the event loop
+    of the kernel nor competes with it for the global interpreter lock. The pool is
+    started on first use.
+    """
+
+    def __init__(self, max_workers=_MAX_WORKERS, logger=_logger):
+        """
+        Args:
+            max_workers (int, optional): Number of worker processes.
+            logger (Logger, optional): Instance of Logger. Defaults to _logger.
+        """
+        self._max_workers = max_workers
+        self._logger = logger
+        self._executor = None
+
+    async def optimize_outputs(self, outputs, preset, figure_settings=None):
+        """
+        Replaces the PNG images of figure outputs with converted and optimized images.
+
+        Args:
+            outputs (list): Outputs received from MATLAB. Modified in place.
+            preset (str): Name of a preset in IMAGE_OPTIMIZATION_PRESETS. None to
+                only convert the images.
+            figure_settings (dict, optional): Figure settings of the kernel, to
+                which the images are converted.
+
+        Returns:
+            int: The size in bytes of the images before the optimization.
+            int: The size in bytes of the images after the optimization.
+        """
+        images = []
+        for output in outputs:
+            if not output or output.get("type") != "execute_result":
+                continue
+            mimetypes = output.get("mimetype") or []
+            if "image/png" in mimetypes:
+                images.append((output, mimetypes.index("image/png")))
+        if not images:
+            return 0, 0
+
+        if self._executor is None:
+            self._logger.debug("Starting %s image optimizer(s)", self._max_workers)
+            # Worker processes are spawned, as forking a process which runs threads
+            # is not safe.
+            self._executor = ProcessPoolExecutor(
+                self._max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._executor,
+                    _process_figure,
+                    output["value"][idx],
+                    preset,
+                    figure_settings,
+                    output.get("screenPixelsPerInch"),
+                )
+                for output, idx in images
+            ),
+            return_exceptions=True,
+        )
+
+        size = optimized_size = 0
+        for (output, idx), result in zip(images, results):
+            if isinstance(result, BaseException):
+                self._logger.error("Unable to optimize figure: %r", result)
+                if isinstance(result, BrokenProcessPool):
+                    # Start a new pool for the next images.
+                    self.shutdown()
+                continue
+            image_data, mimetype, image_size, optimized_image_size = result
+            output["value"][idx] = image_data
+            output["mimetype"][idx] = mimetype
+            size += image_size
+            optimized_size += optimized_image_size
+        return size, optimized_size
+
+    def shutdown(self):
+        """Stops the worker processes. They are started again when needed."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def _process_figure(image_data, preset, figure_settings, screen_ppi):
+    """
+    Converts the PNG image of a figure to the figure settings, and optimizes it
+    if it is still a PNG image.
+
+    Returns:
+        str: The base64 encoded image.
+        str: The mimetype of the image.
+        int: The size of the image received from MATLAB in bytes.
+        int: The size of the returned image in bytes.
+    """
+    size = len(base64.b64decode(image_data))
+    mimetype = "image/png"
+    if figure_settings:
+        image_data, mimetype = convert_figure(image_data, figure_settings, screen_ppi)
+    if preset and mimetype == "image/png":
+        image_data, _, _ = optimize_png(image_data, preset)
+    return image_data, mimetype, size, len(base64.b64decode(image_data))
+
+
+def convert_figure(image_data, figure_settings, screen_ppi=None):
+    """
+    Converts the PNG image of a figure to the format, resolution and maximum size
+    of the figure settings. Figures are only scaled down, and are resampled so that
+    their thin lines stay visible. The image is returned as is if Pillow is not
+    installed or the image cannot be decoded.
+
+    Args:
+        image_data (str): The base64 encoded PNG image.
+        figure_settings (dict): Figure settings with the optional fields format,
+            dpi, maxWidth and maxHeight.
+        screen_ppi (float, optional): Resolution at which MATLAB rendered the figure.
+            The dpi setting is ignored if it is not known.
+
+    Returns:
+        str: The base64 encoded image.
+        str: The mimetype of the image.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return image_data, "image/png"
+
+    figure_format = figure_settings.get("format", "png")
+    try:
+        with Image.open(io.BytesIO(base64.b64decode(image_data))) as image:
+            image = _to_rgb(image)
+    except (OSError, ValueError):
+        return image_data, "image/png"
+
+    width, height = image.size
+    scale = 1
+    if "dpi" in figure_settings and screen_ppi:
+        scale = min(scale, figure_settings["dpi"] / screen_ppi)
+    if "maxWidth" in figure_settings:
+        scale = min(scale, figure_settings["maxWidth"] / width)
+    if "maxHeight" in figure_settings:
+        scale = min(scale, figure_settings["maxHeight"] / height)
+    if scale >= 1 and figure_format == "png":
+        return image_data, "image/png"
+
+    if scale < 1:
+        scaled_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        image = image.resize(scaled_size, Image.Resampling.LANCZOS)
+
+    buffer = io.BytesIO()
+    if figure_format == "jpeg":
+        if image.mode == "RGBA":
+            # JPEG images have no alpha channel, show the figure on white.
+            background = Image.new("RGBA", image.size, "white")
+            image = Image.alpha_composite(background, image)
+        image.convert("RGB").save(buffer, "JPEG", quality=_JPEG_QUALITY, optimize=True)
+    else:
+        image.save(buffer, "PNG", optimize=True)
+    converted_data = base64.b64encode(buffer.getvalue()).decode("ascii")
+    return converted_data, f"image/{figure_format}"
+
+
+def optimize_png(image_data, preset):
+    """
+    Reduces the size of a PNG image. The recompressed image and, if the preset
+    changes the pixels, the re-encoded image are compared with the image, and the
+    smallest of them is returned. The image is returned as is if it is not a PNG
+    image or cannot be decoded.
+
+    Runs in a worker process, hence the image is passed and returned base64 encoded
+    so that the kernel does not need to encode or decode it.
+
+    Args:
+        image_data (str): The base64 encoded image.
+        preset (str): Name of a preset in IMAGE_OPTIMIZATION_PRESETS.
+
+    Returns:
+        str: The base64 encoded optimized image.
+        int: The size of the image in bytes.
+        int: The size of the optimized image in bytes.
+    """
+    png = base64.b64decode(image_data)
+    candidates = [png]
+    try:
+        chunks = _read_chunks(png)
+        if not chunks or chunks[0][0] != b"IHDR":
+            raise ValueError("The image has no header")
+        candidates.append(_recompress_png(chunks))
+        candidates.extend(_reduce_png(png, chunks, IMAGE_OPTIMIZATION_PRESETS[preset]))
+    except (ValueError, OSError, struct.error, zlib.error):
+        # Pillow raises an OSError for images which it cannot decode.
+        pass
+
+    optimized_png = min(candidates, key=len)
+    if optimized_png is png:
+        return image_data, len(png), len(png)
+    optimized_data = base64.b64encode(optimized_png).decode("ascii")
+    return optimized_data, len(png), len(optimized_png)
+
+
+def _recompress_png(chunks):
+    """Recompresses the image data, which keeps the pixels and the filters"""
+    image_data = zlib.decompress(
+        b"".join(body for name, body in chunks if name == b"IDAT")
+    )
+    kept_chunks = [chunk for chunk in chunks if chunk[0] in _LOSSLESS_CHUNKS]
+    return _write_png(
+        [chunks[0], *kept_chunks, (b"IDAT", _compress(image_data)), (b"IEND", b"")]
+    )
+
+
+def _reduce_png(png, chunks, preset):
+    """
+    Scales down and quantizes the PNG image given as bytes with Pillow.
+
+    Returns:
+        list: The re-encoded images, the scaled image followed by the quantized
+            image. Empty if the preset keeps the pixels of the image or Pillow
+            is not installed.
+    """
+    if preset.max_width is None and not preset.quantize:
+        return []
+    try:
+        from PIL import Image
+    except ImportError:
+        return []
+
+    with Image.open(io.BytesIO(png)) as image:
+        image = _to_rgb(image)
+
+    width, height = image.size
+    if preset.max_width is not None and width > preset.max_width:
+        # Resampling, unlike picking pixels, keeps the thin lines of plots visible.
+        scaled_height = max(1, round(height * preset.max_width / width))
+        image = image.resize(
+            (preset.max_width, scaled_height), Image.Resampling.LANCZOS
+        )
+
+    color_space_chunks = [chunk for chunk in chunks if chunk[0] in _COLOR_SPACE_CHUNKS]
+    reduced_images = [_encode_png(image, color_space_chunks)]
+    if preset.quantize and image.mode == "RGB":
+        reduced_images.append(_encode_png(_quantize(image), color_space_chunks))
+    return reduced_images
+
+
+def _to_rgb(image):
+    """
+    Converts a Pillow image to an RGB image, or to an RGBA image if it has
+    transparent pixels.
+    """
+    if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+        image = image.convert("RGBA")
+        if image.getextrema()[3] == (255, 255):
+            # The image has an alpha channel without transparency.
+            image = image.convert("RGB")
+        return image
+    return image.convert("RGB")
+
+
+def _quantize(image):
+    """
+    Converts an RGB image to a palette image. Figures usually have few colors,
+    which are kept exactly. Other images are dithered with a palette of their most
+    frequent colors, so that gradients such as those of surface plots show no bands.
+    """
+    from PIL import Image
+
+    colors = image.getcolors(256)
+    if colors is not None:
+        # Median cut yields a palette entry for each color when there are no more
+        # entries than colors.
+        return image.quantize(len(colors))
+
+    palette = image.quantize(256)
+    return image.quantize(palette=palette, dither=Image.Dither.FLOYDSTEINBERG)
+
+
+def _encode_png(image, color_space_chunks):
+    """Encodes a Pillow image as PNG with the color space chunks of the original"""
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG", optimize=True)
+    chunks = [
+        chunk
+        for chunk in _read_chunks(buffer.getvalue())
+        if chunk[0] not in _COLOR_SPACE_CHUNKS
+    ]
+    return _write_png([chunks[0], *color_space_chunks, *chunks[1:]])
+
+
+def _read_chunks(png):
+    """Splits a PNG image into a list of (chunk type, chunk data) tuples"""
+    if not png.startswith(PNG_SIGNATURE):
+        raise ValueError("The image is not a PNG image")
+
+    chunks = []
+    offset = len(PNG_SIGNATURE)
+    while offset < len(png):
+        length, name = struct.unpack_from(">I4s", png, offset)
+        body = png[offset + 8 : offset + 8 + length]
+        if len(body) != length:
+            raise ValueError("The image is truncated")
+        chunks.append((name, body))
+        offset += length + 12
+        if name == b"IEND":
+            break
+    return chunks
+
+
+def _write_png(chunks):
+    """Joins a list of (chunk type, chunk data) tuples into a PNG image"""
+    parts = [PNG_SIGNATURE]
+    for name, body in chunks:
+        crc = zlib.crc32(body, zlib.crc32(name))
+        parts.extend((struct.pack(">I", len(body)), name, body, struct.pack(">I", crc)))
+    return b"".join(parts)
+
+
+def _compress(data):
+    """Compresses the image data with the highest compression level"""
+    return zlib.compress(data, 9)
@@ -0,0 +1,134 @@
+# Copyright 2026 The MathWorks, Inc.
+# Helper functions to reduce the number of stream outputs sent to Jupyter
+
+import re
+
+# Maximum number of characters merged into a single stream output, so that large
+# outputs are still shown in parts by the frontend.
+MAX_COALESCED_STREAM_SIZE = 64 * 1024
+
+# Numbers in warnings, which can be ignored when warnings are compared
+_NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
+
+
+def coalesce_stream_outputs(outputs, max_size=MAX_COALESCED_STREAM_SIZE):
+    """
+    Merges adjacent stream outputs of the same stream into a single output, so that
+    code which prints many lines, for example disp in a loop, is displayed with a
+    few messages instead of one message per line. The order of the outputs is
+    preserved. Empty outputs are dropped.
+
+    Args:
+        outputs (list): Outputs received from MATLAB.
+        max_size (int, optional): Maximum number of characters of a merged output.
+            Outputs which are larger on their own are not split.
+
+    Returns:
+        list: The outputs with adjacent stream outputs merged.
+    """
+    coalesced_outputs = []
+    # Stream outputs which are merged into the next output
+    pending_outputs = []
+    pending_size = 0
+
+    def flush():
+        if len(pending_outputs) == 1:
+            coalesced_outputs.append(pending_outputs[0])
+        elif pending_outputs:
+            merged_output = {
+                "type": "stream",
+                "content": {
+                    "name": pending_outputs[0]["content"]["name"],
+                    "text": "".join(
+                        output["content"]["text"] for output in pending_outputs
+                    ),
+                },
+            }
+            # Errors are flagged so that the kernel can identify code which failed.
+            if any(output.get("isError") for output in pending_outputs):
+                merged_output["isError"] = True
+            coalesced_outputs.append(merged_output)
+        pending_outputs.clear()
+
+    for output in outputs:
+        if not output:
+            continue
+        if output.get("type") != "stream":
+            flush()
+            coalesced_outputs.append(output)
+            continue
+
+        text_size = len(output["content"]["text"])
+        if pending_outputs and (
+            pending_outputs[0]["content"]["name"] != output["content"]["name"]
+            or pending_size + text_size > max_size
+        ):
+            flush()
+        if not pending_outputs:
+            pending_size = 0
+        pending_outputs.append(output)
+        pending_size += text_size
+
+    flush()
+    return coalesced_outputs
+
+
+def collapse_repeated_messages(outputs, ignore_numbers=False):
+    """
+    Collapses repeated warnings, such as the same warning issued in every iteration
+    of a loop. Only the first occurrence of a warning is kept, with the number of
+    repeats appended to it. Only the outputs which MATLAB flags as warnings are
+    collapsed, so that text printed to stderr, for example with fprintf, errors and
+    stdout outputs are kept as they are.
+
+    Args:
+        outputs (list): Outputs received from MATLAB.
+        ignore_numbers (bool, optional): Whether warnings which differ only in their
+            numbers, such as iteration counts or line numbers, are treated as
+            repeats. Defaults to False, in which only identical warnings are repeats.
+
+    Returns:
+        list: The outputs without repeated warnings.
+    """
+    collapsed_outputs = []
+    # Position of the first occurrence, number of repeats and whether all repeats
+    # are identical, keyed by the warning, without its numbers if they are ignored
+    messages = {}
+
+    for output in outputs:
+        if not output or not output.get("isWarning"):
+            collapsed_outputs.append(output)
+            continue
+
+        text = output["content"]["text"]
+        key = text.rstrip("\n")
+        if ignore_numbers:
+            key = _NUMBER_PATTERN.sub("#", key)
+        message = messages.get(key)
+        if message is None:
+            messages[key] = [len(collapsed_outputs), 0, True]
+            collapsed_outputs.append(output)
+            continue
+
+        message[1] += 1
+        if message[2] and text != collapsed_outputs[message[0]]["content"]["text"]:
+            message[2] = False
+
+    for index, repeats, is_identical in messages.values():
+        if not repeats:
+            continue
+        first_output = collapsed_outputs[index]
+        text = first_output["content"]["text"]
+        separator = "" if text.endswith("\n") else "\n"
+        times = "time" if repeats == 1 else "times"
+        note = f"(Repeated {repeats} more {times}"
+        note += ")" if is_identical else " with different numbers)"
+        # The output is copied, as the outputs received from MATLAB are not changed.
+        collapsed_outputs[index] = {
+            **first_output,
+            "content": {
+                **first_output["content"],
+                "text": f"{text}{separator}{note}\n",
+            },
+        }
+    return collapsed_outputs
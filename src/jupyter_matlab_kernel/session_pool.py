@@ -0,0 +1,294 @@
+# Copyright 2026 The MathWorks, Inc.
+
+"""This module contains a pool of idle dedicated MATLAB sessions which are started
+ahead of time through MATLAB Proxy Manager.
+
+The pool is shared by the MATLAB Kernels of a Jupyter server through files in the
+Jupyter runtime directory. Each slot of the pool is reserved with a lock file while
+its session starts, and a ready file describes a session which can be claimed.
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+
+import matlab_proxy_manager.lib.api as mpm_lib
+import psutil
+from matlab_proxy import settings as mwi_settings
+
+from jupyter_matlab_kernel import mwi_logger
+from jupyter_matlab_kernel.mwi_comm_helpers import MWICommHelper
+from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
+
+_logger = mwi_logger.get()
+
+_HIT = "hit"
+_MISS = "miss"
+
+
+class MATLABSessionPool:
+    """
+    Pool of idle dedicated MATLAB sessions, which kernels claim instead of starting
+    a new matlab-proxy. Sessions are started by refill, and a claimed session is
+    owned by the kernel which claimed it.
+    """
+
+    def __init__(
+        self, parent_pid, base_url_prefix, size, refill_policy, logger=_logger
+    ):
+        """
+        Args:
+            parent_pid (int): Process ID of the Jupyter server, used as context by
+                MATLAB Proxy Manager.
+            base_url_prefix (str): Base url of the Jupyter server.
+            size (int): Number of idle sessions to keep ready.
+            refill_policy (str): "eager" or "lazy", see kernel_settings.
+            logger (Logger, optional): Instance of Logger. Defaults to _logger.
+        """
+        from jupyter_core.paths import jupyter_runtime_dir
+
+        self.parent_pid = parent_pid
+        self.base_url_prefix = base_url_prefix
+        self.size = size
+        self.refill_policy = refill_policy
+        self.logger = logger
+        self.directory = (
+            Path(jupyter_runtime_dir()) / f"jupyter-matlab-session-pool-{parent_pid}"
+        )
+
+    def claim(self, kernel_id):
+        """
+        Claims an idle session from the pool. The session is removed from the pool
+        and its slot is freed for a new session. Sessions whose matlab-proxy is no
+        longer running are discarded.
+
+        Args:
+            kernel_id (str): ID of the kernel claiming the session.
+
+        Returns:
+            dict: Details of the claimed session, with the keys "caller_id", "pid",
+                "absolute_url", "mwi_base_url", "headers" and "mpm_auth_token".
+                None if no idle session is available.
+        """
+        for slot in range(self.size):
+            ready_file = self._get_ready_file(slot)
+            claimed_file = ready_file.with_name(f"{ready_file.name}.{kernel_id}")
+            try:
+                # Renaming is atomic, only one kernel can claim a session.
+                os.rename(ready_file, claimed_file)
+            except OSError:
+                continue
+
+            try:
+                session = json.loads(claimed_file.read_text())
+            except (OSError, ValueError) as e:
+                self.logger.error(f"Unable to read pooled MATLAB session: {e}")
+                continue
+            finally:
+                self._remove(claimed_file)
+                self._remove(self._get_lock_file(slot))
+
+            if not self._is_alive(session):
+                self.logger.debug(
+                    "Discarding pooled MATLAB session %s which is no longer running",
+                    session.get("caller_id"),
+                )
+                continue
+
+            self.logger.debug("Claimed pooled MATLAB session %s", session["caller_id"])
+            self._record_event(_HIT)
+            return session
+
+        self.logger.debug("No pooled MATLAB session available")
+        self._record_event(_MISS)
+        return None
+
+    async def refill(self):
+        """
+        Starts new sessions for the free slots of the pool and waits until they are
+        ready to be claimed.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        reserved_slots = [slot for slot in range(self.size) if self._reserve(slot)]
+        if reserved_slots:
+            self.logger.debug(f"Refilling MATLAB session pool slots {reserved_slots}")
+            await asyncio.gather(
+                *(self._start_session(slot) for slot in reserved_slots)
+            )
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: The size of the pool, the number of idle sessions which are ready
+                and the number of claims which found (hits) or did not find (misses)
+                an idle session.
+        """
+        ready = sum(self._get_ready_file(slot).exists() for slot in range(self.size))
+        try:
+            events = (self.directory / "events.log").read_text().split()
+        except OSError:
+            events = []
+        return {
+            "size": self.size,
+            "ready": ready,
+            "hits": events.count(_HIT),
+            "misses": events.count(_MISS),
+        }
+
+    async def _start_session(self, slot):
+        """
+        Starts a dedicated MATLAB session for a reserved slot. The slot is released
+        if the session does not become ready.
+
+        Args:
+            slot (int): The reserved slot.
+        """
+        session = {"caller_id": f"pool-{uuid.uuid4().hex}"}
+        try:
+            response = await mpm_lib.start_matlab_proxy_for_kernel(
+                caller_id=session["caller_id"],
+                parent_id=self.parent_pid,
+                is_shared_matlab=False,
+                base_url_prefix=self.base_url_prefix,
+            )
+            if response.get("errors"):
+                raise MATLABConnectionError(response.get("errors"))
+            for key in (
+                "pid",
+                "absolute_url",
+                "mwi_base_url",
+                "headers",
+                "mpm_auth_token",
+            ):
+                session[key] = response.get(key)
+
+            if await self._wait_until_ready(session):
+                self._write_ready_file(slot, session)
+                self.logger.debug(f"Pooled MATLAB session {session['caller_id']} ready")
+                return
+        except Exception as e:
+            self.logger.error(f"Unable to start pooled MATLAB session: {e}")
+
+        if "mpm_auth_token" in session:
+            try:
+                await mpm_lib.shutdown(
+                    self.parent_pid, session["caller_id"], session["mpm_auth_token"]
+                )
+            except Exception as e:
+                self.logger.debug("Unable to shutdown pooled MATLAB session: %s", e)
+        self._remove(self._get_lock_file(slot))
+
+    async def _wait_until_ready(self, session):
+        """
+        Waits until MATLAB of a session is licensed and running.
+
+        Args:
+            session (dict): Details of the session.
+
+        Returns:
+            bool: True if the session is ready, False if MATLAB cannot start without
+                user interaction or did not start in time.
+        """
+        loop = asyncio.get_running_loop()
+        comm_helper = MWICommHelper(
+            session["caller_id"],
+            session["absolute_url"],
+            loop,
+            loop,
+            session["headers"],
+            self.logger,
+        )
+        await comm_helper.connect()
+        deadline = time.monotonic() + mwi_settings.get_process_startup_timeout()
+        try:
+            while time.monotonic() < deadline:
+                status = await comm_helper.fetch_matlab_proxy_status()
+                if status.matlab_proxy_has_error or not status.is_matlab_licensed:
+                    return False
+                if status.matlab_status == "up":
+                    return True
+                await asyncio.sleep(1)
+            return False
+        finally:
+            await comm_helper.disconnect()
+
+    def _is_alive(self, session):
+        """
+        Checks if the matlab-proxy process of a session is running.
+
+        Args:
+            session (dict): Details of the session.
+
+        Returns:
+            bool: True if the process of the session exists, False otherwise.
+        """
+        pid = session.get("pid")
+        return isinstance(pid, int) and psutil.pid_exists(pid)
+
+    def _reserve(self, slot):
+        """
+        Reserves a slot of the pool by creating its lock file. Locks held by
+        processes which no longer exist are removed if the slot has no idle session.
+
+        Args:
+            slot (int): The slot to reserve.
+
+        Returns:
+            bool: True if the slot was reserved, False if it is in use.
+        """
+        lock_file = self._get_lock_file(slot)
+        if lock_file.exists() and not self._get_ready_file(slot).exists():
+            try:
+                owner_pid = int(lock_file.read_text())
+            except (OSError, ValueError):
+                owner_pid = None
+            if owner_pid is None or not psutil.pid_exists(owner_pid):
+                self._remove(lock_file)
+
+        try:
+            fd = os.open(lock_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w") as f:
+            f.write(str(os.getpid()))
+        return True
+
+    def _write_ready_file(self, slot, session):
+        """
+        Writes the details of a ready session, which include its authentication
+        tokens, into a file readable only by the current user. The file is written
+        under a temporary name first, so that it is never claimed partially written.
+
+        Args:
+            slot (int): The slot of the session.
+            session (dict): Details of the session.
+        """
+        ready_file = self._get_ready_file(slot)
+        temp_file = ready_file.with_suffix(".tmp")
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(session, f)
+        os.replace(temp_file, ready_file)
+
+    def _record_event(self, event):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.directory / "events.log", "a") as f:
+                f.write(f"{event}\n")
+        except OSError as e:
+            self.logger.debug("Unable to record MATLAB session pool event: %s", e)
+
+    def _get_lock_file(self, slot):
+        return self.directory / f"slot-{slot}.lock"
+
+    def _get_ready_file(self, slot):
+        return self.directory / f"slot-{slot}.json"
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
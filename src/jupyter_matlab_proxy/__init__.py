@@ -1,5 +1,6 @@
-# Copyright 2020-2025 The MathWorks, Inc.
+# Copyright 2020-2026 The MathWorks, Inc.
 
+import atexit
 import os
 import secrets
 from pathlib import Path
@@ -17,6 +18,9 @@ _JUPYTER_SERVER_PID: str = str(os.getpid())
 _USE_FALLBACK_KERNEL: bool = (
     os.getenv("MWI_USE_FALLBACK_KERNEL", "FALSE").lower().strip() == "true"
 )
+_USE_DIRECT_CONNECTION: bool = (
+    os.getenv("MWI_JUPYTER_DIRECT_CONNECTION", "FALSE").lower().strip() == "true"
+)
 
 
 def _get_auth_token():
@@ -77,6 +81,9 @@ def _get_env(port, base_url):
                 }
             )
 
+        if _USE_DIRECT_CONNECTION:
+            _write_connection_file(port, base_url)
+
     else:
         # case when we are using matlab proxy manager
         import matlab_proxy_manager.utils.environment_variables as mpm_env
@@ -90,6 +97,28 @@ def _get_env(port, base_url):
     return env
 
 
+def _write_connection_file(port, base_url):
+    """Shares the address of matlab-proxy with the MATLAB Kernels started by this
+    Jupyter server, which then send their requests directly to matlab-proxy instead
+    of routing them through the Jupyter server.
+
+    Args:
+        port (int): Port number on which matlab-proxy will be started.
+        base_url (str): Base url of the Jupyter server.
+    """
+    from jupyter_matlab_kernel import direct_connection
+
+    headers = {}
+    if _mwi_auth_token:
+        headers[MWI_AUTH_TOKEN_NAME_FOR_HTTP] = _mwi_auth_token.get("token_hash")
+
+    connection_file = direct_connection.write_connection_file(
+        _JUPYTER_SERVER_PID, f"http://127.0.0.1:{port}{base_url}matlab", headers
+    )
+    if connection_file:
+        atexit.register(connection_file.unlink, missing_ok=True)
+
+
 def setup_matlab():
     """This method is run by jupyter-server-proxy package with instruction to launch the MATLAB Desktop
 
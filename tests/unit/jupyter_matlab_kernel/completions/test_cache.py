@@ -0,0 +1,68 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.completions.cache
+
+import pytest
+
+from jupyter_matlab_kernel.completions import CompletionCache
+
+
+def _completion_results(texts, start, end):
+    return {
+        "matches": texts,
+        "start": start,
+        "end": end,
+        "completions": [
+            {"text": text, "type": "function", "start": start, "end": end}
+            for text in texts
+        ],
+    }
+
+
+@pytest.fixture
+def cache():
+    """Completion cache populated with the results for 'x = pl'"""
+    cache = CompletionCache()
+    cache.put("x = pl", 6, 0, _completion_results(["plot", "plot3", "PlotX"], 4, 6))
+    return cache
+
+
+def test_results_filtered_when_word_is_extended(cache):
+    """
+    This test checks that typing more characters of the completed word is answered
+    from the cache by filtering the earlier results case-insensitively.
+    """
+    results = cache.get("x = plot", 8, 0)
+
+    assert results == _completion_results(["plot", "plot3", "PlotX"], 4, 8)
+    results = cache.get("x = plot3", 9, 0)
+    assert results == _completion_results(["plot3"], 4, 9)
+    assert cache.get_stats() == {"hits": 2, "misses": 0, "hit_rate": 1.0}
+
+
+@pytest.mark.parametrize(
+    "code, cursor_pos, generation",
+    [
+        pytest.param("x = plo", 7, 1, id="Code executed since results were cached"),
+        pytest.param("x = p", 5, 0, id="Characters deleted"),
+        pytest.param("y = plo", 7, 0, id="Code before word changed"),
+        pytest.param("x = pl.", 7, 0, id="Non word character typed"),
+        pytest.param("x = plo;", 7, 0, id="Code after cursor changed"),
+    ],
+)
+def test_cache_miss(cache, code, cursor_pos, generation):
+    """
+    This test checks that the cached results are not used when they may differ
+    from the results MATLAB would produce.
+    """
+    assert cache.get(code, cursor_pos, generation) is None
+    assert cache.get_stats() == {"hits": 0, "misses": 1, "hit_rate": 0.0}
+
+
+def test_results_without_completions_not_cached(cache):
+    """
+    This test checks that results without completions replace the cached results
+    and are not used for later requests.
+    """
+    cache.put("x = plz", 7, 0, _completion_results([], 7, 7))
+
+    assert cache.get("x = plzz", 8, 0) is None
@@ -0,0 +1,125 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.completions.functions
+
+import os
+
+import pytest
+
+from jupyter_matlab_kernel.completions import FunctionIndex, functions
+
+
+@pytest.fixture
+def matlab_root(tmp_path):
+    """Fake MATLAB installation with functions and classes in its toolbox folder"""
+    matlab_root = tmp_path / "MATLAB"
+    graphics = matlab_root / "toolbox" / "matlab" / "graphics"
+    graphics.mkdir(parents=True)
+    for file_name in ["plot.m", "Plot3.p", "plotyy.mexa64", "Contents.m", "pie.m"]:
+        (graphics / file_name).touch()
+    (graphics / "@PlotHandle").mkdir()
+    (graphics / "private").mkdir()
+    (graphics / "private" / "plotHelper.m").touch()
+    (graphics / "+internal").mkdir()
+    (graphics / "+internal" / "plotInternal.m").touch()
+    return matlab_root
+
+
+@pytest.fixture
+def function_index(tmp_path):
+    return FunctionIndex(tmp_path / "cache")
+
+
+def test_update_indexes_functions_and_classes(function_index, matlab_root):
+    """
+    This test checks that functions and classes of the toolbox folder are indexed
+    and found by a case-insensitive prefix search, while functions in private
+    folders and packages are not.
+    """
+    assert function_index.update(str(matlab_root), "R2025b")
+
+    assert function_index.search("PLOT") == [
+        ("plot", "mFile"),
+        ("Plot3", "pFile"),
+        ("PlotHandle", "class"),
+        ("plotyy", "mex"),
+    ]
+    assert function_index.search("Contents") == []
+    assert function_index.search("q") == []
+
+
+def test_update_scans_only_changed_folders(
+    function_index, matlab_root, tmp_path, monkeypatch
+):
+    """
+    This test checks that an index is reused by later sessions and that only
+    folders whose modification time changed are scanned again.
+    """
+    function_index.update(str(matlab_root), "R2025b")
+    graphics = matlab_root / "toolbox" / "matlab" / "graphics"
+    (graphics / "bar.m").touch()
+    os.utime(graphics, ns=(0, 0))
+
+    scanned_folders = []
+    scan_folder = functions._scan_folder
+
+    def record_scanned_folder(path, mtime):
+        scanned_folders.append(path)
+        return scan_folder(path, mtime)
+
+    monkeypatch.setattr(functions, "_scan_folder", record_scanned_folder)
+    new_function_index = FunctionIndex(tmp_path / "cache")
+    assert new_function_index.load_latest()
+    assert new_function_index.search("bar") == []
+
+    new_function_index.update(str(matlab_root), "R2025b")
+
+    assert scanned_folders == [os.path.join(matlab_root, "toolbox", "matlab/graphics")]
+    assert new_function_index.search("bar") == [("bar", "mFile")]
+
+
+def test_latest_index_loaded_on_first_search(function_index, matlab_root, tmp_path):
+    """
+    This test checks that the most recent index is loaded by the first search,
+    rather than when the index is created.
+    """
+    function_index.update(str(matlab_root), "R2025b")
+
+    new_function_index = FunctionIndex(tmp_path / "cache")
+    assert not new_function_index.is_loaded
+    assert new_function_index.search("pie") == [("pie", "mFile")]
+    assert new_function_index.is_loaded
+
+
+def test_search_in_large_index(function_index, tmp_path):
+    """
+    This test checks that the binary search over the memory-mapped index finds
+    the same names as a linear search.
+    """
+    names = [f"fn{i}" for i in range(5000)]
+    directories = {"": {"entries": [[name, "mFile"] for name in names]}}
+    index_file = tmp_path / "functions-test.idx"
+    index_file.write_bytes(functions._create_index(directories))
+    assert function_index._load(index_file)
+
+    for prefix in ["fn1", "fn4999", "fn25", "f", "fn50000", "a", "z"]:
+        expected = sorted(name for name in names if name.startswith(prefix))
+        found = [name for name, _ in function_index.search(prefix, limit=len(names))]
+        assert found == expected
+
+
+def test_complete(function_index, matlab_root):
+    """
+    This test checks that function and class names are completed with the
+    completion types used by MATLAB.
+    """
+    assert function_index.complete("x = plo", 7) is None
+
+    function_index.update(str(matlab_root), "R2025b")
+    results = function_index.complete("x = plo", 7)
+
+    assert results["matches"] == ["Plot3", "PlotHandle", "plot", "plotyy"]
+    assert results["start"] == 4
+    assert {c["text"]: c["type"] for c in results["completions"]}["PlotHandle"] == (
+        "class"
+    )
+    assert function_index.complete("s.plo", 5) is None
@@ -0,0 +1,62 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.completions.help
+
+import os
+
+from jupyter_matlab_kernel.completions import HelpCache
+
+
+def test_help_text_shared_across_sessions(tmp_path):
+    """
+    This test checks that help texts are read back from the cache directory by
+    another cache instance, separately for each MATLAB version.
+    """
+    HelpCache(tmp_path).put("R2025b", "plot", "plot - 2-D line plot")
+
+    help_cache = HelpCache(tmp_path)
+    assert help_cache.get("R2025b", "plot") == "plot - 2-D line plot"
+    assert help_cache.get("R2025a", "plot") is None
+    assert help_cache.get("R2025b", "disp") is None
+
+
+def test_memory_cache_evicts_least_recently_used(tmp_path):
+    """
+    This test checks that the memory cache is bounded and keeps the most recently
+    used help texts.
+    """
+    help_cache = HelpCache(tmp_path, max_memory_entries=2)
+    help_cache.put("R2025b", "plot", "plot help")
+    help_cache.put("R2025b", "disp", "disp help")
+    help_cache.get("R2025b", "plot")
+    help_cache.put("R2025b", "zeros", "zeros help")
+
+    assert list(help_cache._memory) == [("R2025b", "plot"), ("R2025b", "zeros")]
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    """
+    This test checks that help files are deleted in the order of their last use
+    once the cache directory exceeds its size limit.
+    """
+    help_cache = HelpCache(tmp_path, max_disk_size=25)
+    help_cache.put("R2025b", "plot", "p" * 10)
+    help_cache.put("R2025b", "disp", "d" * 10)
+    os.utime(tmp_path / "R2025b" / "plot.txt", (0, 0))
+    help_cache.put("R2025b", "zeros", "z" * 10)
+
+    assert sorted(path.name for path in (tmp_path / "R2025b").iterdir()) == [
+        "disp.txt",
+        "zeros.txt",
+    ]
+
+
+def test_invalid_names_not_stored_on_disk(tmp_path):
+    """
+    This test checks that names which are not valid MATLAB names are only cached
+    in memory, so that they cannot be used to write files outside the cache.
+    """
+    help_cache = HelpCache(tmp_path)
+    help_cache.put("R2025b", "../plot", "help")
+
+    assert help_cache.get("R2025b", "../plot") == "help"
+    assert not any(tmp_path.iterdir())
@@ -0,0 +1,95 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.completions.programming_aids
+
+import json
+import time
+
+import pytest
+
+from jupyter_matlab_kernel.completions.programming_aids import (
+    create_completion_results_from_programming_aids,
+)
+
+# Maximum time (in seconds) to convert the completion data with many choices.
+# Generous so that the test does not fail on slow machines.
+_MANY_CHOICES_TIME_BUDGET_SECONDS = 1
+
+
+def test_choices_and_signatures():
+    """
+    This test checks that the choices of the code and of the input arguments of
+    function signatures are combined, and that their match types are mapped to
+    completion types.
+    """
+    completion_data = {
+        "widgetData": {
+            "choices": [
+                {"completion": "plot", "matchType": "mFile"},
+                {"completion": "plotTask", "matchType": "mlappFile"},
+                {"completion": "plotData", "matchType": "variable"},
+                {"matchType": "mFile"},
+            ]
+        },
+        "value": "plo",
+        "signatures": {
+            "inputArguments": [
+                {
+                    "widgetData": {
+                        "choices": {"completion": "'r'", "matchType": "literal"}
+                    }
+                },
+                {"name": "Y"},
+            ]
+        },
+    }
+
+    results = create_completion_results_from_programming_aids(
+        json.dumps(completion_data), 10
+    )
+
+    assert results["matches"] == ["plot", "plotData", "'r'"]
+    assert results["start"] == 7
+    assert results["end"] == 10
+    assert results["completions"] == [
+        {"text": "plot", "type": "function", "start": 7, "end": 10},
+        {"text": "plotData", "type": "variable", "start": 7, "end": 10},
+        {"text": "'r'", "type": "text", "start": 10, "end": 10},
+    ]
+
+
+@pytest.mark.parametrize(
+    "completion_data",
+    [
+        pytest.param("", id="Empty response"),
+        pytest.param("{}", id="No widget data"),
+        pytest.param('{"widgetData": {"choices": []}}', id="No choices"),
+    ],
+)
+def test_no_completions(completion_data):
+    """
+    This test checks that the results are empty and positioned at the cursor if
+    MATLAB has no completion choices.
+    """
+    results = create_completion_results_from_programming_aids(completion_data, 4)
+
+    assert results == {"matches": [], "start": 4, "end": 4, "completions": []}
+
+
+def test_many_choices():
+    """
+    This test checks that completion data with thousands of choices is converted
+    within the time budget.
+    """
+    choices = [
+        {"completion": f"name{i}", "matchType": ["mFile", "variable", "class"][i % 3]}
+        for i in range(20000)
+    ]
+    completion_data = json.dumps({"widgetData": {"choices": choices}, "value": "name"})
+
+    start_time = time.perf_counter()
+    results = create_completion_results_from_programming_aids(completion_data, 4)
+    elapsed = time.perf_counter() - start_time
+
+    assert len(results["matches"]) == len(choices)
+    assert results["completions"][1]["type"] == "variable"
+    assert elapsed < _MANY_CHOICES_TIME_BUDGET_SECONDS
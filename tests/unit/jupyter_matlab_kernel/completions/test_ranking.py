@@ -0,0 +1,83 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.completions.ranking
+
+from jupyter_matlab_kernel.completions import RecentNames, rank_completion_results
+
+
+def _create_results(candidates, start, end):
+    return {
+        "matches": [name for name, _ in candidates],
+        "start": start,
+        "end": end,
+        "completions": [
+            {"text": name, "type": completion_type, "start": start, "end": end}
+            for name, completion_type in candidates
+        ],
+    }
+
+
+def test_rank_completion_results():
+    """
+    This test checks that completions are ranked by exact prefix, workspace
+    variables, recent usage and fuzzy matching, in this order.
+    """
+    results = _create_results(
+        [
+            ("xDataSet", "function"),
+            ("DataPlot", "function"),
+            ("Dataset", "variable"),
+            ("dataRecent", "function"),
+            ("datastore", "function"),
+            ("dataFrame", "function"),
+            ("DATA", "function"),
+        ],
+        4,
+        8,
+    )
+    recent_names = RecentNames()
+    recent_names.add("dataFrame = 1; x = dataRecent(dataFrame);")
+
+    ranked_results = rank_completion_results(
+        results, "x = data", {"Dataset"}, recent_names, None
+    )
+
+    assert ranked_results["matches"] == [
+        "dataFrame",
+        "dataRecent",
+        "datastore",
+        "Dataset",
+        "DATA",
+        "DataPlot",
+        "xDataSet",
+    ]
+    assert ranked_results["total"] == 7
+
+
+def test_rank_completion_results_with_limit():
+    """
+    This test checks that only the most relevant completions are kept and that
+    the total number of completions is reported.
+    """
+    results = _create_results([(f"name{i}", "function") for i in range(5000)], 0, 4)
+
+    ranked_results = rank_completion_results(results, "name", set(), RecentNames(), 3)
+
+    assert ranked_results["matches"] == ["name0", "name1", "name2"]
+    assert [c["text"] for c in ranked_results["completions"]] == [
+        "name0",
+        "name1",
+        "name2",
+    ]
+    assert ranked_results["total"] == 5000
+
+
+def test_recent_names_are_bounded():
+    """
+    This test checks that only the most recently used names are remembered.
+    """
+    recent_names = RecentNames(max_names=2)
+    recent_names.add("a = b + c;")
+    recent_names.add("b")
+
+    assert recent_names.get_recency("a") == 0
+    assert recent_names.get_recency("b") > recent_names.get_recency("c") > 0
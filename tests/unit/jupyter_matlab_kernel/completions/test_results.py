@@ -0,0 +1,62 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.completions.results
+
+import pytest
+
+from jupyter_matlab_kernel.completions import (
+    get_function_name_before_cursor,
+    get_name_at_cursor,
+    merge_completion_results,
+)
+
+
+@pytest.mark.parametrize(
+    "code, cursor_pos, expected",
+    [
+        pytest.param("plot(x)", 2, "plot", id="Cursor inside the name"),
+        pytest.param("plot(x)", 4, "plot", id="Cursor after the name"),
+        pytest.param("y = matlab.net.base64encode(x)", 8, "matlab.net.base64encode"),
+        pytest.param("a = 1;\ndisp(a)", 9, "disp", id="Name on another line"),
+        pytest.param("a = 1 + 2", 6, None, id="No name at the cursor"),
+    ],
+)
+def test_get_name_at_cursor(code, cursor_pos, expected):
+    assert get_name_at_cursor(code, cursor_pos) == expected
+
+
+@pytest.mark.parametrize(
+    "code, cursor_pos, expected",
+    [
+        pytest.param("plo", 3, "plo", id="Beginning of a statement"),
+        pytest.param("y = sum(ab", 10, "ab", id="Function argument"),
+        pytest.param("a = 1;\nx = [1, si", 17, "si", id="Array element"),
+        pytest.param("cd fo", 5, None, id="Command syntax argument"),
+        pytest.param("s.fi", 4, None, id="Field"),
+        pytest.param("disp('pl", 8, None, id="Character vector"),
+        pytest.param("% plo", 5, None, id="Comment"),
+    ],
+)
+def test_get_function_name_before_cursor(code, cursor_pos, expected):
+    assert get_function_name_before_cursor(code, cursor_pos) == expected
+
+
+def test_merge_completion_results():
+    """
+    This test checks that completion results are merged without duplicates.
+    """
+
+    def results(*names):
+        return {
+            "matches": list(names),
+            "start": 0,
+            "end": 2,
+            "completions": [
+                {"text": name, "type": "function", "start": 0, "end": 2}
+                for name in names
+            ],
+        }
+
+    merged = merge_completion_results(results("pi", "pie"), None, results("pie", "pin"))
+
+    assert merged == results("pi", "pie", "pin")
+    assert merge_completion_results(None, None) is None
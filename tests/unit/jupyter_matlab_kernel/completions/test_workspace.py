@@ -0,0 +1,114 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.completions.workspace
+
+import pytest
+
+from jupyter_matlab_kernel.completions import WorkspaceIndex
+
+
+@pytest.fixture
+def workspace_index():
+    """Workspace index with a struct, objects and a matrix"""
+    workspace_index = WorkspaceIndex()
+    workspace_index.update(
+        {
+            "full": True,
+            "updated": [
+                {
+                    "name": "data",
+                    "class": "struct",
+                    "fieldType": "field",
+                    "fields": ["name", "Values", "count"],
+                },
+                {
+                    "name": "obj",
+                    "class": "MyClass",
+                    "fieldType": "property",
+                    "fields": ["Size"],
+                    "methods": ["MyClass", "resize"],
+                },
+                {
+                    "name": "legacyObj",
+                    "class": "MyClass",
+                    "fieldType": "property",
+                    "fields": ["Size"],
+                },
+                {"name": "dataSize", "class": "double", "fieldType": "", "fields": []},
+            ],
+            "removed": [],
+        }
+    )
+    return workspace_index
+
+
+def test_update_applies_changes(workspace_index):
+    """
+    This test checks that removed variables are dropped from the index and that a
+    full update replaces all the variables.
+    """
+    workspace_index.update({"full": False, "updated": [], "removed": ["obj"]})
+    assert len(workspace_index) == 3
+
+    workspace_index.update(
+        {"full": True, "updated": [{"name": "x", "class": "double"}], "removed": []}
+    )
+    assert workspace_index.complete_variable("da", 2)["matches"] == []
+    assert workspace_index.complete_variable("x", 1)["matches"] == ["x"]
+
+
+@pytest.mark.parametrize(
+    "code, cursor_pos, expected_matches, expected_start",
+    [
+        pytest.param("data.", 5, ["Values", "count", "name"], 5, id="All fields"),
+        pytest.param("y = data.v", 10, ["Values"], 9, id="Case-insensitive prefix"),
+        pytest.param("data.na + 1", 7, ["name"], 5, id="Cursor inside the code"),
+        pytest.param("a = 1;\nobj.S", 12, ["Size"], 11, id="Object property"),
+        pytest.param("obj.", 4, ["MyClass", "Size", "resize"], 4, id="All members"),
+        pytest.param("obj.re", 6, ["resize"], 4, id="Object method"),
+    ],
+)
+def test_complete_field(
+    workspace_index, code, cursor_pos, expected_matches, expected_start
+):
+    """
+    This test checks that fields of structs, and properties and methods of objects,
+    are completed.
+    """
+    results = workspace_index.complete_field(code, cursor_pos)
+
+    assert results["matches"] == expected_matches
+    assert results["start"] == expected_start
+    assert results["end"] == cursor_pos
+    assert [c["text"] for c in results["completions"]] == expected_matches
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        pytest.param("unknown.", id="Unknown variable"),
+        pytest.param("dataSize.", id="Variable without fields"),
+        pytest.param("data.name.", id="Nested field"),
+        pytest.param("obj.other", id="Object without matching member"),
+        pytest.param("legacyObj.S", id="Object without reported methods"),
+        pytest.param("disp('data.", id="Inside a string"),
+        pytest.param("% data.", id="Inside a comment"),
+        pytest.param("data", id="No field"),
+    ],
+)
+def test_complete_field_not_answered_locally(workspace_index, code):
+    """
+    This test checks that completions which the index cannot answer are left to
+    MATLAB.
+    """
+    assert workspace_index.complete_field(code, len(code)) is None
+
+
+def test_complete_variable(workspace_index):
+    """
+    This test checks that variable names are completed from the index.
+    """
+    results = workspace_index.complete_variable("x = dat", 7)
+
+    assert results["matches"] == ["data", "dataSize"]
+    assert results["start"] == 4
+    assert {c["type"] for c in results["completions"]} == {"variable"}
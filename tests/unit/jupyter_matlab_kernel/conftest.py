@@ -0,0 +1,29 @@
+# Copyright 2026 The MathWorks, Inc.
+
+import uuid
+
+import pytest
+
+from jupyter_matlab_kernel.mpm_kernel import MATLABKernelUsingMPM
+
+
+@pytest.fixture
+def mpm_kernel_instance(mocker, monkeypatch, tmp_path) -> MATLABKernelUsingMPM:
+    # Keep the function index, help cache and spilled outputs of the kernel out of
+    # the cache directory of the user.
+    monkeypatch.setenv("MWI_JUPYTER_CACHE_DIR", str(tmp_path / "cache"))
+
+    # Mock logger
+    mock_logger = mocker.Mock()
+
+    # Use pytest-mock's mocker fixture to patch the function and log attribute
+    mocker.patch(
+        "jupyter_matlab_kernel.base_kernel.BaseMATLABKernel._extract_kernel_id_from_sys_args",
+        return_value=uuid.uuid4().hex,
+    )
+    mocker.patch(
+        "jupyter_matlab_kernel.base_kernel.BaseMATLABKernel.log",
+        new=mock_logger,
+    )
+
+    return MATLABKernelUsingMPM()
@@ -0,0 +1,100 @@
+# Copyright 2026 The MathWorks, Inc.
+
+import importlib.util
+from types import SimpleNamespace
+
+import pytest
+
+from jupyter_matlab_kernel.magics.figure import CMD_RESET, figure
+from jupyter_matlab_kernel.magics.help import help
+from jupyter_matlab_kernel.mwi_exceptions import MagicError
+
+
+async def _run_figure_magic(parameters, kernel):
+    """Runs the figure magic and invokes its callback like the kernel does"""
+    magic_object = figure(parameters)
+    output = next(magic_object.before_cell_execute())
+    assert output["type"] == "callback"
+    return [result async for result in output["callback_function"](kernel)]
+
+
+def test_help_magic():
+    magic_object = help([figure.__name__])
+    before_cell_executor = magic_object.before_cell_execute()
+    output = next(before_cell_executor)
+    expected_output = figure.info_about_magic
+    assert expected_output in output["value"][0]
+
+
+async def test_figure_magic_updates_kernel_settings():
+    kernel = SimpleNamespace(figure_settings={"dpi": 300})
+
+    results = await _run_figure_magic(["format=JPEG", "width=800"], kernel)
+    assert kernel.figure_settings == {"dpi": 300, "format": "jpeg", "maxWidth": 800}
+    assert "Maximum Figure Width: 800 pixels" in results[0]["value"][0]
+
+    await _run_figure_magic([CMD_RESET, "height=600"], kernel)
+    assert kernel.figure_settings == {"maxHeight": 600}
+
+    results = await _run_figure_magic([CMD_RESET], kernel)
+    assert kernel.figure_settings == {}
+    assert "as rendered by MATLAB" in results[0]["value"][0]
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [
+        pytest.param(["format=svg"], id="Unsupported format"),
+        pytest.param(["dpi=0"], id="Zero DPI"),
+        pytest.param(["width=-1"], id="Negative width"),
+        pytest.param(["height=large"], id="Height which is not a number"),
+        pytest.param(["quality=90"], id="Unknown parameter"),
+        pytest.param(["jpeg"], id="Parameter without value"),
+    ],
+)
+def test_figure_magic_exceptions(parameters):
+    magic_object = figure(parameters)
+    before_cell_executor = magic_object.before_cell_execute()
+    with pytest.raises(MagicError):
+        next(before_cell_executor)
+
+
+@pytest.mark.parametrize(
+    "parameters, parameter_pos, cursor_pos, expected_output",
+    [
+        pytest.param(
+            ["format="], 1, 7, ["format=png", "format=jpeg"], id="Figure formats"
+        ),
+        pytest.param(["format=png", "w"], 2, 1, ["width="], id="Second parameter"),
+        pytest.param(
+            ["format=png"],
+            2,
+            0,
+            ["format=png", "format=jpeg", "dpi=", "width=", "height=", CMD_RESET],
+            id="All parameters",
+        ),
+    ],
+)
+def test_do_complete(parameters, parameter_pos, cursor_pos, expected_output):
+    magic_object = figure()
+    assert (
+        magic_object.do_complete(parameters, parameter_pos, cursor_pos)
+        == expected_output
+    )
+
+
+async def test_figure_magic_requires_pillow(monkeypatch):
+    """
+    This test checks that figure settings are rejected when Pillow, with which the
+    kernel converts figures, is not installed, while they can still be displayed
+    and reset.
+    """
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    kernel = SimpleNamespace(figure_settings={})
+
+    magic_object = figure(["dpi=72"])
+    with pytest.raises(MagicError, match="pillow"):
+        next(magic_object.before_cell_execute())
+
+    await _run_figure_magic([CMD_RESET], kernel)
+    assert kernel.figure_settings == {}
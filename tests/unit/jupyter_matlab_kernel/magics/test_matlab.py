@@ -1,4 +1,4 @@
-# Copyright 2025 The MathWorks, Inc.
+# Copyright 2025-2026 The MathWorks, Inc.
 
 import pytest
 
@@ -200,3 +200,36 @@ async def test_get_kernel_info_in_matlab_magic(
         output.append(result)
     assert output is not None
     assert expected_output in output[0]["value"][0]
+
+
+async def test_get_kernel_info_shows_matlab_startup_time(mocker):
+    mock_kernel = mocker.MagicMock()
+    mock_kernel._get_kernel_info.return_value = {
+        "is_shared_matlab": True,
+        "matlab_version": "R2025b",
+        "matlab_root_path": "/path/to/matlab",
+        "licensing_mode": "existing_license",
+        "matlab_startup_time": 42.123,
+    }
+    output = []
+    async for result in get_kernel_info(mock_kernel):
+        output.append(result)
+    assert "MATLAB Startup Time: 42.12 seconds" in output[0]["value"][0]
+
+
+async def test_get_kernel_info_shows_session_pool(mocker):
+    mock_kernel = mocker.MagicMock()
+    mock_kernel._get_kernel_info.return_value = {
+        "is_shared_matlab": False,
+        "matlab_version": "R2025b",
+        "matlab_root_path": "/path/to/matlab",
+        "licensing_mode": "existing_license",
+        "session_pool": {"size": 2, "ready": 1, "hits": 3, "misses": 1},
+    }
+    output = []
+    async for result in get_kernel_info(mock_kernel):
+        output.append(result)
+    assert (
+        "Dedicated MATLAB Session Pool: 1 of 2 sessions ready, 3 hits, 1 misses"
+        in output[0]["value"][0]
+    )
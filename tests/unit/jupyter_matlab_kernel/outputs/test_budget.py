@@ -0,0 +1,99 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.outputs.budget
+
+from pathlib import Path
+
+from jupyter_matlab_kernel.outputs import OutputBudget
+
+
+def _stream(text, name="stdout"):
+    return {"type": "stream", "content": {"name": name, "text": text}}
+
+
+def test_outputs_within_budget_are_displayed(tmp_path):
+    """
+    This test checks that outputs are displayed unchanged while they fit into the
+    budget and that no spill file is created.
+    """
+    budget = OutputBudget(10, tmp_path / "cell1.txt")
+    outputs = [_stream("hello"), {"type": "workspace", "content": {}}]
+
+    assert budget.apply(outputs) == outputs
+    assert budget.get_notice() is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_outputs_beyond_budget_are_spilled(tmp_path):
+    """
+    This test checks that outputs beyond the budget are written to a spill file
+    across several responses, that errors are still displayed and that a notice
+    points to the spill file.
+    """
+    budget = OutputBudget(8, tmp_path / "outputs" / "cell1.txt")
+    error = {
+        "type": "stream",
+        "content": {"name": "stderr", "text": "Error: e\n"},
+        "isError": True,
+    }
+
+    displayed_outputs = budget.apply([_stream("12345\n"), _stream("67890\n")])
+    displayed_outputs += budget.apply(
+        [
+            {
+                "type": "execute_result",
+                "mimetype": ["text/html", "text/plain"],
+                "value": ["<pre>a = 1</pre>", "a = 1"],
+            },
+            {"type": "execute_result", "mimetype": ["image/png"], "value": ["QQ=="]},
+            error,
+        ]
+    )
+
+    assert displayed_outputs == [_stream("12345\n"), _stream("67"), error]
+    spill_file = tmp_path / "outputs" / "cell1.txt"
+    assert budget.spill_file == spill_file
+    assert spill_file.read_text() == "890\na = 1\n<image/png output not shown>\n"
+    assert budget.spilled_size == len(spill_file.read_text())
+    notice = budget.get_notice()
+    assert notice["content"]["name"] == "stderr"
+    assert str(spill_file) in notice["content"]["text"]
+
+
+def test_large_output_memory_is_bounded(tmp_path):
+    """
+    This test checks that only the budget of a large output is kept for display
+    while the rest of the output is written to the spill file.
+    """
+    budget = OutputBudget(1024, tmp_path / "cell1.txt")
+    for _ in range(100):
+        displayed_outputs = budget.apply([_stream("x" * 100_000)])
+        assert sum(len(o["content"]["text"]) for o in displayed_outputs) <= 1024
+
+    assert budget.spilled_size == 100 * 100_000 - 1024
+    assert Path(budget.spill_file).stat().st_size == budget.spilled_size
+
+
+def test_spill_file_is_overwritten(tmp_path):
+    """
+    This test checks that the spill file of a cell replaces the outputs spilled by
+    an earlier cell with the same execution count.
+    """
+    spill_file = tmp_path / "cell1.txt"
+    spill_file.write_text("outputs of an earlier cell\n")
+
+    budget = OutputBudget(2, spill_file)
+    budget.apply([_stream("abc\n"), _stream("def\n")])
+
+    assert spill_file.read_text() == "c\ndef\n"
+
+
+def test_spill_file_which_cannot_be_written(tmp_path):
+    """
+    This test checks that the notice tells the user when the spill file cannot be
+    written.
+    """
+    (tmp_path / "outputs").write_text("not a directory")
+    budget = OutputBudget(2, tmp_path / "outputs" / "cell1.txt")
+
+    assert budget.apply([_stream("abc\n")]) == [_stream("ab")]
+    assert "could not be written" in budget.get_notice()["content"]["text"]
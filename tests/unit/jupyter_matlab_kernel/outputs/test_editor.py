@@ -0,0 +1,175 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.outputs.editor
+
+import json
+
+import pytest
+
+from jupyter_matlab_kernel.outputs import process_raw_outputs
+from jupyter_matlab_kernel.outputs.editor import process_editor_outputs
+
+
+def _html_output(text):
+    return {
+        "type": "execute_result",
+        "mimetype": ["text/html", "text/plain"],
+        "value": [f"<html><body><pre>{text}</pre></body></html>", text],
+    }
+
+
+@pytest.mark.parametrize(
+    "editor_output, expected",
+    [
+        pytest.param(
+            {
+                "type": "matrix",
+                "outputData": {
+                    "name": "a",
+                    "header": "1×3",
+                    "type": "double",
+                    "value": "     1     2     3",
+                    "rows": 1,
+                    "columns": 3,
+                },
+            },
+            _html_output("a = 1×3 double\n     1     2     3"),
+            id="Matrix",
+        ),
+        pytest.param(
+            {
+                "type": "matrix",
+                "outputData": {
+                    "name": "b",
+                    "header": "11×1",
+                    "type": "double",
+                    "value": "1",
+                    "rows": 11,
+                    "columns": 1,
+                },
+            },
+            _html_output("b = 11×1 double\n1..."),
+            id="Truncated matrix",
+        ),
+        pytest.param(
+            {
+                "type": "variable",
+                "outputData": {
+                    "name": "s",
+                    "header": "struct with fields:",
+                    "value": "x: 1",
+                },
+            },
+            _html_output("s = struct with fields:\n    x: 1"),
+            id="Variable with header",
+        ),
+        pytest.param(
+            {
+                "type": "variableString",
+                "outputData": {"name": "c", "header": "", "value": "'abc'"},
+            },
+            _html_output("c = 'abc'"),
+            id="Single line variable string",
+        ),
+        pytest.param(
+            {
+                "type": "variableString",
+                "outputData": {"name": "c", "header": "", "value": "a\nb"},
+            },
+            _html_output("c = \na\nb"),
+            id="Multiline variable string",
+        ),
+        pytest.param(
+            {"type": "text", "outputData": {"text": "hello\n"}},
+            {"type": "stream", "content": {"name": "stdout", "text": "hello\n"}},
+            id="Text",
+        ),
+        pytest.param(
+            {"type": "warning", "outputData": {"text": "Warning: w"}},
+            {
+                "type": "stream",
+                "content": {"name": "stderr", "text": "Warning: w"},
+                "isWarning": True,
+            },
+            id="Warning",
+        ),
+        pytest.param(
+            {"type": "error", "outputData": {"text": "Error: e"}},
+            {
+                "type": "stream",
+                "content": {"name": "stderr", "text": "Error: e"},
+                "isError": True,
+            },
+            id="Error",
+        ),
+        pytest.param(
+            {"type": "text/html", "outputData": "<b>x</b>"},
+            {
+                "type": "execute_result",
+                "mimetype": ["text/html", "text/plain"],
+                "value": ["<b>x</b>", "<b>x</b>"],
+            },
+            id="HTML",
+        ),
+    ],
+)
+def test_process_editor_outputs(editor_output, expected):
+    """
+    This test checks that each type of Live Editor output is converted into the
+    same Jupyter output as processOutputs in +jupyter/execute.m.
+    """
+    assert process_editor_outputs([editor_output]) == [expected]
+
+
+def test_figures_are_shown_at_their_placeholder():
+    """
+    This test checks that a figure image is shown at the position of its
+    placeholder, and that unknown outputs and invalid images are dropped.
+    """
+    editor_outputs = [
+        {"type": "figure", "outputData": {"figurePlaceHolderId": "f1"}},
+        {"type": "text", "outputData": {"text": "after"}},
+        {"type": "unknown", "outputData": {}},
+        {
+            "type": "figure",
+            "outputData": {
+                "figureId": "f1",
+                "figureImage": "data:image/png;base64,QQ==",
+            },
+        },
+        {
+            "type": "figure",
+            "outputData": {
+                "figureId": "f2",
+                "figureImage": "data:text/plain;base64,QQ==",
+            },
+        },
+    ]
+
+    outputs = process_editor_outputs(editor_outputs)
+
+    assert outputs == [
+        {"type": "execute_result", "mimetype": ["image/png"], "value": ["QQ=="]},
+        {"type": "stream", "content": {"name": "stdout", "text": "after"}},
+    ]
+
+
+def test_process_raw_outputs():
+    """
+    This test checks that the raw outputs returned by MATLAB are replaced by the
+    converted outputs and that other outputs are kept in place.
+    """
+    raw_output = {
+        "type": "raw_outputs",
+        "content": json.dumps(
+            {"outputs": {"type": "text", "outputData": {"text": "a"}}}
+        ),
+    }
+    workspace_output = {"type": "workspace", "content": {}}
+
+    outputs = process_raw_outputs([raw_output, None, workspace_output])
+
+    assert outputs == [
+        {"type": "stream", "content": {"name": "stdout", "text": "a"}},
+        None,
+        workspace_output,
+    ]
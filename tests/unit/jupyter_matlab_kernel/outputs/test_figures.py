@@ -0,0 +1,81 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.outputs.figures
+
+import base64
+
+from jupyter_matlab_kernel.outputs import load_figure_files
+
+
+def test_load_figure_files(tmp_path):
+    """
+    This test checks that figure files are replaced by their base64 encoded
+    image data and deleted, while other outputs are left untouched.
+    """
+    figure_file = tmp_path / "figure.png"
+    figure_file.write_bytes(b"\x89PNG image data")
+    stream_output = {"type": "stream", "content": {"name": "stdout", "text": "a"}}
+    outputs = [
+        stream_output,
+        {
+            "type": "execute_result",
+            "mimetype": ["image/png"],
+            "value": [""],
+            "file": str(figure_file),
+        },
+        None,
+    ]
+
+    outputs = load_figure_files(outputs, str(tmp_path))
+
+    assert outputs[0] == stream_output
+    assert outputs[1] == {
+        "type": "execute_result",
+        "mimetype": ["image/png"],
+        "value": [base64.b64encode(b"\x89PNG image data").decode("ascii")],
+    }
+    assert outputs[2] is None
+    assert not figure_file.exists()
+
+
+def test_load_figure_files_ignores_files_outside_figure_directory(tmp_path):
+    """
+    This test checks that files which are not inside the figure directory are
+    neither read nor deleted.
+    """
+    figure_directory = tmp_path / "figures"
+    figure_directory.mkdir()
+    other_file = tmp_path / "other.png"
+    other_file.write_bytes(b"data")
+    outputs = [{"type": "execute_result", "value": [""], "file": str(other_file)}]
+
+    outputs = load_figure_files(outputs, str(figure_directory))
+
+    assert outputs == [{}]
+    assert other_file.exists()
+
+
+def test_load_figure_files_with_missing_file(tmp_path):
+    """
+    This test checks that an output whose figure file cannot be read is not displayed.
+    """
+    outputs = [
+        {"type": "execute_result", "value": [""], "file": str(tmp_path / "x.png")}
+    ]
+
+    assert load_figure_files(outputs, str(tmp_path)) == [{}]
+
+
+def test_load_figure_files_deletes_superseded_figure_files(tmp_path):
+    """
+    This test checks that the files of figures which MATLAB rendered again, and
+    which are not referenced by any output, are deleted.
+    """
+    figure_file = tmp_path / "figure.png"
+    figure_file.write_bytes(b"\x89PNG image data")
+    superseded_file = tmp_path / "superseded.png"
+    superseded_file.write_bytes(b"\x89PNG old image data")
+    outputs = [{"type": "execute_result", "value": [""], "file": str(figure_file)}]
+
+    load_figure_files(outputs, str(tmp_path))
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,326 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.outputs.images
+
+import base64
+import io
+import random
+import struct
+import sys
+import time
+import zlib
+from functools import lru_cache
+
+import pytest
+
+from jupyter_matlab_kernel.outputs import ImageOptimizer
+from jupyter_matlab_kernel.outputs.images import (
+    PNG_SIGNATURE,
+    convert_figure,
+    optimize_png,
+)
+
+# Maximum CPU time (in seconds) to optimize the image of a figure of 1200 x 900
+# pixels. Generous so that the test does not fail on slow machines.
+_FIGURE_TIME_BUDGET_SECONDS = 1
+
+
+def _paeth(left, up, upper_left):
+    estimate = left + up - upper_left
+    distances = [abs(estimate - value) for value in (left, up, upper_left)]
+    return (left, up, upper_left)[distances.index(min(distances))]
+
+
+@lru_cache
+def _filter_row(filter_type, row, previous_row, channels):
+    """Filters a row, cached as the rows of figures repeat"""
+    filtered_row = bytearray([filter_type])
+    for i, value in enumerate(row):
+        left = row[i - channels] if i >= channels else 0
+        upper_left = previous_row[i - channels] if i >= channels else 0
+        predictor = [
+            0,
+            left,
+            previous_row[i],
+            (left + previous_row[i]) >> 1,
+            _paeth(left, previous_row[i], upper_left),
+        ][filter_type]
+        filtered_row.append((value - predictor) & 255)
+    return bytes(filtered_row)
+
+
+def _encode_png(rows, width, color_type=2, filter_types=(0, 1, 2, 3, 4), level=1):
+    """Encodes an 8 bit image, using the filter types for the rows in turn"""
+    channels = 3 if color_type == 2 else 4
+    image_data = bytearray()
+    previous_row = bytes(len(rows[0]))
+    for idx, row in enumerate(rows):
+        filter_type = filter_types[idx % len(filter_types)]
+        image_data += _filter_row(filter_type, row, previous_row, channels)
+        previous_row = row
+
+    header = struct.pack(">IIBBBBB", width, len(rows), 8, color_type, 0, 0, 0)
+    chunks = [
+        (b"IHDR", header),
+        (b"tEXt", b"Software\x00MATLAB"),
+        (b"IDAT", zlib.compress(bytes(image_data), level)),
+        (b"IEND", b""),
+    ]
+    png = PNG_SIGNATURE
+    for name, body in chunks:
+        crc = zlib.crc32(body, zlib.crc32(name))
+        png += struct.pack(">I", len(body)) + name + body + struct.pack(">I", crc)
+    return base64.b64encode(png).decode("ascii")
+
+
+def _read_chunks(image_data):
+    """Gets the data of each type of chunk of an image"""
+    png = base64.b64decode(image_data)
+    assert png.startswith(PNG_SIGNATURE)
+    chunks = {}
+    offset = len(PNG_SIGNATURE)
+    while offset < len(png):
+        length, name = struct.unpack_from(">I4s", png, offset)
+        chunks[name] = chunks.get(name, b"") + png[offset + 8 : offset + 8 + length]
+        offset += length + 12
+    return chunks
+
+
+def _open_png(image_data):
+    """Decodes an image with Pillow"""
+    Image = pytest.importorskip("PIL.Image")
+    image = Image.open(io.BytesIO(base64.b64decode(image_data)))
+    image.load()
+    return image
+
+
+def _create_rows(width, height, channels=3):
+    random.seed(width * height)
+    return [
+        bytes(random.randrange(256) for _ in range(width * channels))
+        for _ in range(height)
+    ]
+
+
+def _create_figure_rows(width, height):
+    """Rows of an image which looks like a plot, a white area with a few lines"""
+    rows = []
+    for y in range(height):
+        row = bytearray(b"\xff" * (3 * width))
+        for x in range(0, width, 97):
+            row[3 * x : 3 * x + 3] = b"\x00\x72\xbd"
+        if y % 50 == 0:
+            row[:] = b"\xd9\x53\x19" * width
+        rows.append(bytes(row))
+    return rows
+
+
+def test_optimize_png_lossless():
+    """
+    This test checks that the lossless preset recompresses the image data without
+    changing it and drops the metadata of the image.
+    """
+    rows = _create_figure_rows(200, 100)
+    image_data = _encode_png(rows, 200)
+
+    optimized_data, size, optimized_size = optimize_png(image_data, "lossless")
+
+    assert size == len(base64.b64decode(image_data))
+    assert optimized_size == len(base64.b64decode(optimized_data)) < size
+    chunks = _read_chunks(optimized_data)
+    original_chunks = _read_chunks(image_data)
+    assert b"tEXt" not in chunks
+    assert zlib.decompress(chunks[b"IDAT"]) == zlib.decompress(original_chunks[b"IDAT"])
+
+
+def test_optimize_png_scales_down_wide_images():
+    """
+    This test checks that a wide image is scaled down by resampling, and that an
+    alpha channel without transparency is removed.
+    """
+    pytest.importorskip("PIL.Image")
+    rows = [
+        b"".join(row[x : x + 3] + b"\xff" for x in range(0, len(row), 3))
+        for row in _create_figure_rows(3200, 10)
+    ]
+    image_data = _encode_png(rows, 3200, color_type=6, level=0)
+
+    optimized_data, _, _ = optimize_png(image_data, "balanced")
+
+    image = _open_png(optimized_data)
+    assert (image.size, image.mode) == ((1600, 5), "RGB")
+    # The blue lines of the plot are one pixel wide. They are blended with the
+    # background instead of being dropped with every other column.
+    assert len(set(image.getdata())) > 3
+
+
+def test_optimize_png_quantizes_colors():
+    """
+    This test checks that the small preset converts images to a palette image with
+    the colors of the image.
+    """
+    image_data = _encode_png(_create_figure_rows(1200, 300), 1200)
+
+    optimized_data, size, optimized_size = optimize_png(image_data, "small")
+
+    image = _open_png(optimized_data)
+    assert (image.size, image.mode) == ((1000, 250), "P")
+    assert (255, 255, 255) in image.convert("RGB").getdata()
+    assert optimized_size < size
+
+
+def test_optimize_png_quantizes_images_with_many_colors():
+    """
+    This test checks that the small preset converts images with more than 256
+    colors to a palette image.
+    """
+    image_data = _encode_png(_create_rows(600, 200), 600)
+
+    optimized_data, size, optimized_size = optimize_png(image_data, "small")
+
+    image = _open_png(optimized_data)
+    assert (image.size, image.mode) == ((600, 200), "P")
+    assert optimized_size < size
+
+
+@pytest.mark.parametrize("preset", ["balanced", "small"])
+def test_optimize_png_keeps_smallest_image(preset):
+    """
+    This test checks that a preset which changes the pixels of images never
+    returns an image which is larger than the recompressed image.
+    """
+    image_data = _encode_png(_create_figure_rows(1200, 900), 1200)
+
+    _, _, optimized_size = optimize_png(image_data, preset)
+    _, _, recompressed_size = optimize_png(image_data, "lossless")
+
+    assert optimized_size <= recompressed_size
+
+
+def test_optimize_png_without_pillow(monkeypatch):
+    """
+    This test checks that images are only recompressed when Pillow is not installed.
+    """
+    monkeypatch.setitem(sys.modules, "PIL", None)
+    image_data = _encode_png(_create_figure_rows(1200, 300), 1200)
+
+    assert optimize_png(image_data, "small") == optimize_png(image_data, "lossless")
+    assert convert_figure(image_data, {"format": "jpeg"}) == (image_data, "image/png")
+
+
+@pytest.mark.parametrize(
+    "figure_settings, screen_ppi, expected_size",
+    [
+        pytest.param({"dpi": 48}, 96, (600, 150), id="Resolution"),
+        pytest.param({"dpi": 48}, None, (1200, 300), id="Unknown screen resolution"),
+        pytest.param({"maxWidth": 400}, 96, (400, 100), id="Maximum width"),
+        pytest.param({"maxHeight": 600}, 96, (1200, 300), id="Larger maximum height"),
+    ],
+)
+def test_convert_figure_scales_down_figures(figure_settings, screen_ppi, expected_size):
+    """
+    This test checks that figures are scaled down to the resolution and maximum
+    size of the figure settings, and are never enlarged.
+    """
+    image_data = _encode_png(_create_figure_rows(1200, 300), 1200)
+
+    converted_data, mimetype = convert_figure(image_data, figure_settings, screen_ppi)
+
+    assert mimetype == "image/png"
+    assert _open_png(converted_data).size == expected_size
+
+
+def test_convert_figure_to_jpeg():
+    """
+    This test checks that figures are converted to JPEG images.
+    """
+    pytest.importorskip("PIL.Image")
+    rows = [
+        b"".join(row[x : x + 3] + b"\x80" for x in range(0, len(row), 3))
+        for row in _create_figure_rows(200, 100)
+    ]
+    image_data = _encode_png(rows, 200, color_type=6)
+
+    converted_data, mimetype = convert_figure(image_data, {"format": "jpeg"})
+
+    assert mimetype == "image/jpeg"
+    assert base64.b64decode(converted_data).startswith(b"\xff\xd8")
+
+
+def test_optimize_png_keeps_invalid_images():
+    """
+    This test checks that images which cannot be decoded are returned as is.
+    """
+    image_data = base64.b64encode(b"not a PNG image").decode("ascii")
+    assert optimize_png(image_data, "small") == (image_data, 15, 15)
+
+    png = base64.b64decode(_encode_png(_create_figure_rows(200, 100), 200))
+    image_data = base64.b64encode(png[:60]).decode("ascii")
+    assert optimize_png(image_data, "lossless") == (image_data, 60, 60)
+
+
+def test_optimize_png_of_figure():
+    """
+    This test benchmarks the optimization of the image of a figure of 1200 x 900
+    pixels, filtered with the Paeth filter which takes longest to reverse.
+    """
+    image_data = _encode_png(_create_figure_rows(1200, 900), 1200, filter_types=(4,))
+
+    start_time = time.process_time()
+    _, size, optimized_size = optimize_png(image_data, "small")
+    elapsed = time.process_time() - start_time
+
+    assert optimized_size < size
+    assert elapsed < _FIGURE_TIME_BUDGET_SECONDS
+
+
+async def test_image_optimizer_replaces_figure_images():
+    """
+    This test checks that the images of figure outputs are optimized in worker
+    processes and that other outputs are not changed.
+    """
+    image_data = _encode_png(_create_figure_rows(200, 100), 200)
+    figure = {
+        "type": "execute_result",
+        "mimetype": ["text/plain", "image/png"],
+        "value": ["Figure", image_data],
+    }
+    stream = {"type": "stream", "content": {"name": "stdout", "text": "a"}}
+    image_optimizer = ImageOptimizer(max_workers=1)
+
+    try:
+        size, optimized_size = await image_optimizer.optimize_outputs(
+            [stream, figure, None], "lossless"
+        )
+    finally:
+        image_optimizer.shutdown()
+
+    assert optimized_size < size == len(base64.b64decode(image_data))
+    assert figure["value"][0] == "Figure"
+    assert len(base64.b64decode(figure["value"][1])) == optimized_size
+    assert stream == {"type": "stream", "content": {"name": "stdout", "text": "a"}}
+
+
+async def test_image_optimizer_converts_figure_images():
+    """
+    This test checks that the images of figure outputs are converted to the figure
+    settings in worker processes, without an image optimization preset.
+    """
+    pytest.importorskip("PIL.Image")
+    image_data = _encode_png(_create_figure_rows(200, 100), 200)
+    figure = {
+        "type": "execute_result",
+        "mimetype": ["image/png"],
+        "value": [image_data],
+        "screenPixelsPerInch": 96,
+    }
+    image_optimizer = ImageOptimizer(max_workers=1)
+
+    try:
+        await image_optimizer.optimize_outputs(
+            [figure], None, {"format": "jpeg", "dpi": 48}
+        )
+    finally:
+        image_optimizer.shutdown()
+
+    assert figure["mimetype"] == ["image/jpeg"]
+    assert base64.b64decode(figure["value"][0]).startswith(b"\xff\xd8")
@@ -0,0 +1,162 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.outputs.streams
+
+import time
+
+from jupyter_matlab_kernel.outputs import (
+    coalesce_stream_outputs,
+    collapse_repeated_messages,
+)
+
+# Maximum CPU time (in seconds) to coalesce the outputs of 10000 disp calls.
+# Generous so that the test does not fail on slow machines.
+_MANY_STREAMS_TIME_BUDGET_SECONDS = 1
+
+# Maximum CPU time (in seconds) to collapse 10000 warnings issued in a loop
+_MANY_WARNINGS_TIME_BUDGET_SECONDS = 1
+
+
+def _stream(name, text, is_error=False):
+    output = {"type": "stream", "content": {"name": name, "text": text}}
+    if is_error:
+        output["isError"] = True
+    return output
+
+
+def test_coalesce_stream_outputs():
+    """
+    This test checks that adjacent outputs of the same stream are merged, while
+    other outputs and changes of the stream keep the order of the outputs.
+    """
+    figure = {"type": "execute_result", "mimetype": ["image/png"], "value": ["QQ=="]}
+    outputs = [
+        _stream("stdout", "a\n"),
+        _stream("stdout", "b\n"),
+        None,
+        _stream("stdout", "c\n"),
+        _stream("stderr", "Warning: w\n"),
+        _stream("stderr", "Error: e\n", is_error=True),
+        figure,
+        _stream("stdout", "d\n"),
+    ]
+
+    assert coalesce_stream_outputs(outputs) == [
+        _stream("stdout", "a\nb\nc\n"),
+        _stream("stderr", "Warning: w\nError: e\n", is_error=True),
+        figure,
+        _stream("stdout", "d\n"),
+    ]
+
+
+def test_coalesce_stream_outputs_up_to_max_size():
+    """
+    This test checks that merged outputs do not exceed the maximum size and that
+    larger outputs are kept as they are.
+    """
+    outputs = [_stream("stdout", "ab"), _stream("stdout", "cd"), _stream("stdout", "e")]
+    assert coalesce_stream_outputs(outputs, max_size=3) == [
+        _stream("stdout", "ab"),
+        _stream("stdout", "cde"),
+    ]
+
+    large_output = _stream("stdout", "x" * 10)
+    assert coalesce_stream_outputs([large_output], max_size=3) == [large_output]
+
+
+def test_coalesce_many_stream_outputs():
+    """
+    This test benchmarks the outputs of a loop with 10000 disp calls. They are sent
+    to Jupyter as a few messages instead of one message per line.
+    """
+    outputs = [_stream("stdout", f"{i}\n") for i in range(10000)]
+    total_size = sum(len(output["content"]["text"]) for output in outputs)
+
+    start_time = time.process_time()
+    coalesced_outputs = coalesce_stream_outputs(outputs)
+    elapsed = time.process_time() - start_time
+
+    assert len(coalesced_outputs) == 1
+    assert len(coalesced_outputs[0]["content"]["text"]) == total_size
+    assert elapsed < _MANY_STREAMS_TIME_BUDGET_SECONDS
+
+
+def _warning(text):
+    return {**_stream("stderr", text), "isWarning": True}
+
+
+def test_collapse_repeated_messages():
+    """
+    This test checks that identical warnings are displayed once with the number of
+    repeats, while text printed to stderr, errors, stdout outputs and other outputs
+    are kept.
+    """
+    warning = _warning("Warning: Matrix is singular.\n")
+    error = _stream("stderr", "Error: e\n", is_error=True)
+    outputs = [
+        warning,
+        _stream("stdout", "a\n"),
+        _stream("stdout", "a\n"),
+        warning,
+        _stream("stderr", "progress\n"),
+        _stream("stderr", "progress\n"),
+        error,
+        error,
+        _warning("Warning: Ignoring line 3\n"),
+        warning,
+        _warning("Warning: Ignoring line 10"),
+        None,
+    ]
+
+    assert collapse_repeated_messages(outputs) == [
+        _warning("Warning: Matrix is singular.\n(Repeated 2 more times)\n"),
+        _stream("stdout", "a\n"),
+        _stream("stdout", "a\n"),
+        _stream("stderr", "progress\n"),
+        _stream("stderr", "progress\n"),
+        error,
+        error,
+        _warning("Warning: Ignoring line 3\n"),
+        _warning("Warning: Ignoring line 10"),
+        None,
+    ]
+    assert warning["content"]["text"] == "Warning: Matrix is singular.\n"
+
+
+def test_collapse_repeated_messages_ignoring_numbers():
+    """
+    This test checks that warnings which differ only in their numbers are collapsed
+    when numbers are ignored.
+    """
+    outputs = [
+        _warning("Warning: Ignoring line 3\n"),
+        _warning("Warning: Ignoring line 10"),
+        _warning("Warning: Ignoring line 3\n"),
+    ]
+
+    assert collapse_repeated_messages(outputs, ignore_numbers=True) == [
+        _warning(
+            "Warning: Ignoring line 3\n(Repeated 2 more times with different numbers)\n"
+        ),
+    ]
+
+
+def test_collapse_many_repeated_messages():
+    """
+    This test benchmarks the outputs of a loop which issues the same warning in
+    each of 10000 iterations. Only one warning is displayed.
+    """
+    outputs = [
+        _warning(f"Warning: Iteration {i} did not converge.\n") for i in range(10000)
+    ]
+
+    start_time = time.process_time()
+    collapsed_outputs = collapse_repeated_messages(outputs, ignore_numbers=True)
+    elapsed = time.process_time() - start_time
+
+    assert collapsed_outputs == [
+        _warning(
+            "Warning: Iteration 0 did not converge.\n"
+            "(Repeated 9999 more times with different numbers)\n",
+        )
+    ]
+    assert elapsed < _MANY_WARNINGS_TIME_BUDGET_SECONDS
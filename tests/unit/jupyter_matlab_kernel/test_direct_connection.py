@@ -0,0 +1,38 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.direct_connection
+
+import os
+import sys
+
+import pytest
+
+from jupyter_matlab_kernel import direct_connection
+
+
+@pytest.fixture(autouse=True)
+def runtime_dir_fixture(monkeypatch, tmp_path):
+    monkeypatch.setenv("JUPYTER_RUNTIME_DIR", str(tmp_path))
+
+
+def test_write_and_read_connection_file():
+    """
+    This test checks that the connection details written for a Jupyter server
+    are read back by the kernels of that Jupyter server.
+    """
+    url = "http://127.0.0.1:10000/matlab"
+    headers = {"mwi-auth-token": "hash"}
+
+    connection_file = direct_connection.write_connection_file(123, url, headers)
+
+    assert direct_connection.read_connection_file(123) == (url, headers)
+    assert direct_connection.read_connection_file(456) is None
+    if sys.platform != "win32":
+        assert os.stat(connection_file).st_mode & 0o777 == 0o600
+
+
+def test_read_invalid_connection_file():
+    """
+    This test checks that an invalid connection file is ignored.
+    """
+    direct_connection.get_connection_file_path(123).write_text("{")
+    assert direct_connection.read_connection_file(123) is None
@@ -1,12 +1,20 @@
-# Copyright 2023-2025 The MathWorks, Inc.
+# Copyright 2023-2026 The MathWorks, Inc.
 
 # This file contains tests for jupyter_matlab_kernel.kernel
+import asyncio
+import time
+
 import mocks.mock_jupyter_server as MockJupyterServer
 import pytest
 from jupyter_server import serverapp
 from mocks.mock_jupyter_server import MockJupyterServerFixture
 
-from jupyter_matlab_kernel.jsp_kernel import start_matlab_proxy
+from jupyter_matlab_kernel import base_kernel, jsp_kernel
+from jupyter_matlab_kernel.jsp_kernel import (
+    MATLABKernelUsingJSP,
+    start_matlab_proxy,
+    start_matlab_proxy_async,
+)
 from jupyter_matlab_kernel.mpm_kernel import MATLABKernelUsingMPM
 from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
 
@@ -87,6 +95,55 @@ def test_start_matlab_proxy_jh_api_token(monkeypatch, MockJupyterServerFixture):
     assert headers == {"Authorization": f"token {token}"}
 
 
+async def test_start_matlab_proxy_async(mocker, monkeypatch, MockJupyterServerFixture):
+    """
+    This test checks that start_matlab_proxy_async probes all candidate tokens
+    concurrently and uses the most preferred token which is accepted.
+    """
+    monkeypatch.setenv("JUPYTERHUB_API_TOKEN", "jupyterhub_token")
+    in_flight_requests = []
+
+    async def mock_start_matlab_proxy_using_jupyter(session, url, headers, logger):
+        in_flight_requests.append(headers)
+        # Yield to the event loop, all requests are started before any completes.
+        await asyncio.sleep(0)
+        assert len(in_flight_requests) == 3
+        return headers is not None
+
+    mocker.patch.object(
+        jsp_kernel,
+        "_start_matlab_proxy_using_jupyter_async",
+        side_effect=mock_start_matlab_proxy_using_jupyter,
+    )
+
+    url, server, headers = await start_matlab_proxy_async()
+
+    assert url == MockJupyterServer.URL + "matlab"
+    assert server == MockJupyterServer.BASE_URL
+    assert headers == MockJupyterServer.AUTHORIZED_HEADERS
+
+
+async def test_matlab_proxy_discovery_started_on_first_request(mocker):
+    """
+    This test checks that matlab-proxy is started once, in the event loop of the
+    kernel, when the kernel handles its first request.
+    """
+    mocker.patch("ipykernel.kernelbase.Kernel.pre_handler_hook")
+    kernel = mocker.MagicMock(spec=MATLABKernelUsingJSP)
+    kernel._matlab_proxy_discovery = None
+    kernel._discover_matlab_proxy = mocker.AsyncMock()
+    kernel._start_matlab_proxy_discovery.side_effect = (
+        MATLABKernelUsingJSP._start_matlab_proxy_discovery.__get__(kernel)
+    )
+
+    MATLABKernelUsingJSP.pre_handler_hook(kernel)
+    MATLABKernelUsingJSP.pre_handler_hook(kernel)
+    await MATLABKernelUsingJSP.start_matlab_proxy_and_comm_helper(kernel)
+
+    kernel._discover_matlab_proxy.assert_awaited_once()
+    assert kernel.is_matlab_assigned
+
+
 async def test_matlab_not_licensed_non_jupyter(mocker):
     """
     Test case for MATLAB not being licensed in a non-Jupyter environment.
@@ -119,3 +176,288 @@ async def test_matlab_not_licensed_non_jupyter(mocker):
 
     with pytest.raises(MATLABConnectionError):
         await kernel.perform_startup_checks()
+
+
+@pytest.mark.parametrize(
+    "attempt, elapsed_time, expected_startup_time, expected_interval",
+    [
+        pytest.param(0, 0, None, 0.1, id="First poll is fast"),
+        pytest.param(2, 0.5, None, 0.225, id="Interval backs off exponentially"),
+        pytest.param(20, 30, None, 1.0, id="Interval is capped"),
+        pytest.param(20, 29.8, 30, 0.1, id="Fast polling near the expected time"),
+        pytest.param(20, 10, 30, 1.0, id="Slow polling far from the expected time"),
+    ],
+)
+def test_get_startup_poll_interval(
+    attempt, elapsed_time, expected_startup_time, expected_interval
+):
+    interval = base_kernel._get_startup_poll_interval(
+        attempt, elapsed_time, expected_startup_time
+    )
+    assert interval == pytest.approx(expected_interval)
+
+
+async def test_poll_for_matlab_startup_does_not_block_event_loop(
+    mocker, mpm_kernel_instance
+):
+    """
+    This test checks that poll_for_matlab_startup waits using asyncio.sleep and
+    records the time taken by MATLAB to start.
+    """
+    kernel = mpm_kernel_instance
+
+    starting_status = mocker.Mock(
+        is_matlab_licensed=True, matlab_status="starting", matlab_proxy_has_error=False
+    )
+    up_status = mocker.Mock(
+        is_matlab_licensed=True,
+        matlab_status="up",
+        matlab_proxy_has_error=False,
+        licensing_mode="existing_license",
+        matlab_version="R2025b",
+    )
+    kernel.mwi_comm_helper = mocker.Mock()
+    kernel.mwi_comm_helper.fetch_matlab_proxy_status = mocker.AsyncMock(
+        side_effect=[starting_status, up_status]
+    )
+    kernel.mwi_comm_helper.fetch_matlab_root_path = mocker.AsyncMock(
+        return_value="/path/to/matlab"
+    )
+    mocker.patch.object(kernel, "display_output")
+    mock_sleep = mocker.patch("asyncio.sleep", new=mocker.AsyncMock())
+    mock_time_sleep = mocker.patch("time.sleep")
+
+    await kernel.poll_for_matlab_startup(starting_status)
+
+    assert mock_sleep.await_count == 2
+    mock_time_sleep.assert_not_called()
+    assert kernel.matlab_startup_time is not None
+    assert kernel.matlab_version == "R2025b"
+    assert kernel.matlab_root_path == "/path/to/matlab"
+
+
+def test_get_execution_options_with_figure_settings(mpm_kernel_instance):
+    """
+    This test checks that the figure settings of the kernel are sent to MATLAB
+    with execution requests.
+    """
+    kernel = mpm_kernel_instance
+    assert kernel._get_execution_options() is None
+
+    kernel.figure_settings = {"format": "jpeg", "maxWidth": 800}
+    assert kernel._get_execution_options() == {
+        "figureSettings": {"format": "jpeg", "maxWidth": 800}
+    }
+
+
+@pytest.fixture
+def kernel_with_busy_matlab(mocker, monkeypatch, mpm_kernel_instance):
+    """
+    Kernel connected to a MATLAB which takes longer than the completion timeout to
+    answer completion requests, for example because it is executing another cell.
+    """
+    monkeypatch.setenv("MWI_JUPYTER_COMPLETION_TIMEOUT", "0.2")
+
+    async def busy_completion_request(code, cursor_pos):
+        await asyncio.sleep(10)
+
+    kernel = mpm_kernel_instance
+    kernel.mwi_comm_helper = mocker.Mock()
+    kernel.mwi_comm_helper.send_completion_request_to_matlab = mocker.AsyncMock(
+        side_effect=busy_completion_request
+    )
+    return kernel
+
+
+async def test_completion_latency_with_busy_matlab(kernel_with_busy_matlab):
+    """
+    This test benchmarks the latency of completion requests while MATLAB is busy.
+    Requests are answered after the completion timeout, with earlier results for
+    the same word when they are available.
+    """
+    kernel = kernel_with_busy_matlab
+    kernel.completion_cache.put(
+        "pl",
+        2,
+        0,
+        {
+            "matches": ["plot"],
+            "start": 0,
+            "end": 2,
+            "completions": [{"text": "plot", "type": "function", "start": 0, "end": 2}],
+        },
+    )
+    # Code was executed since the results were cached.
+    kernel.workspace_generation = 1
+
+    latencies = []
+    for _ in range(5):
+        start_time = time.perf_counter()
+        result = await kernel.do_complete("plo", 3)
+        latencies.append(time.perf_counter() - start_time)
+        assert result["matches"] == ["plot"]
+
+    assert max(latencies) < 1
+    kernel.mwi_comm_helper.send_completion_request_to_matlab.assert_awaited_with(
+        "plo", 3
+    )
+
+
+async def test_completion_results_capped_until_repeated(
+    kernel_with_busy_matlab, monkeypatch
+):
+    """
+    This test checks that completion results are ranked and capped, and that all
+    the results are returned when the same completion request is repeated.
+    """
+    monkeypatch.setenv("MWI_JUPYTER_MAX_COMPLETIONS", "2")
+    kernel = kernel_with_busy_matlab
+    names = ["Size", "sum", "sin", "s"]
+    kernel.mwi_comm_helper.send_completion_request_to_matlab.side_effect = None
+    kernel.mwi_comm_helper.send_completion_request_to_matlab.return_value = {
+        "matches": names,
+        "start": 0,
+        "end": 1,
+        "completions": [
+            {"text": name, "type": "function", "start": 0, "end": 1} for name in names
+        ],
+    }
+
+    result = await kernel.do_complete("s", 1)
+    assert result["matches"] == ["s", "sin"]
+    assert len(result["metadata"]["_jupyter_types_experimental"]) == 2
+
+    result = await kernel.do_complete("s", 1)
+    assert result["matches"] == ["s", "sin", "sum", "Size"]
+    # The repeated request is answered from the completion cache.
+    kernel.mwi_comm_helper.send_completion_request_to_matlab.assert_awaited_once_with(
+        "s", 1
+    )
+
+
+async def test_function_names_completed_without_matlab(
+    mocker, monkeypatch, tmp_path, mpm_kernel_instance
+):
+    """
+    This test checks that the beginning of a function name is completed from the
+    function index without a request to MATLAB, once the index of the MATLAB
+    assigned to the kernel is loaded, and that other code is completed by MATLAB.
+    """
+    monkeypatch.setenv("MWI_JUPYTER_WORKSPACE_COMPLETION", "true")
+    matlab_root = tmp_path / "MATLAB"
+    (matlab_root / "toolbox" / "matlab").mkdir(parents=True)
+    (matlab_root / "toolbox" / "matlab" / "plot.m").touch()
+
+    kernel = mpm_kernel_instance
+    kernel.workspace_index.update({"full": True, "updated": [], "removed": []})
+    kernel._function_index_update = asyncio.get_running_loop().run_in_executor(
+        None, kernel.function_index.update, str(matlab_root), "R2025b"
+    )
+    await kernel._function_index_update
+    kernel.mwi_comm_helper = mocker.Mock()
+    kernel.mwi_comm_helper.send_completion_request_to_matlab = mocker.AsyncMock(
+        return_value={"matches": [], "start": 3, "end": 5, "completions": []}
+    )
+
+    result = await kernel.do_complete("x = plo", 7)
+    assert result["matches"] == ["plot"]
+    kernel.mwi_comm_helper.send_completion_request_to_matlab.assert_not_awaited()
+
+    await kernel.do_complete("cd fo", 5)
+    kernel.mwi_comm_helper.send_completion_request_to_matlab.assert_awaited_once_with(
+        "cd fo", 5
+    )
+
+
+async def test_do_inspect_caches_help_of_matlab_functions(mocker, mpm_kernel_instance):
+    """
+    This test checks that Shift+Tab shows the help text of the function at the
+    cursor and that the help of MATLAB functions is requested only once.
+    """
+    kernel = mpm_kernel_instance
+    kernel.matlab_version = "R2025b"
+    mocker.patch.object(kernel, "_is_help_cacheable", return_value=True)
+    kernel.mwi_comm_helper = mocker.Mock()
+    kernel.mwi_comm_helper.send_inspect_request_to_matlab = mocker.AsyncMock(
+        return_value=["plot - 2-D line plot"]
+    )
+
+    for _ in range(2):
+        result = await kernel.do_inspect("plot(x, y)", 2)
+        assert result["found"] is True
+        assert result["data"] == {"text/plain": "plot - 2-D line plot"}
+
+    kernel.mwi_comm_helper.send_inspect_request_to_matlab.assert_awaited_once_with(
+        ["plot"]
+    )
+
+
+@pytest.mark.parametrize(
+    "code, expected_reply",
+    [
+        pytest.param("a = 1", {"status": "complete"}, id="Complete code"),
+        pytest.param(
+            "for i = 1:3\nif i > 1",
+            {"status": "incomplete", "indent": "        "},
+            id="Open blocks",
+        ),
+        pytest.param("a = 1\nend", {"status": "invalid"}, id="Unmatched end"),
+    ],
+)
+async def test_do_is_complete(mpm_kernel_instance, code, expected_reply):
+    assert await mpm_kernel_instance.do_is_complete(code) == expected_reply
+
+
+def test_display_execution_outputs_coalesces_streams(mocker, mpm_kernel_instance):
+    """
+    This test checks that the outputs of a loop with many disp calls are sent to
+    Jupyter as a single stream message.
+    """
+    kernel = mpm_kernel_instance
+    mock_send_response = mocker.patch.object(kernel, "send_response")
+    outputs = [
+        {"type": "stream", "content": {"name": "stdout", "text": f"{i}\n"}}
+        for i in range(10000)
+    ]
+
+    kernel._display_execution_outputs(outputs)
+
+    mock_send_response.assert_called_once_with(
+        kernel.iopub_socket,
+        "stream",
+        {"name": "stdout", "text": "".join(f"{i}\n" for i in range(10000))},
+    )
+
+
+def test_output_budget_spills_into_cache_directory(
+    mocker, monkeypatch, tmp_path, mpm_kernel_instance
+):
+    """
+    This test checks that outputs beyond the budget of a cell are spilled into a
+    file per cell in the cache directory, which is kept after shutdown.
+    """
+    monkeypatch.setenv("MWI_JUPYTER_MAX_CELL_OUTPUT_SIZE", "1")
+    mocker.patch.object(base_kernel.time, "strftime", return_value="20260101-120000")
+    kernel = mpm_kernel_instance
+    kernel.execution_count = 3
+    mock_send_response = mocker.patch.object(kernel, "send_response")
+    text = "x" * (1024 * 1024 + 10)
+
+    output_budget = kernel._create_output_budget()
+    kernel._display_execution_outputs(
+        [{"type": "stream", "content": {"name": "stdout", "text": text}}],
+        output_budget,
+    )
+
+    spill_file = (
+        tmp_path / "cache" / "outputs" / kernel.kernel_id / "cell3-20260101-120000.txt"
+    )
+    assert output_budget.spill_file == spill_file
+    assert spill_file.read_text() == "x" * 10
+    mock_send_response.assert_called_once_with(
+        kernel.iopub_socket, "stream", {"name": "stdout", "text": "x" * 1024 * 1024}
+    )
+
+    mocker.patch("ipykernel.kernelbase.Kernel.do_shutdown")
+    base_kernel.BaseMATLABKernel.do_shutdown(kernel, False)
+    assert spill_file.exists()
@@ -1,4 +1,8 @@
-# Copyright 2024-2025 The MathWorks, Inc.
+# Copyright 2024-2026 The MathWorks, Inc.
+
+import os
+import subprocess
+import sys
 
 import pytest
 
@@ -48,3 +52,71 @@ def test_correct_kernel_type_is_returned_when_env_var_unset(monkeypatch):
     monkeypatch.delenv("MWI_USE_FALLBACK_KERNEL", raising=False)
     kernel_class = KernelFactory.get_kernel_class()
     assert kernel_class is MATLABKernelUsingMPM
+
+
+# Modules which are imported on first use rather than when the kernel is launched
+_DEFERRED_MODULES = [
+    "jupyter_matlab_kernel.completions",
+    "jupyter_matlab_kernel.outputs",
+    "jupyter_matlab_kernel.session_pool",
+]
+
+
+def _get_imported_modules(code, env_value):
+    """
+    Runs code in a new Python process with -X importtime.
+
+    Returns:
+        set: Names of the modules imported by the code.
+    """
+    env = dict(os.environ, MWI_USE_FALLBACK_KERNEL=env_value)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported_modules = set()
+    for line in result.stderr.splitlines():
+        # Format: "import time: <self [us]> | <cumulative [us]> | <module>"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        imported_modules.add(line.rsplit("|", 1)[-1].strip())
+    return imported_modules
+
+
+@pytest.mark.parametrize(
+    "env_value, unexpected_modules",
+    [
+        pytest.param(
+            "TRUE",
+            ["jupyter_matlab_kernel.mpm_kernel", "matlab_proxy_manager"],
+            id="Jupyter kernel",
+        ),
+        pytest.param(
+            "FALSE",
+            ["jupyter_matlab_kernel.jsp_kernel"],
+            id="Proxy manager kernel",
+        ),
+    ],
+)
+def test_kernel_startup_imports(env_value, unexpected_modules):
+    """
+    Test that launching a kernel imports only the selected kernel class, and no
+    magics or modules for completions and outputs before they are used.
+    """
+    code = (
+        "from jupyter_matlab_kernel.kernel_factory import KernelFactory\n"
+        "from jupyter_matlab_kernel.magic_execution_engine import MagicExecutionEngine\n"
+        "KernelFactory.get_kernel_class()\n"
+        "MagicExecutionEngine()\n"
+    )
+    imported_modules = _get_imported_modules(code, env_value)
+
+    for module in unexpected_modules + _DEFERRED_MODULES:
+        assert module not in imported_modules
+    assert not any(
+        module.startswith("jupyter_matlab_kernel.magics.")
+        for module in imported_modules
+    )
@@ -0,0 +1,158 @@
+# Copyright 2026 The MathWorks, Inc.
+
+import pytest
+
+from jupyter_matlab_kernel import kernel_settings
+
+
+@pytest.mark.parametrize(
+    "env_value, expected",
+    [
+        pytest.param("true", True, id="Lower case"),
+        pytest.param("TrUe ", True, id="Mixed case with whitespace"),
+        pytest.param("false", False, id="Disabled"),
+        pytest.param("", False, id="Empty string"),
+    ],
+)
+def test_is_output_streaming_enabled(monkeypatch, env_value, expected):
+    monkeypatch.setenv(kernel_settings.get_env_name_stream_outputs(), env_value)
+    assert kernel_settings.is_output_streaming_enabled() is expected
+
+
+def test_is_output_streaming_enabled_when_env_var_unset(monkeypatch):
+    monkeypatch.delenv(kernel_settings.get_env_name_stream_outputs(), raising=False)
+    assert kernel_settings.is_output_streaming_enabled() is False
+
+
+@pytest.mark.parametrize(
+    "env_value, expected",
+    [
+        pytest.param("file", "file", id="File transport"),
+        pytest.param(" FILE", "file", id="Mixed case with whitespace"),
+        pytest.param("inline", "inline", id="Inline transport"),
+        pytest.param("unknown", "inline", id="Unknown value"),
+    ],
+)
+def test_get_figure_transport(monkeypatch, env_value, expected):
+    monkeypatch.setenv(kernel_settings.get_env_name_figure_transport(), env_value)
+    assert kernel_settings.get_figure_transport() == expected
+
+
+@pytest.mark.parametrize(
+    "env_value, expected",
+    [
+        pytest.param("Kernel ", "kernel", id="Mixed case with whitespace"),
+        pytest.param("matlab", "matlab", id="Processing in MATLAB"),
+        pytest.param("unknown", "matlab", id="Unknown value"),
+    ],
+)
+def test_get_output_processing(monkeypatch, env_value, expected):
+    monkeypatch.setenv(kernel_settings.get_env_name_output_processing(), env_value)
+    assert kernel_settings.get_output_processing() == expected
+
+
+def test_get_matlab_proxy_unix_socket(monkeypatch):
+    monkeypatch.setenv(
+        kernel_settings.get_env_name_matlab_proxy_unix_socket(), "/tmp/mwi.sock"
+    )
+    assert kernel_settings.get_matlab_proxy_unix_socket() == "/tmp/mwi.sock"
+
+    monkeypatch.setenv(kernel_settings.get_env_name_matlab_proxy_unix_socket(), "")
+    assert kernel_settings.get_matlab_proxy_unix_socket() is None
+
+
+@pytest.mark.parametrize(
+    "env_value, expected",
+    [
+        pytest.param("0.5", 0.5, id="Custom timeout"),
+        pytest.param("0", 3.0, id="Non-positive timeout"),
+        pytest.param("soon", 3.0, id="Invalid value"),
+    ],
+)
+def test_get_completion_timeout(monkeypatch, env_value, expected):
+    monkeypatch.setenv(kernel_settings.get_env_name_completion_timeout(), env_value)
+    assert kernel_settings.get_completion_timeout() == expected
+
+
+@pytest.mark.parametrize(
+    "env_value, expected",
+    [
+        pytest.param("20", 20, id="Custom limit"),
+        pytest.param("0", None, id="No limit"),
+        pytest.param("many", 100, id="Invalid value"),
+    ],
+)
+def test_get_max_completions(monkeypatch, env_value, expected):
+    monkeypatch.setenv(kernel_settings.get_env_name_max_completions(), env_value)
+    assert kernel_settings.get_max_completions() == expected
+
+
+def test_is_workspace_completion_enabled(monkeypatch):
+    env_name = kernel_settings.get_env_name_workspace_completion()
+    monkeypatch.delenv(env_name, raising=False)
+    assert kernel_settings.is_workspace_completion_enabled() is False
+
+    monkeypatch.setenv(env_name, "true")
+    assert kernel_settings.is_workspace_completion_enabled() is True
+
+
+def test_get_cache_directory(monkeypatch, tmp_path):
+    monkeypatch.setenv(kernel_settings.get_env_name_cache_directory(), str(tmp_path))
+    assert kernel_settings.get_cache_directory() == tmp_path
+
+    monkeypatch.delenv(kernel_settings.get_env_name_cache_directory())
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert kernel_settings.get_cache_directory() == tmp_path / "jupyter_matlab_kernel"
+
+
+@pytest.mark.parametrize(
+    "env_value, expected",
+    [
+        pytest.param("1", 1024 * 1024, id="Custom size"),
+        pytest.param("0.5", 512 * 1024, id="Fractional size"),
+        pytest.param("0", None, id="No limit"),
+        pytest.param("large", None, id="Invalid value"),
+    ],
+)
+def test_get_max_cell_output_size(monkeypatch, env_value, expected):
+    monkeypatch.setenv(kernel_settings.get_env_name_max_cell_output_size(), env_value)
+    assert kernel_settings.get_max_cell_output_size() == expected
+
+
+def test_get_max_cell_output_size_default(monkeypatch):
+    monkeypatch.delenv(
+        kernel_settings.get_env_name_max_cell_output_size(), raising=False
+    )
+    assert kernel_settings.get_max_cell_output_size() is None
+
+
+def test_is_collapse_repeated_messages_enabled(monkeypatch):
+    env_name = kernel_settings.get_env_name_collapse_repeated_messages()
+    monkeypatch.delenv(env_name, raising=False)
+    assert kernel_settings.is_collapse_repeated_messages_enabled() is True
+
+    monkeypatch.setenv(env_name, "false")
+    assert kernel_settings.is_collapse_repeated_messages_enabled() is False
+
+
+def test_is_collapse_messages_ignoring_numbers_enabled(monkeypatch):
+    env_name = kernel_settings.get_env_name_collapse_messages_ignoring_numbers()
+    monkeypatch.delenv(env_name, raising=False)
+    assert kernel_settings.is_collapse_messages_ignoring_numbers_enabled() is False
+
+    monkeypatch.setenv(env_name, "True")
+    assert kernel_settings.is_collapse_messages_ignoring_numbers_enabled() is True
+
+
+@pytest.mark.parametrize(
+    "env_value, expected",
+    [
+        pytest.param("lossless", "lossless", id="Lossless"),
+        pytest.param(" Small", "small", id="Mixed case with whitespace"),
+        pytest.param("off", None, id="Disabled"),
+        pytest.param("fast", None, id="Unknown value"),
+    ],
+)
+def test_get_image_optimization(monkeypatch, env_value, expected):
+    monkeypatch.setenv(kernel_settings.get_env_name_image_optimization(), env_value)
+    assert kernel_settings.get_image_optimization() == expected
@@ -1,4 +1,6 @@
-# Copyright 2024 The MathWorks, Inc.
+# Copyright 2024-2026 The MathWorks, Inc.
+
+import time
 
 import pytest
 
@@ -221,3 +223,25 @@ def test_get_completion_result_for_magics(
 def test_no_output_in_get_completion_result_for_magics(cell_code, cursor_pos):
     output = get_completion_result_for_magics(cell_code, cursor_pos)
     assert output is None
+
+
+# Maximum time (in seconds) to complete magics in a cell with 5000 lines of code.
+# Generous so that the test does not fail on slow machines.
+_LONG_CELL_COMPLETION_TIME_BUDGET_SECONDS = 1
+
+
+def test_get_completion_result_for_magics_in_long_cell():
+    """
+    This test benchmarks completion requests in a cell with 5000 lines of MATLAB
+    code after a magic, with the cursor on the magic and at the end of the cell.
+    """
+    cell_code = "%%ti\n" + "x = rand(10);  % Some MATLAB code\n" * 5000
+
+    start_time = time.perf_counter()
+    for _ in range(50):
+        output = get_completion_result_for_magics(cell_code, 4)
+        assert "time" in output["matches"]
+        assert get_completion_result_for_magics(cell_code, len(cell_code)) is None
+    elapsed = time.perf_counter() - start_time
+
+    assert elapsed < _LONG_CELL_COMPLETION_TIME_BUDGET_SECONDS
@@ -1,6 +1,38 @@
-# Copyright 2024 The MathWorks, Inc.
+# Copyright 2024-2026 The MathWorks, Inc.
 
-from jupyter_matlab_kernel.magic_helper import get_magic_names
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from jupyter_matlab_kernel import magic_helper
+from jupyter_matlab_kernel.magic_execution_engine import get_magic_class
+from jupyter_matlab_kernel.magic_helper import (
+    LineIndex,
+    MagicRegistry,
+    get_magic_names,
+)
+from jupyter_matlab_kernel.magics.time import time
+
+
+@pytest.fixture
+def magic_entry_points(monkeypatch):
+    """Registers magics of another package as entry points"""
+    fake_entry_points = [
+        EntryPoint(
+            "timer",
+            "jupyter_matlab_kernel.magics.time:time",
+            magic_helper.MAGIC_ENTRY_POINT_GROUP,
+        ),
+        EntryPoint(
+            "lsmagic",
+            "other_package.magics:lsmagic",
+            magic_helper.MAGIC_ENTRY_POINT_GROUP,
+        ),
+    ]
+    monkeypatch.setattr(magic_helper, "entry_points", lambda group: fake_entry_points)
+    MagicRegistry.clear()
+    yield
+    MagicRegistry.clear()
 
 
 def test_get_magic_names():
@@ -13,3 +45,41 @@ def test_get_magic_names_only_outputs_py_files():
     output = get_magic_names()
     unexpected_output = {"README.md"}
     assert not unexpected_output.issubset(set(output))
+
+
+def test_magics_registered_as_entry_points(magic_entry_points):
+    """
+    This test checks that magics of other packages are discovered through entry
+    points and that bundled magics take precedence over entry points.
+    """
+    assert "timer" in get_magic_names()
+    assert get_magic_class("timer") is time
+    assert MagicRegistry.get_magic_spec("lsmagic").source == "bundled"
+
+
+def test_magic_registry_is_built_once(monkeypatch):
+    """
+    This test checks that the magics folder is not listed again for every lookup.
+    """
+    MagicRegistry.clear()
+    get_magic_names()
+    monkeypatch.setattr(magic_helper, "_find_bundled_magics", lambda: {})
+
+    assert "lsmagic" in get_magic_names()
+
+
+@pytest.mark.parametrize(
+    "position, expected",
+    [
+        pytest.param(0, (1, 0), id="Start of the cell"),
+        pytest.param(2, (1, 2), id="Before the line break"),
+        pytest.param(3, (2, 0), id="Start of a line"),
+        pytest.param(4, (3, 0), id="Empty line"),
+        pytest.param(7, (3, 3), id="End of the cell"),
+    ],
+)
+def test_line_index(position, expected):
+    line_index = LineIndex("ab\n\ncde")
+
+    assert line_index.find_line(position) == expected
+    assert line_index.get_line(expected[0]) == ["ab", "", "cde"][expected[0] - 1]
@@ -0,0 +1,175 @@
+# Copyright 2026 The MathWorks, Inc.
+
+import time
+
+import pytest
+
+from jupyter_matlab_kernel import matlab_parser
+from jupyter_matlab_kernel.matlab_parser import MATLABBlockParser, split_into_sections
+
+# Upper bound for the time taken to parse a cell with 10000 lines. Generous to avoid
+# failures on slow machines, while catching parsers which are not linear in the
+# length of the code.
+_LONG_CODE_PARSE_TIME_BUDGET_SECONDS = 2
+
+
+@pytest.mark.parametrize(
+    "code, expected_sections",
+    [
+        pytest.param("a = 1", ["a = 1"], id="code without sections is not split"),
+        pytest.param(
+            "a = 1\n%% Section\nb = 2",
+            ["a = 1", "\n%% Section\nb = 2"],
+            id="code is split at section breaks",
+        ),
+        pytest.param(
+            "a = 1\n%%\nb = 2",
+            ["a = 1", "\n%%\nb = 2"],
+            id="section break without a title",
+        ),
+        pytest.param(
+            "%%time\na = 1",
+            ["%%time\na = 1"],
+            id="magic commands are not section breaks",
+        ),
+        pytest.param(
+            "for i = 1:3\n%% Inside loop\ndisp(i)\nend\n%% After loop\nb = 2",
+            [
+                "for i = 1:3\n%% Inside loop\ndisp(i)\nend",
+                "\n\n\n\n%% After loop\nb = 2",
+            ],
+            id="section breaks inside blocks are ignored",
+        ),
+        pytest.param(
+            "if x, a(end) = 1; end\n%% Next\nb = 2",
+            ["if x, a(end) = 1; end", "\n%% Next\nb = 2"],
+            id="end used for indexing does not close a block",
+        ),
+        pytest.param(
+            "%{\n%% Commented\n%}\na = 1\n%% Next\nb = 2",
+            ["%{\n%% Commented\n%}\na = 1", "\n\n\n\n%% Next\nb = 2"],
+            id="section breaks inside block comments are ignored",
+        ),
+        pytest.param(
+            "x = 'for';\n%% Next\ny = \"if\";",
+            ["x = 'for';", '\n%% Next\ny = "if";'],
+            id="keywords inside strings are ignored",
+        ),
+        pytest.param(
+            "a = 1\n%% Section\nfunction f()\nend",
+            ["a = 1\n%% Section\nfunction f()\nend"],
+            id="code with local functions is not split",
+        ),
+    ],
+)
+def test_split_into_sections(code, expected_sections):
+    assert split_into_sections(code) == expected_sections
+
+
+@pytest.mark.parametrize(
+    "code, is_incomplete, unmatched_end",
+    [
+        pytest.param("a = 1", False, None, id="Complete statement"),
+        pytest.param("for i = 1:3\n  if i > 1", True, None, id="Open blocks"),
+        pytest.param("x = 1;\nend", False, 1, id="Unmatched end"),
+        pytest.param("a = [1 2\n3 4", True, None, id="Open bracket"),
+        pytest.param("a = 1 + ...", True, None, id="Continuation"),
+        pytest.param("%{\nfor", True, None, id="Open block comment"),
+        pytest.param("x = {'a' 'if'}; y = s.end", False, None, id="Keywords as values"),
+        pytest.param("a = [1\nend]", False, None, id="end inside brackets"),
+        pytest.param(
+            "if a\n  x = 0;\nelse if c, x = 1; end end",
+            False,
+            None,
+            id="Block after else",
+        ),
+        pytest.param(
+            "for i=1:3 if i>1, disp(i), end; end",
+            False,
+            None,
+            id="Block after for expression",
+        ),
+        pytest.param(
+            "switch a\n  case 1 if a, b=1; end\nend",
+            False,
+            None,
+            id="Block after case expression",
+        ),
+        pytest.param("disp 'done; end'", False, None, id="Command syntax"),
+        pytest.param("hold on, for i = 1:3", True, None, id="Block after command"),
+        pytest.param(
+            "function f(varargin)\n  arguments = varargin;\nend",
+            False,
+            None,
+            id="Variable named arguments",
+        ),
+        pytest.param(
+            "function f(x)\n  arguments (Repeating)\n    x double\n  end\nend",
+            False,
+            None,
+            id="Arguments block",
+        ),
+        pytest.param(
+            "classdef C\n  methods (Access = private)",
+            True,
+            None,
+            id="Methods block with attributes",
+        ),
+    ],
+)
+def test_block_parser(code, is_incomplete, unmatched_end):
+    state = MATLABBlockParser().parse(code)
+
+    assert state.is_incomplete() is is_incomplete
+    assert state.unmatched_end == unmatched_end
+
+
+def test_block_parser_reparses_only_changed_lines(monkeypatch):
+    """
+    This test checks that parsing code which begins with the lines of the
+    previously parsed code only parses the lines which changed.
+    """
+    parser = MATLABBlockParser()
+    parser.parse("for i = 1:3\n  disp(i)\n  x")
+
+    parsed_lines = []
+    parse_line = matlab_parser._parse_line
+
+    def record_parsed_line(line, line_number, state):
+        parsed_lines.append(line_number)
+        return parse_line(line, line_number, state)
+
+    monkeypatch.setattr(matlab_parser, "_parse_line", record_parsed_line)
+    state = parser.parse("for i = 1:3\n  disp(i)\nend")
+
+    assert parsed_lines == [2]
+    assert not state.is_incomplete()
+
+
+def test_block_parser_long_code():
+    """
+    This test benchmarks parsing a cell with 10000 lines of nested blocks, strings,
+    comments and continuations.
+    """
+    chunk = [
+        "%{",
+        "for k = 1:10 % commented out",
+        "%}",
+        "for k = 1:numel(data)",
+        "    if data(k).value > 0, total = total + data(k).value'; end",
+        "    msg = ['for ' \"if\" 'end'] ; % trailing comment with end",
+        "    values = [1, 2, ...",
+        "        3, 4];",
+        "end",
+        "",
+    ]
+    code = "\n".join(chunk * 1000)
+
+    start_time = time.perf_counter()
+    state = MATLABBlockParser().parse(code)
+    parse_time = time.perf_counter() - start_time
+
+    assert code.count("\n") + 1 == 10000
+    assert not state.is_incomplete()
+    assert state.unmatched_end is None
+    assert parse_time < _LONG_CODE_PARSE_TIME_BUDGET_SECONDS
@@ -1,31 +1,12 @@
-# Copyright 2024-2025 The MathWorks, Inc.
+# Copyright 2024-2026 The MathWorks, Inc.
 
-import uuid
+import asyncio
 
 import pytest
 
-from jupyter_matlab_kernel.mpm_kernel import MATLABKernelUsingMPM
 from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
 
 
-@pytest.fixture
-def mpm_kernel_instance(mocker) -> MATLABKernelUsingMPM:
-    # Mock logger
-    mock_logger = mocker.Mock()
-
-    # Use pytest-mock's mocker fixture to patch the function and log attribute
-    mocker.patch(
-        "jupyter_matlab_kernel.base_kernel.BaseMATLABKernel._extract_kernel_id_from_sys_args",
-        return_value=uuid.uuid4().hex,
-    )
-    mocker.patch(
-        "jupyter_matlab_kernel.base_kernel.BaseMATLABKernel.log",
-        new=mock_logger,
-    )
-
-    return MATLABKernelUsingMPM()
-
-
 async def test_initialize_matlab_proxy_with_mpm_success(mocker, mpm_kernel_instance):
     mpm_lib_start_matlab_proxy_response = {
         "absolute_url": "dummyURL",
@@ -189,3 +170,59 @@ async def test_matlab_proxy_assignment_on_executing_matlab_command(
     await mpm_kernel_instance.do_execute(code, silent=True)
     mock_start_matlab_proxy.assert_called_once()
     assert mpm_kernel_instance.is_matlab_assigned is True
+
+
+async def test_start_matlab_proxy_claims_pooled_session(mocker, mpm_kernel_instance):
+    """
+    Test that a kernel requiring a dedicated MATLAB uses a session claimed from the
+    pool instead of starting a new matlab-proxy, and shuts it down using the caller id
+    of the pooled session.
+    """
+    pooled_session = {
+        "caller_id": "pool-1",
+        "absolute_url": "http://localhost/matlab/pool-1",
+        "mwi_base_url": "/matlab/pool-1",
+        "headers": {"MWI_AUTH_TOKEN": "pool_token"},
+        "mpm_auth_token": "mpm_token",
+    }
+    mpm_kernel_instance.is_shared_matlab = False
+    mpm_kernel_instance.session_pool = mocker.Mock(refill_policy="lazy")
+    mpm_kernel_instance.session_pool.claim.return_value = pooled_session
+    mock_start = mocker.patch.object(
+        mpm_kernel_instance, "_initialize_matlab_proxy_with_mpm"
+    )
+    mock_initialize_comm_helper = mocker.patch.object(
+        mpm_kernel_instance, "_initialize_mwi_comm_helper"
+    )
+    mock_shutdown = mocker.patch("matlab_proxy_manager.lib.api.shutdown")
+
+    await mpm_kernel_instance.start_matlab_proxy_and_comm_helper()
+
+    mock_start.assert_not_called()
+    mock_initialize_comm_helper.assert_awaited_once_with(
+        pooled_session["absolute_url"], pooled_session["headers"]
+    )
+    assert mpm_kernel_instance.matlab_proxy_base_url == "/matlab/pool-1"
+
+    await mpm_kernel_instance.cleanup_matlab_proxy()
+    mock_shutdown.assert_awaited_once_with(
+        mpm_kernel_instance.parent_pid, "pool-1", "mpm_token"
+    )
+    assert mpm_kernel_instance.mpm_caller_id == mpm_kernel_instance.kernel_id
+
+
+async def test_session_pool_refilled_on_first_request(mocker, mpm_kernel_instance):
+    """
+    Test that the session pool is refilled once, in the event loop of the kernel,
+    when the kernel handles its first request.
+    """
+    mpm_kernel_instance.session_pool = mocker.Mock()
+    mpm_kernel_instance.session_pool.refill = mocker.AsyncMock()
+    mpm_kernel_instance._is_session_pool_refill_pending = True
+
+    mpm_kernel_instance.pre_handler_hook()
+    mpm_kernel_instance.pre_handler_hook()
+    await asyncio.gather(*mpm_kernel_instance._session_pool_tasks)
+
+    mpm_kernel_instance.session_pool.refill.assert_awaited_once()
+    assert not mpm_kernel_instance._session_pool_tasks
@@ -1,7 +1,8 @@
-# Copyright 2023-2025 The MathWorks, Inc.
+# Copyright 2023-2026 The MathWorks, Inc.
 # This file contains tests for jupyter_matlab_kernel.mwi_comm_helpers
 
 import asyncio
+import base64
 import http
 import json
 import tempfile
@@ -18,6 +19,7 @@ from mocks.mock_http_responses import (
     MockEvalResponseMissingData,
 )
 
+from jupyter_matlab_kernel import kernel_settings
 from jupyter_matlab_kernel.mwi_comm_helpers import MWICommHelper
 from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
 
@@ -250,6 +252,347 @@ async def test_execution_success(monkeypatch, comm_helper_fixture):
     assert "Mock results from feval" in outputs
 
 
+def _create_feval_response(is_error=False, fault_message=""):
+    """Creates the JSON payload of an FEval response from matlab-proxy."""
+    return {
+        "messages": {
+            "FEvalResponse": [
+                {
+                    "isError": is_error,
+                    "results": ["Mock results from feval"],
+                    "messageFaults": [{"message": fault_message}],
+                },
+            ],
+        }
+    }
+
+
+async def test_kernel_path_is_registered_only_once(mocker, comm_helper_fixture):
+    """
+    This test checks that the addpath FEval is only sent with the first request
+    to MATLAB after a successful response.
+    """
+    mock_response = mocker.AsyncMock()
+    mock_response.status = http.HTTPStatus.OK
+    mock_response.json = mocker.AsyncMock(return_value=_create_feval_response())
+    mock_post = mocker.patch(
+        "aiohttp.ClientSession.post", new=mocker.AsyncMock(return_value=mock_response)
+    )
+
+    await comm_helper_fixture.send_execution_request_to_matlab("a = 1")
+    await comm_helper_fixture.send_execution_request_to_matlab("b = 2")
+
+    first_request = mock_post.call_args_list[0].kwargs["json"]["messages"]["FEval"]
+    second_request = mock_post.call_args_list[1].kwargs["json"]["messages"]["FEval"]
+    assert [msg["function"] for msg in first_request] == [
+        "addpath",
+        "processJupyterKernelRequest",
+    ]
+    assert [msg["function"] for msg in second_request] == [
+        "processJupyterKernelRequest"
+    ]
+
+
+async def test_kernel_path_is_registered_again_after_failure(
+    mocker, comm_helper_fixture
+):
+    """
+    This test checks that a request which fails without registering the kernel path,
+    for example after MATLAB was restarted, is retried with the addpath FEval.
+    """
+    mock_response = mocker.AsyncMock()
+    mock_response.status = http.HTTPStatus.OK
+    mock_response.json = mocker.AsyncMock(
+        side_effect=[
+            _create_feval_response(),
+            _create_feval_response(
+                is_error=True,
+                fault_message="Undefined function 'processJupyterKernelRequest'",
+            ),
+            _create_feval_response(),
+        ]
+    )
+    mock_post = mocker.patch(
+        "aiohttp.ClientSession.post", new=mocker.AsyncMock(return_value=mock_response)
+    )
+
+    await comm_helper_fixture.send_execution_request_to_matlab("a = 1")
+    outputs = await comm_helper_fixture.send_execution_request_to_matlab("b = 2")
+
+    assert "Mock results from feval" in outputs
+    assert mock_post.call_count == 3
+    retried_request = mock_post.call_args_list[2].kwargs["json"]["messages"]["FEval"]
+    assert retried_request[0]["function"] == "addpath"
+
+
+async def test_execution_fault_is_not_retried(mocker, comm_helper_fixture):
+    """
+    This test checks that an execution request which faults for a reason other than
+    a missing kernel path is not sent to MATLAB again.
+    """
+    mock_response = mocker.AsyncMock()
+    mock_response.status = http.HTTPStatus.OK
+    mock_response.json = mocker.AsyncMock(
+        side_effect=[
+            _create_feval_response(),
+            _create_feval_response(is_error=True, fault_message="Out of memory."),
+        ]
+    )
+    mock_post = mocker.patch(
+        "aiohttp.ClientSession.post", new=mocker.AsyncMock(return_value=mock_response)
+    )
+
+    await comm_helper_fixture.send_execution_request_to_matlab("a = 1")
+    with pytest.raises(Exception, match="Failed to execute"):
+        await comm_helper_fixture.send_execution_request_to_matlab("b = 2")
+
+    assert mock_post.call_count == 2
+
+
+async def test_execution_request_with_file_figure_transport(
+    mocker, monkeypatch, comm_helper_fixture
+):
+    """
+    This test checks that the figure directory is passed to MATLAB when the file
+    figure transport is enabled and that figure files are replaced by their image data.
+    """
+    monkeypatch.setenv(kernel_settings.get_env_name_figure_transport(), "file")
+    figure_directory = comm_helper_fixture._get_figure_directory()
+    figure_file = os.path.join(figure_directory, "figure.png")
+    with open(figure_file, "wb") as f:
+        f.write(b"\x89PNG")
+
+    figure_output = {
+        "type": "execute_result",
+        "mimetype": ["image/png"],
+        "value": [""],
+        "file": figure_file,
+    }
+    mock_response = mocker.AsyncMock()
+    mock_response.status = http.HTTPStatus.OK
+    mock_response.json = mocker.AsyncMock(
+        return_value={
+            "messages": {
+                "FEvalResponse": [
+                    {"isError": False, "results": [[figure_output]]},
+                ],
+            }
+        }
+    )
+    mock_post = mocker.patch(
+        "aiohttp.ClientSession.post", new=mocker.AsyncMock(return_value=mock_response)
+    )
+
+    outputs = await comm_helper_fixture.send_execution_request_to_matlab("plot(1)")
+
+    request = mock_post.call_args.kwargs["json"]["messages"]["FEval"][-1]
+    assert json.loads(request["arguments"][-1]) == {
+        "figureDirectory": figure_directory,
+    }
+    assert outputs == [
+        {
+            "type": "execute_result",
+            "mimetype": ["image/png"],
+            "value": [base64.b64encode(b"\x89PNG").decode("ascii")],
+        }
+    ]
+    assert not os.path.exists(figure_file)
+
+
+@pytest.mark.parametrize(
+    "url, unix_socket, expected",
+    [
+        ("http://localhost:8888/matlab", None, True),
+        ("http://127.0.0.1:31515", None, True),
+        ("http://[::1]:31515", None, True),
+        ("https://matlab.example.com/matlab", None, False),
+        ("https://matlab.example.com/matlab", "/tmp/matlab-proxy.sock", True),
+    ],
+)
+async def test_figure_directory_is_shared_only_with_local_matlab_proxy(
+    monkeypatch, comm_helper_fixture, url, unix_socket, expected
+):
+    """
+    This test checks that figure files are only used when matlab-proxy runs on
+    the host of the kernel, and that figures are embedded in the response otherwise.
+    """
+    monkeypatch.setenv(kernel_settings.get_env_name_figure_transport(), "file")
+    monkeypatch.setenv(kernel_settings.get_env_name_output_processing(), "matlab")
+    if unix_socket:
+        monkeypatch.setenv(
+            kernel_settings.get_env_name_matlab_proxy_unix_socket(), unix_socket
+        )
+    else:
+        monkeypatch.delenv(
+            kernel_settings.get_env_name_matlab_proxy_unix_socket(), raising=False
+        )
+    comm_helper_fixture.url = url
+
+    options = comm_helper_fixture._get_execution_options(None)
+
+    assert ("figureDirectory" in options) == expected
+
+
+@pytest.mark.parametrize(
+    "env_value, expected_options",
+    [
+        pytest.param(None, {"figureSettings": {}}, id="Disabled by default"),
+        pytest.param(
+            "true",
+            {"figureSettings": {}, "workspaceSymbols": True},
+            id="Enabled",
+        ),
+    ],
+)
+async def test_execution_options_with_workspace_completion(
+    monkeypatch, comm_helper_fixture, env_value, expected_options
+):
+    """
+    This test checks that MATLAB is asked for the changes to its workspace only
+    when workspace completion is enabled.
+    """
+    env_name = kernel_settings.get_env_name_workspace_completion()
+    if env_value is None:
+        monkeypatch.delenv(env_name, raising=False)
+    else:
+        monkeypatch.setenv(env_name, env_value)
+    monkeypatch.setenv(kernel_settings.get_env_name_output_processing(), "matlab")
+    monkeypatch.setenv(kernel_settings.get_env_name_figure_transport(), "inline")
+
+    options = comm_helper_fixture._get_execution_options({"figureSettings": {}})
+
+    assert options == expected_options
+
+
+async def test_execution_request_with_kernel_output_processing(
+    mocker, monkeypatch, comm_helper_fixture
+):
+    """
+    This test checks that MATLAB is asked for the raw outputs of the Live Editor
+    API when the kernel processes the outputs and that they are converted.
+    """
+    monkeypatch.setenv(kernel_settings.get_env_name_output_processing(), "kernel")
+    monkeypatch.setenv(kernel_settings.get_env_name_figure_transport(), "file")
+    raw_output = {
+        "type": "raw_outputs",
+        "content": json.dumps(
+            {"outputs": [{"type": "text", "outputData": {"text": "Hello"}}]}
+        ),
+    }
+    mock_response = mocker.AsyncMock()
+    mock_response.status = http.HTTPStatus.OK
+    mock_response.json = mocker.AsyncMock(
+        return_value={
+            "messages": {
+                "FEvalResponse": [{"isError": False, "results": [[raw_output]]}],
+            }
+        }
+    )
+    mock_post = mocker.patch(
+        "aiohttp.ClientSession.post", new=mocker.AsyncMock(return_value=mock_response)
+    )
+
+    outputs = await comm_helper_fixture.send_execution_request_to_matlab("disp(1)")
+
+    request = mock_post.call_args.kwargs["json"]["messages"]["FEval"][-1]
+    assert json.loads(request["arguments"][-1]) == {
+        "rawOutputs": True,
+    }
+    assert outputs == [
+        {"type": "stream", "content": {"name": "stdout", "text": "Hello"}}
+    ]
+
+
+async def test_completion_request_processes_raw_completion_data(
+    mocker, comm_helper_fixture
+):
+    """
+    This test checks that MATLAB is asked for its raw completion data and that the
+    data is converted into completion results in the kernel.
+    """
+    completion_data = {
+        "widgetData": {"choices": [{"completion": "plot", "matchType": "mFile"}]},
+        "value": "plo",
+    }
+    mock_response = mocker.AsyncMock()
+    mock_response.status = http.HTTPStatus.OK
+    mock_response.json = mocker.AsyncMock(
+        return_value={
+            "messages": {
+                "FEvalResponse": [
+                    {"isError": False, "results": [json.dumps(completion_data)]}
+                ],
+            }
+        }
+    )
+    mock_post = mocker.patch(
+        "aiohttp.ClientSession.post", new=mocker.AsyncMock(return_value=mock_response)
+    )
+
+    results = await comm_helper_fixture.send_completion_request_to_matlab("plo", 3)
+
+    assert results["matches"] == ["plot"]
+    assert results["start"] == 0
+    assert results["completions"][0]["type"] == "function"
+    request = mock_post.call_args.kwargs["json"]["messages"]["FEval"][-1]
+    assert request["arguments"][0] == "complete"
+    assert json.loads(request["arguments"][4]) == {"rawCompletionData": True}
+
+
+async def test_inspect_request(mocker, comm_helper_fixture):
+    """
+    This test checks that the names are sent to MATLAB in a single inspect request
+    and that a help text which MATLAB encoded as a string is returned as a list.
+    """
+    mock_response = mocker.AsyncMock()
+    mock_response.status = http.HTTPStatus.OK
+    mock_response.json = mocker.AsyncMock(
+        return_value={
+            "messages": {
+                "FEvalResponse": [{"isError": False, "results": ["plot help"]}],
+            }
+        }
+    )
+    mock_post = mocker.patch(
+        "aiohttp.ClientSession.post", new=mocker.AsyncMock(return_value=mock_response)
+    )
+
+    help_texts = await comm_helper_fixture.send_inspect_request_to_matlab(["plot"])
+
+    assert help_texts == ["plot help"]
+    request = mock_post.call_args.kwargs["json"]["messages"]["FEval"][-1]
+    assert request["arguments"][0] == "inspect"
+    assert json.loads(request["arguments"][2]) == ["plot"]
+
+
+async def test_stream_execution_request_stops_after_error(mocker, comm_helper_fixture):
+    """
+    This test checks that stream_execution_request_to_matlab yields the outputs of
+    each section and skips the remaining sections once a section produces an error.
+    """
+    error_output = {
+        "type": "stream",
+        "content": {"name": "stderr", "text": "Mock error"},
+        "isError": True,
+    }
+    mock_send = mocker.patch.object(
+        comm_helper_fixture,
+        "send_execution_request_to_matlab",
+        side_effect=[[{"type": "stream"}], [error_output], [{"type": "stream"}]],
+    )
+
+    code = "a = 1\n%% Second\nerror('x')\n%% Third\nb = 2"
+    outputs = [
+        section_outputs
+        async for section_outputs in comm_helper_fixture.stream_execution_request_to_matlab(
+            code
+        )
+    ]
+
+    assert outputs == [[{"type": "stream"}], [error_output]]
+    assert mock_send.call_count == 2
+
+
 # Testing send_eval_request_to_matlab
 async def test_send_eval_request_to_matlab_success(monkeypatch, comm_helper_fixture):
     """Test that send_eval_request_to_matlab returns eval response correctly."""
@@ -0,0 +1,90 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.mwi_logger
+
+import logging
+
+import pytest
+
+from jupyter_matlab_kernel import mwi_logger
+from jupyter_matlab_kernel.mwi_logger import Truncated
+
+
+class _RecordingValue:
+    """Value which records whether it was formatted"""
+
+    def __init__(self):
+        self.formatted = False
+
+    def __str__(self):
+        self.formatted = True
+        return "value"
+
+
+@pytest.fixture
+def logger():
+    logger = logging.getLogger("MATLABKernelTest")
+    previous_level = logger.level
+    yield logger
+    logger.setLevel(previous_level)
+
+
+def test_truncated_shortens_long_fields():
+    """
+    This test checks that long strings nested inside a value are shortened
+    while the structure of the value is preserved.
+    """
+    value = {"value": ["a" * 20], "mimetype": ["image/png"], "count": 1}
+
+    text = str(Truncated(value, max_field_length=5))
+
+    assert text == str(
+        {
+            "value": ["aaaaa...<15 more characters>"],
+            "mimetype": ["image...<4 more characters>"],
+            "count": 1,
+        }
+    )
+
+
+def test_truncated_caps_total_length():
+    """
+    This test checks that the formatted value is shortened to the maximum length.
+    """
+    text = str(Truncated(list(range(100)), max_length=10))
+    assert text.startswith("[0, 1, 2, ")
+    assert text.endswith("more characters>")
+
+
+def test_truncated_is_not_formatted_when_level_is_disabled(logger):
+    """
+    This test checks that values are not formatted when the debug level is disabled.
+    """
+    logger.setLevel(logging.INFO)
+    value = _RecordingValue()
+
+    logger.debug("Response:\n%s", Truncated(value))
+    mwi_logger.debug_sampled(logger, "Output:\n%s", Truncated(value))
+
+    assert value.formatted is False
+
+
+@pytest.mark.parametrize(
+    "sample_rate, expected_records",
+    [
+        pytest.param("1", 3, id="Log all messages"),
+        pytest.param("0", 0, id="Log no messages"),
+        pytest.param("invalid", 3, id="Invalid sample rate"),
+    ],
+)
+def test_debug_sampled(monkeypatch, caplog, logger, sample_rate, expected_records):
+    """
+    This test checks that debug_sampled logs the fraction of messages given by
+    the sample rate.
+    """
+    monkeypatch.setenv("MWI_JUPYTER_LOG_SAMPLE_RATE", sample_rate)
+
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        for idx in range(3):
+            mwi_logger.debug_sampled(logger, "Output %d", idx)
+
+    assert len(caplog.records) == expected_records
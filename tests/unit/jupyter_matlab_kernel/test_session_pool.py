@@ -0,0 +1,62 @@
+# Copyright 2026 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.session_pool
+
+import json
+import os
+
+import pytest
+
+from jupyter_matlab_kernel.session_pool import MATLABSessionPool
+
+
+@pytest.fixture
+def session_pool(monkeypatch, tmp_path):
+    monkeypatch.setenv("JUPYTER_RUNTIME_DIR", str(tmp_path))
+    pool = MATLABSessionPool(
+        parent_pid=123, base_url_prefix="/", size=2, refill_policy="eager"
+    )
+    pool.directory.mkdir(parents=True)
+    return pool
+
+
+def test_claim_pooled_session(session_pool):
+    """
+    This test checks that a ready session is claimed only once, that its slot is
+    freed and that hits and misses are counted.
+    """
+    session = {"caller_id": "pool-1", "pid": os.getpid(), "mpm_auth_token": "token"}
+    assert session_pool._reserve(1)
+    session_pool._write_ready_file(1, session)
+
+    assert session_pool.get_stats() == {"size": 2, "ready": 1, "hits": 0, "misses": 0}
+    assert session_pool.claim("kernel-1") == session
+    assert session_pool.claim("kernel-2") is None
+    assert session_pool.get_stats() == {"size": 2, "ready": 0, "hits": 1, "misses": 1}
+    assert session_pool._reserve(1)
+
+
+def test_claim_discards_stopped_session(session_pool):
+    """
+    This test checks that a session whose matlab-proxy is no longer running is
+    discarded, so that the kernel starts a new session instead.
+    """
+    assert session_pool._reserve(0)
+    session_pool._write_ready_file(0, {"caller_id": "pool-1", "pid": 999999999})
+
+    assert session_pool.claim("kernel-1") is None
+    assert session_pool.get_stats() == {"size": 2, "ready": 0, "hits": 0, "misses": 1}
+    assert session_pool._reserve(0)
+
+
+def test_reserve_removes_stale_lock(session_pool):
+    """
+    This test checks that a slot reserved by a process which no longer exists can
+    be reserved again, unless it holds a ready session.
+    """
+    session_pool._get_lock_file(0).write_text("999999999")
+    session_pool._get_lock_file(1).write_text("999999999")
+    session_pool._get_ready_file(1).write_text(json.dumps({"caller_id": "pool-1"}))
+
+    assert session_pool._reserve(0)
+    assert not session_pool._reserve(0)
+    assert not session_pool._reserve(1)
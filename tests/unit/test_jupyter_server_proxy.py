@@ -1,4 +1,4 @@
-# Copyright 2020-2025 The MathWorks, Inc.
+# Copyright 2020-2026 The MathWorks, Inc.
 
 import inspect
 import os
@@ -67,6 +67,28 @@ def test_get_env_with_token_auth_disabled(set_mwi_use_fallback_kernel, monkeypat
     assert r.get(mwi_env.get_env_name_mwi_auth_token()) is None
 
 
+def test_get_env_writes_connection_file(
+    set_mwi_use_fallback_kernel, monkeypatch, tmp_path
+):
+    """Tests if _get_env() method shares the address of matlab-proxy with the kernels
+    when direct connection is enabled."""
+    from jupyter_matlab_kernel import direct_connection
+
+    monkeypatch.setenv("JUPYTER_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setattr("jupyter_matlab_proxy._USE_DIRECT_CONNECTION", True)
+    monkeypatch.setattr("jupyter_matlab_proxy._JUPYTER_SERVER_PID", "123")
+
+    jupyter_matlab_proxy._get_env(10000, "/foo/")
+
+    url, headers = direct_connection.read_connection_file("123")
+    assert url == "http://127.0.0.1:10000/foo/matlab"
+    assert headers == {
+        MWI_AUTH_TOKEN_NAME_FOR_HTTP: jupyter_matlab_proxy._mwi_auth_token.get(
+            "token_hash"
+        )
+    }
+
+
 def test_get_env_with_proxy_manager(monkeypatch):
     """Tests if _get_env() method returns the expected environment settings as a dict."""
     # Setup